@@ -0,0 +1,100 @@
+"""Throughput of batch scoring compared to evaluating placements one by one.
+
+Requires NumPy. Run from the `src` directory:
+
+    python -m core.benchmarks.batch_scoring
+"""
+
+import random
+import time
+
+import numpy as np
+
+from core.game.batch_scoring import score_placements
+from core.game.evaluation import evaluate_placement
+from core.game.objects.board import Board
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig
+
+CANDIDATES = 10_000
+LETTER_POINTS = [0, 1, 1, 2, 3, 5, 9]
+
+
+def _get_board(config: GameConfig) -> Board:
+    rng = random.Random(0)
+    board = Board(config.layout)
+
+    # a mid-game board, a few crossing words around the center
+    for row in range(3, 12, 2):
+        for column in range(rng.randrange(0, 5), rng.randrange(9, 15)):
+            board.place_tiles(
+                [(Tile(1, rng.choice(LETTER_POINTS[1:]), 0), (row, column))]
+            )
+
+    board.clear_recently_placed()
+
+    return board
+
+
+def _get_candidates(board: Board, size: int) -> list[list[int]]:
+    rng = random.Random(1)
+    tiles = board.get_tiles()
+    lines = board.geometry.row_lines + board.geometry.column_lines
+    candidates = []
+
+    while len(candidates) < CANDIDATES:
+        line = rng.choice(lines)
+        start = rng.randrange(len(line))
+        candidate = [i for i in line[start:] if tiles[i] is None][
+            : rng.randint(1, size)
+        ]
+        if candidate:
+            candidates.append(candidate)
+
+    return candidates
+
+
+def bench_batch_scoring() -> None:
+    config = GameConfig.default()
+    board = _get_board(config)
+    candidates = _get_candidates(board, config.tiles_per_round)
+
+    positions = np.full((CANDIDATES, config.tiles_per_round), -1)
+    for row, candidate in enumerate(candidates):
+        positions[row, : len(candidate)] = candidate
+    letters = np.where(positions >= 0, 1, 0)
+    blanks = np.zeros(positions.shape, dtype=bool)
+
+    # evaluating also validates the placements, which batches leave to the caller
+    start = time.perf_counter()
+    for candidate in candidates:
+        evaluate_placement(
+            board,
+            [
+                (Tile(1, LETTER_POINTS[1], i), board.geometry.positions[index])
+                for i, index in enumerate(candidate)
+            ],
+            tiles_per_round=config.tiles_per_round,
+            min_word_length=config.min_word_length,
+        )
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score_placements(
+        board,
+        positions,
+        letters,
+        blanks,
+        letter_points=LETTER_POINTS,
+        min_word_length=config.min_word_length,
+        bingo_size=config.tiles_per_round,
+    )
+    batch = time.perf_counter() - start
+
+    print(f'one by one:  {CANDIDATES / one_by_one:12,.0f} placements/s')
+    print(f'batch:       {CANDIDATES / batch:12,.0f} placements/s')
+    print(f'speedup:     {one_by_one / batch:12.1f} x')
+
+
+if __name__ == '__main__':
+    bench_batch_scoring()
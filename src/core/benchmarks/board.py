@@ -0,0 +1,90 @@
+"""Board memory and per-move benchmark.
+
+Run from the `src` directory:
+
+    python -m core.benchmarks.board
+"""
+
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from core.game.objects.board import Board
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig
+from core.game.types import Position
+
+ROOMS = 1_000
+MOVES = 10_000
+
+
+def _measure_memory[T](factory: Callable[[], T], count: int) -> tuple[float, list[T]]:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (after - before) / count, objects
+
+
+def _get_move(move_number: int) -> list[tuple[Tile, Position]]:
+    row = move_number % 15
+    return [(Tile(1, 1, column), Position(row, column)) for column in range(4, 11)]
+
+
+def bench_room_memory() -> None:
+    layout = GameConfig.default().board_layout
+
+    per_board, _ = _measure_memory(lambda: Board(layout), ROOMS)
+
+    print(f'memory per board:      {per_board / 1024:8.2f} KiB')
+    print(f'memory per 1000 rooms: {per_board * 1000 / 1024 / 1024:8.2f} MiB')
+
+
+def bench_move() -> None:
+    layout = GameConfig.default().board_layout
+    moves = [_get_move(i) for i in range(15)]
+
+    boards = [Board(layout) for _ in range(MOVES // 15 + 1)]
+
+    start = time.perf_counter()
+    for i in range(MOVES):
+        boards[i // 15].place_tiles(moves[i % 15])
+    elapsed = time.perf_counter() - start
+    print(f'place_tiles per move:  {elapsed / MOVES * 1e6:8.2f} us')
+
+    boards = [Board(layout) for _ in range(MOVES // 15 + 1)]
+    start = time.perf_counter()
+    for i in range(MOVES):
+        board = boards[i // 15]
+        board.place_tiles(moves[i % 15])
+        board.clear_recently_placed()
+    elapsed = time.perf_counter() - start
+    print(f'place + turn reset:    {elapsed / MOVES * 1e6:8.2f} us')
+
+    board = Board(layout)
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    board.place_tiles(moves[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'allocated per move:    {peak - before:8d} B')
+
+    board = Board(layout)
+    fields = board.rows * board.columns
+    start = time.perf_counter()
+    for _ in range(MOVES // 100):
+        for row in range(board.rows):
+            for column in range(board.columns):
+                board.get_field(row, column)
+    elapsed = time.perf_counter() - start
+    print(f'get_field:             {elapsed / (MOVES // 100 * fields) * 1e9:8.2f} ns')
+
+
+if __name__ == '__main__':
+    bench_room_memory()
+    bench_move()
@@ -0,0 +1,83 @@
+"""Time per move and points of computer players of every strength.
+
+Two computer players of the same strength play each other, the time every move
+takes is measured against the player's budget, and the average points per move show
+what the stronger searches buy. Without a game end, games are cut after a fixed
+number of turns. Uses the word list given as the first argument, one word per line,
+or generated words like the move generator benchmark. Run from the `src` directory:
+
+    python -m core.benchmarks.computer_player [words.txt]
+"""
+
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from core.benchmarks.move_generator import get_words
+from core.game.alphabet import Alphabet
+from core.game.computer_player import ComputerPlayer
+from core.game.enums import ComputerStrength, Language, PlayerMoveType
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.lexicon.builder import build_dawg
+from core.lexicon.graph import Dawg
+
+GAMES = 5
+TURNS = 24
+
+
+def _play_games(dawg: Dawg, strength: ComputerStrength) -> None:
+    times = []
+    points = []
+    places = 0
+
+    for seed in range(GAMES):
+        config = GameConfig.default()
+        config.seed = seed
+        players = [
+            ComputerPlayer('a', 'a', strength=strength, seed=seed),
+            ComputerPlayer('b', 'b', strength=strength, seed=seed + 1),
+        ]
+        game = ScrabbleGame(config, players=players, lexicon=dawg)
+        game.start()
+
+        for _ in range(TURNS):
+            player = game.current_player
+            assert isinstance(player, ComputerPlayer)
+
+            start = time.perf_counter()
+            turn = player.play_turn(game)
+            times.append(time.perf_counter() - start)
+
+            points.append(player.scores[-1])
+            places += turn.type == PlayerMoveType.PLACE_WORD
+
+    budget = players[0].time_budget
+    times.sort()
+    print(
+        f'{strength.name.lower():8s}'
+        f'{statistics.mean(times) * 1e3:10.2f} ms mean'
+        f'{times[int(len(times) * 0.95)] * 1e3:10.2f} ms p95'
+        f'{times[-1] * 1e3:10.2f} ms max ({budget * 1e3:.0f} ms budget)'
+        f'{statistics.mean(points):8.1f} points'
+        f'{places / len(times):8.0%} placed'
+    )
+
+
+def bench_computer_player() -> None:
+    words = get_words()
+    alphabet = Alphabet.for_language(Language.POLISH)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'words.dawg'
+        build_dawg(words, path, alphabet=alphabet.letters)
+
+        with Dawg.load(path) as dawg:
+            print(f'words:   {len(words):,d}, {GAMES} games of {TURNS} turns')
+
+            for strength in ComputerStrength:
+                _play_games(dawg, strength)
+
+
+if __name__ == '__main__':
+    bench_computer_player()
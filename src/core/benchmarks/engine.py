@@ -0,0 +1,105 @@
+"""Throughput of the engine service with growing numbers of worker processes.
+
+Midgame positions recorded like in the move generator benchmark are encoded and
+all submitted at once, to engines with 1, 2, 4, ... workers up to the number of
+CPUs, and the searches finished per second are compared with one worker and with
+searches in the benchmark's own process, which pay no encoding or transfer. Workers
+are started before timing. Searches are independent, so throughput should grow
+linearly with workers as long as each has a CPU of its own. Uses the word list
+given as the first argument, one word per line, or generated words. Run from the
+`src` directory:
+
+    python -m core.benchmarks.engine [words.txt]
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from core.benchmarks.move_generator import get_words, record_positions
+from core.engine import EngineService
+from core.game.alphabet import Alphabet
+from core.game.enums import Language
+from core.game.move_generator import MoveGenerator
+from core.game.position import encode_position
+from core.game.scrabble_game import GameConfig
+from core.lexicon.builder import build_dawg
+from core.lexicon.graph import Dawg
+
+HINT_MOVES = 3
+
+
+def _get_worker_counts() -> list[int]:
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+
+    return counts
+
+
+async def _run_searches(path: Path, positions: list[bytes], workers: int) -> float:
+    engine = EngineService(
+        path, GameConfig.default(), workers=workers, max_pending=len(positions)
+    )
+    try:
+        await engine.start()
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                engine.search(index, position, HINT_MOVES)
+                for index, position in enumerate(positions)
+            )
+        )
+        return time.perf_counter() - start
+    finally:
+        engine.close()
+
+
+def bench_engine() -> None:
+    words = get_words()
+    alphabet = Alphabet.for_language(Language.POLISH)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'words.dawg'
+        build_dawg(words, path, alphabet=alphabet.letters)
+
+        with Dawg.load(path) as dawg:
+            recorded = record_positions(dawg)
+            positions = [encode_position(board, rack) for board, rack in recorded]
+
+            # warmed up like the workers, which memoize lexicon nodes too
+            generator = MoveGenerator(dawg, alphabet.points)
+            for board, rack in recorded:
+                generator.generate(board, rack)
+
+            start = time.perf_counter()
+            for board, rack in recorded:
+                generator.generate(board, rack)
+            local_time = time.perf_counter() - start
+
+        print(f'words:           {len(words):10,d}')
+        print(f'positions:       {len(positions):10,d}')
+        print(f'position size:   {max(map(len, positions)):10d} bytes')
+        print(f'cpus:            {os.cpu_count():10d}')
+        print(f'in process:      {len(positions) / local_time:10.1f} searches/s')
+
+        base = None
+        for workers in _get_worker_counts():
+            elapsed = asyncio.run(_run_searches(path, positions, workers))
+            throughput = len(positions) / elapsed
+            base = base or throughput
+            print(
+                f'{workers:3d} workers:     {throughput:10.1f} searches/s'
+                f'{throughput / base:8.2f}x'
+                f'{throughput / base / workers:8.0%} efficiency'
+            )
+
+
+if __name__ == '__main__':
+    bench_engine()
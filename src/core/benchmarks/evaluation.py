@@ -0,0 +1,164 @@
+"""Per-move latency of the fused move evaluator.
+
+Compares `evaluate_placement`, which validates and scores a move in one pass
+without touching the board, with the previous way, for a hook, a parallel play
+and an extension of a word. The previous way, kept here as the baseline, checks
+the placement in separate passes over the fields, places the tiles on a board
+snapshot and reads the created words from there.
+
+Run from the `src` directory:
+
+    python -m core.benchmarks.evaluation
+"""
+
+import time
+
+from core import tools
+from core.exceptions.game import InvalidMoveError
+from core.game.evaluation import BINGO_BONUS, evaluate_placement
+from core.game.objects.board import Board
+from core.game.objects.field import Field
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig
+from core.game.types import Position
+
+MOVES = 20_000
+
+
+def _get_board(config: GameConfig) -> Board:
+    board = Board(config.layout)
+    board.place_tiles(
+        [(Tile(1, 1, column), Position(7, column)) for column in range(4, 11)]
+    )
+    board.clear_recently_placed()
+
+    return board
+
+
+def _get_moves() -> dict[str, list[tuple[Tile, Position]]]:
+    rack = [Tile(2, 3, 100 + i) for i in range(7)]
+
+    return {
+        # vertical word hooked below the existing one
+        'hook': list(zip(rack[:5], [Position(row, 6) for row in range(8, 13)])),
+        # creates a cross word for every tile
+        'parallel play': list(zip(rack, [Position(8, c) for c in range(3, 10)])),
+        'extension': list(zip(rack[:3], [Position(7, c) for c in range(11, 14)])),
+    }
+
+
+def _evaluate_in_passes(
+    board: Board, tile_positions: list[tuple[Tile, Position]], config: GameConfig
+) -> int:
+    # the baseline, one pass per rule like the removed verifiers, then scoring on a
+    # snapshot; error details are left out, valid moves are measured
+    positions = [position for _, position in tile_positions]
+
+    if not 0 < len(positions) <= config.tiles_per_round:
+        raise InvalidMoveError(message='Invalid number of tiles.')
+
+    for position in positions:
+        if board.index_of(position) is None:
+            raise InvalidMoveError(message='Field does not exist on board.')
+        if board.get_field(position).tile is not None:
+            raise InvalidMoveError(message='Field is already occupied by another tile.')
+
+    if tools.all_same(position.row for position in positions):
+        line_mask = board.get_row_mask(positions[0].row)
+        indexes = [position.column for position in positions]
+    elif tools.all_same(position.column for position in positions):
+        line_mask = board.get_column_mask(positions[0].column)
+        indexes = [position.row for position in positions]
+    else:
+        raise InvalidMoveError(message='Tiles must be placed in one line.')
+
+    start, end = tools.min_max(indexes)
+    placed_mask = 0
+    for index in indexes:
+        placed_mask |= 1 << index
+
+    if ((1 << (end - start + 1)) - 1) << start & ~(line_mask | placed_mask):
+        raise InvalidMoveError(message='Tiles must be placed in a continuous line.')
+
+    if board.is_empty:
+        if board.center_field.position not in positions:
+            raise InvalidMoveError(
+                message='First placement must go through the center.'
+            )
+    elif not board.has_adjacent_tiles(positions):
+        raise InvalidMoveError(message='Tiles must be placed next to placed tiles.')
+
+    snapshot = board.snapshot()
+    snapshot.place_tiles(tile_positions)
+    layout = snapshot.layout
+    placed = [snapshot.index_of(position) for position in positions]
+
+    words = [
+        snapshot.get_word_indexes(index, horizontal=True)
+        for index in tools.distinct_by(placed, key=lambda x: x // snapshot.columns)
+    ] + [
+        snapshot.get_word_indexes(index, horizontal=False)
+        for index in tools.distinct_by(placed, key=lambda x: x % snapshot.columns)
+    ]
+
+    score = BINGO_BONUS if len(positions) == config.tiles_per_round else 0
+
+    for word in words:
+        if len(word) < config.min_word_length:
+            continue
+
+        word_score = 0
+        word_bonus = 1
+
+        for field in (Field(snapshot, index) for index in word):
+            assert field.tile
+            # new tiles - with bonuses, old tiles - without bonus
+            if field.is_tile_recently_placed:
+                word_score += field.tile.points * layout.letter_multipliers[field.index]
+                word_bonus *= layout.word_multipliers[field.index]
+            else:
+                word_score += field.tile.points
+
+        score += word_score * word_bonus
+
+    return score
+
+
+def bench_evaluation() -> None:
+    config = GameConfig.default()
+    board = _get_board(config)
+
+    print(f'{"":15s} {"fused":>10s} {"in passes":>10s}')
+
+    for name, move in _get_moves().items():
+        evaluation = evaluate_placement(
+            board,
+            move,
+            tiles_per_round=config.tiles_per_round,
+            min_word_length=config.min_word_length,
+        )
+        assert evaluation.score == _evaluate_in_passes(board, move, config)
+
+        start = time.perf_counter()
+        for _ in range(MOVES):
+            evaluate_placement(
+                board,
+                move,
+                tiles_per_round=config.tiles_per_round,
+                min_word_length=config.min_word_length,
+            )
+        fused = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(MOVES):
+            _evaluate_in_passes(board, move, config)
+        in_passes = time.perf_counter() - start
+
+        print(
+            f'{name + ":":15s} {fused / MOVES * 1e6:7.2f} us'
+            f' {in_passes / MOVES * 1e6:7.2f} us {in_passes / fused:6.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    bench_evaluation()
@@ -0,0 +1,60 @@
+"""Cost of creating a game, dominated by filling its tile bag.
+
+Compares creating games, whose bags are filled from the shared `TileSet` template,
+with filling a bag the previous way, walking the distribution and generating
+a uuid4 ID for every tile.
+
+Run from the `src` directory:
+
+    python -m core.benchmarks.game_creation
+"""
+
+import time
+import uuid
+
+from core.game.alphabet import Alphabet
+from core.game.enums import Language
+from core.game.objects.player import Player
+from core.game.objects.tile import Tile
+from core.game.objects.tile_bag import TileBag
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.game.tile_sets import get_tile_distribution
+
+GAMES = 5_000
+
+
+def _create_uuid_tiles(language: Language) -> list[Tile]:
+    alphabet = Alphabet.for_language(language)
+
+    return [
+        Tile(alphabet.get_code(kind.symbol) or 0, kind.points, str(uuid.uuid4()))
+        for kind in get_tile_distribution(language).kinds
+        for _ in range(kind.count)
+    ]
+
+
+def bench_game_creation() -> None:
+    config = GameConfig.default()
+
+    start = time.perf_counter()
+    for _ in range(GAMES):
+        _create_uuid_tiles(config.language)
+    uuid_bags = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(GAMES):
+        TileBag(config.language)
+    template_bags = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(GAMES):
+        ScrabbleGame(config, players=[Player('a', 'a'), Player('b', 'b')])
+    games = time.perf_counter() - start
+
+    print(f'bag with uuid IDs:     {uuid_bags / GAMES * 1e6:8.2f} us')
+    print(f'bag from template:     {template_bags / GAMES * 1e6:8.2f} us')
+    print(f'game creation:         {games / GAMES * 1e6:8.2f} us')
+
+
+if __name__ == '__main__':
+    bench_game_creation()
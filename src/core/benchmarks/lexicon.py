@@ -0,0 +1,73 @@
+"""Build time, size and lookup speed of the DAWG and GADDAG lexicons.
+
+Uses the word list given as the first argument, one word per line,
+or a generated list of inflected forms. Run from the `src` directory:
+
+    python -m core.benchmarks.lexicon [words.txt]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from core.lexicon.builder import build_dawg, build_gaddag
+from core.lexicon.graph import Dawg, Gaddag, LexiconGraph
+
+ALPHABET = 'AĄBCĆDEĘFGHIJKLŁMNŃOÓPRSŚTUWYZŹŻ'
+ENDINGS = ('', 'A', 'U', 'EM', 'OWI', 'AMI', 'ACH', 'ÓW', 'OM', 'Y')
+STEMS = 20_000
+LOOKUPS = 100_000
+
+
+def _get_words() -> list[str]:
+    if len(sys.argv) > 1:
+        return Path(sys.argv[1]).read_text(encoding='utf-8').splitlines()
+
+    rng = random.Random(0)
+    stems = [
+        ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(2, 9)))
+        for _ in range(STEMS)
+    ]
+    return [stem + ending for stem in stems for ending in ENDINGS]
+
+
+def _bench(
+    name: str, words: list[str], path: Path, build, graph_type: type[LexiconGraph]
+) -> None:
+    start = time.perf_counter()
+    header = build(words, path)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph = graph_type.load(path)
+    load_time = time.perf_counter() - start
+
+    probes = [words[i % len(words)].upper() for i in range(LOOKUPS)]
+    found = 0
+    start = time.perf_counter()
+    for word in probes:
+        found += word in graph
+    lookup_time = time.perf_counter() - start
+    graph.close()
+
+    print(f'{name}:')
+    print(f'  build:     {build_time:10.2f} s')
+    print(f'  edges:     {header.edge_count:10,d}')
+    print(f'  size:      {path.stat().st_size / 1024 / 1024:10.2f} MiB')
+    print(f'  load:      {load_time * 1e6:10.2f} us')
+    print(f'  lookup:    {lookup_time / LOOKUPS * 1e6:10.2f} us ({found:,d} found)')
+
+
+def bench_lexicon() -> None:
+    words = _get_words()
+    print(f'words: {len(words):,}')
+
+    with tempfile.TemporaryDirectory() as directory:
+        _bench('DAWG', words, Path(directory) / 'words.dawg', build_dawg, Dawg)
+        _bench('GADDAG', words, Path(directory) / 'words.gaddag', build_gaddag, Gaddag)
+
+
+if __name__ == '__main__':
+    bench_lexicon()
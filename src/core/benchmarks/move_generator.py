@@ -0,0 +1,146 @@
+"""Time to generate all legal moves of a rack on recorded midgame positions.
+
+Positions are recorded from games played by always choosing the best scoring
+move, and every one of them is then searched again from scratch, using the
+cross-checks the game kept up to date. Rebuilding cross-checks for the whole
+board is compared with updating them for the lines of the last move. Uses the word
+list given as the first argument, one word per line, or generated words with
+letters as frequent as in the tile bag. Run from the `src` directory:
+
+    python -m core.benchmarks.move_generator [words.txt]
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from core.game.alphabet import Alphabet
+from core.game.enums import Language
+from core.game.move_generator import MoveGenerator
+from core.game.objects.board import Board
+from core.game.objects.player import Player
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.game.tile_sets import get_tile_distribution
+from core.lexicon.builder import build_dawg
+from core.lexicon.graph import Dawg
+
+ENDINGS = ('', 'A', 'U', 'E', 'Y', 'EM', 'OWI', 'AMI', 'ACH', 'OM', 'IE')
+STEMS = 30_000
+GAMES = 10
+TURNS = 20
+
+
+def get_words() -> list[str]:
+    if len(sys.argv) > 1:
+        return Path(sys.argv[1]).read_text(encoding='utf-8').upper().splitlines()
+
+    kinds = get_tile_distribution(Language.POLISH).kinds
+    letters = [kind.symbol for kind in kinds if kind.points]
+    weights = [kind.count for kind in kinds if kind.points]
+
+    rng = random.Random(0)
+    stems = {
+        ''.join(rng.choices(letters, weights, k=rng.randint(2, 8)))
+        for _ in range(STEMS)
+    }
+    return sorted({stem + ending for stem in stems for ending in ENDINGS})
+
+
+def record_positions(dawg: Dawg) -> list[tuple[Board, bytes]]:
+    positions = []
+
+    for seed in range(GAMES):
+        config = GameConfig.default()
+        config.seed = seed
+        game = ScrabbleGame(
+            config, players=[Player('a', 'a'), Player('b', 'b')], lexicon=dawg
+        )
+        game.start()
+        generator = MoveGenerator(dawg, game.alphabet.points)
+
+        for _ in range(TURNS):
+            player = game.current_player
+            if not game.board.is_empty:
+                positions.append((game.board.snapshot(), player.letter_counts))
+
+            moves = generator.generate(game.board, player.letter_counts)
+            if not moves:
+                game.skip_turn(player)
+                continue
+
+            move = max(moves, key=lambda x: x.score)
+            rack = list(player.tiles)
+            tile_positions, blank_symbols = [], []
+
+            for position, code, blank in zip(
+                move.positions, move.letters, move.blanks, strict=True
+            ):
+                tile = next(
+                    t for t in rack if (t.is_blank if blank else t.code == code)
+                )
+                rack.remove(tile)
+                tile_positions.append((tile, position))
+                if blank:
+                    blank_symbols.append((tile, game.alphabet.symbols[code]))
+
+            game.place_tiles(player, tile_positions, blank_symbols=blank_symbols)
+
+    return positions
+
+
+def bench_move_generator() -> None:
+    words = get_words()
+    alphabet = Alphabet.for_language(Language.POLISH)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'words.dawg'
+        build_dawg(words, path, alphabet=alphabet.letters)
+
+        with Dawg.load(path) as dawg:
+            positions = record_positions(dawg)
+
+            # a fresh generator, so that no lexicon nodes are memoized yet
+            generator = MoveGenerator(dawg, alphabet.points)
+            times = []
+            moves = 0
+
+            for board, rack in positions:
+                start = time.perf_counter()
+                moves += len(generator.generate(board, rack))
+                times.append(time.perf_counter() - start)
+
+            # cross-checks of the whole board against those of the last move's lines
+            full_time = update_time = 0.0
+
+            for board, _ in positions:
+                table = board.cross_checks.copy()
+                placement = board.last_placement()
+                indexes = [board.index_of(p) for p in placement.positions]
+
+                start = time.perf_counter()
+                table.rebuild(board)
+                full_time += time.perf_counter() - start
+
+                start = time.perf_counter()
+                table.update(board, indexes)
+                update_time += time.perf_counter() - start
+
+    times.sort()
+    print(f'words:           {len(words):10,d}')
+    print(f'positions:       {len(positions):10,d}')
+    print(f'moves:           {moves / len(positions):10.0f} per position')
+    print(f'mean:            {statistics.mean(times) * 1e3:10.2f} ms')
+    print(f'median:          {statistics.median(times) * 1e3:10.2f} ms')
+    print(f'p95:             {times[int(len(times) * 0.95)] * 1e3:10.2f} ms')
+    print(f'max:             {times[-1] * 1e3:10.2f} ms')
+    print(f'cross-checks:    {full_time / len(positions) * 1e3:10.2f} ms full board')
+    print(
+        f'                 {update_time / len(positions) * 1e3:10.2f} ms after a move'
+    )
+
+
+if __name__ == '__main__':
+    bench_move_generator()
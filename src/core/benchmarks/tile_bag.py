@@ -0,0 +1,68 @@
+"""Throughput of drawing racks from a bag and putting them back.
+
+Compares the count-based `TileBag`, which picks letters from its count vector,
+with the previous bag, a list of tiles sampled with `random.sample` and shrunk
+with `list.remove`. Drawing on the bare count vector with `draw_letters`, as a
+Monte Carlo simulation would, is measured as well.
+
+Run from the `src` directory:
+
+    python -m core.benchmarks.tile_bag
+"""
+
+import random
+import time
+
+from core.game.objects.tile import Tile
+from core.game.objects.tile_bag import TileBag, TileSet, draw_letters
+from core.game.scrabble_game import GameConfig
+
+RACKS = 100_000
+
+
+class _ListBag:
+    def __init__(self, tiles: list[Tile]) -> None:
+        self._remaining_tiles = tiles
+
+    def scrabble(self, n: int) -> list[Tile]:
+        tiles = random.sample(self._remaining_tiles, n)
+        for tile in tiles:
+            self._remaining_tiles.remove(tile)
+        return tiles
+
+    def put_back(self, tiles: list[Tile]) -> None:
+        self._remaining_tiles.extend(tiles)
+
+
+def bench_tile_bag() -> None:
+    config = GameConfig.default()
+    size = config.tiles_per_round
+    random.seed(0)
+
+    list_bag = _ListBag(TileSet.for_language(config.language).create_tiles())
+    start = time.perf_counter()
+    for _ in range(RACKS):
+        list_bag.put_back(list_bag.scrabble(size))
+    list_racks = time.perf_counter() - start
+
+    bag = TileBag(config.language)
+    start = time.perf_counter()
+    for _ in range(RACKS):
+        bag.put_back(bag.scrabble(size))
+    count_racks = time.perf_counter() - start
+
+    rng = random.Random(0)
+    counts = bytearray(bag.letter_counts)
+    start = time.perf_counter()
+    for _ in range(RACKS):
+        for code in draw_letters(counts, size, rng):
+            counts[code] += 1
+    letter_racks = time.perf_counter() - start
+
+    print(f'list bag:             {RACKS / list_racks:12,.0f} racks/s')
+    print(f'count-based bag:      {RACKS / count_racks:12,.0f} racks/s')
+    print(f'letters only:         {RACKS / letter_racks:12,.0f} racks/s')
+
+
+if __name__ == '__main__':
+    bench_tile_bag()
@@ -0,0 +1,87 @@
+"""Payload size and lookup latency of tile IDs.
+
+Compares integer tile IDs, which are looked up in the rack by key, with the previous
+uuid4 string IDs, which were looked up by scanning the rack. Payload size is measured
+on a full board broadcast, every tile of the bag placed on the board.
+
+Run from the `src` directory:
+
+    python -m core.benchmarks.tile_ids
+"""
+
+import json
+import time
+import uuid
+
+from core.game.objects.board import Board
+from core.game.objects.player import Player
+from core.game.objects.tile import Tile
+from core.game.objects.tile_bag import TileSet
+from core.game.scrabble_game import GameConfig
+from core.protocol.data_types import BoardData
+
+LOOKUPS = 200_000
+
+
+def _get_full_board(config: GameConfig) -> Board:
+    board = Board(config.layout)
+    tiles = TileSet.for_language(config.language).create_tiles()
+
+    board.place_tiles(list(zip(tiles, board.geometry.positions)))
+
+    return board
+
+
+def bench_payload(config: GameConfig) -> None:
+    board = _get_full_board(config)
+    data = BoardData.from_board(board, TileSet.for_language(config.language).alphabet)
+
+    payload = data.to_json()
+
+    # the same payload with uuid4 string IDs
+    board_dict = data.to_dict()
+    for field in board_dict['fields']:
+        if field['tile'] is not None:
+            field['tile']['id'] = str(uuid.uuid4())
+    uuid_payload = json.dumps(board_dict, separators=(',', ':'), ensure_ascii=False)
+
+    print(f'board payload, uuid IDs:    {len(uuid_payload.encode()):8,} B')
+    print(f'board payload, integer IDs: {len(payload.encode()):8,} B')
+
+
+def bench_lookup(config: GameConfig) -> None:
+    tiles = TileSet.for_language(config.language).create_tiles()
+    rack = tiles[-config.tiles_per_round :]
+
+    player = Player('a', 'a')
+    player.tiles = rack
+    ids = [tile.id for tile in rack]
+
+    uuid_rack = [(str(uuid.uuid4()), tile) for tile in rack]
+    uuid_ids = [tile_id for tile_id, _ in uuid_rack]
+
+    def scan(tile_id: str) -> Tile | None:
+        for id, tile in uuid_rack:
+            if id == tile_id:
+                return tile
+        return None
+
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        scan(uuid_ids[i % len(uuid_ids)])
+    scanned = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        player.get_tile_by_id(ids[i % len(ids)])
+    indexed = time.perf_counter() - start
+
+    print(f'lookup, uuid scan:          {scanned / LOOKUPS * 1e9:8.2f} ns')
+    print(f'lookup, integer key:        {indexed / LOOKUPS * 1e9:8.2f} ns')
+
+
+if __name__ == '__main__':
+    config = GameConfig.default()
+
+    bench_payload(config)
+    bench_lookup(config)
@@ -0,0 +1,251 @@
+"""Engine service, searching moves in a pool of worker processes.
+
+Move searches are CPU-bound and hold the GIL, so run in the server's process they
+stall its event loop and every room with it, worker threads only share the stall.
+The engine runs them in worker processes instead. Every worker memory-maps the
+compiled lexicon once when it starts, so all of them share its pages, and keeps its
+own move generator with memoized lexicon nodes. A search is submitted as a compact
+encoded position, see `core.game.position`, and its result is awaited as a future.
+
+Searches are submitted under a key, usually a room number. The number of searches
+not finished yet is limited, and `cancel` drops all searches of a key, e.g. when
+its room closes. A search already running in a worker is bounded by its time
+budget, its result is discarded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import random
+import time
+from collections.abc import Hashable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from core.exceptions.engine import (
+    EngineCancelledError,
+    EngineClosedError,
+    EngineOverloadedError,
+)
+from core.game.alphabet import Alphabet
+from core.game.computer_player import SEARCH_SHARE, choose_moves
+from core.game.enums import ComputerStrength
+from core.game.move_generator import GeneratedMove, MoveGenerator
+from core.game.position import decode_position
+from core.game.scrabble_game import GameConfig
+from core.lexicon.graph import Dawg
+
+# searches waiting for a worker, per worker, before new ones are refused
+DEFAULT_QUEUE_DEPTH = 4
+
+
+class _Worker:
+    """State of a worker process, created once by `_init_worker`."""
+
+    def __init__(self, lexicon_path: str, config: GameConfig) -> None:
+        self.lexicon = Dawg.load(lexicon_path)
+        self.layout = config.layout
+        self.alphabet = Alphabet.for_language(config.language)
+        self.generator = MoveGenerator(
+            self.lexicon,
+            self.alphabet.points,
+            tiles_per_round=config.tiles_per_round,
+            min_word_length=config.min_word_length,
+        )
+
+
+_worker: _Worker | None = None
+
+
+def _init_worker(lexicon_path: str, config: GameConfig) -> None:
+    global _worker
+    _worker = _Worker(lexicon_path, config)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _search(
+    position: bytes,
+    n: int,
+    strength: ComputerStrength,
+    time_budget: float | None,
+    seed: int | None,
+) -> list[GeneratedMove]:
+    assert _worker is not None, 'Searches run only in engine workers.'
+
+    deadline = (
+        time.monotonic() + time_budget * SEARCH_SHARE
+        if time_budget is not None
+        else None
+    )
+
+    board, rack, cross_checks = decode_position(
+        position, _worker.layout, _worker.alphabet
+    )
+    moves = _worker.generator.generate(
+        board, rack, cross_checks=cross_checks, deadline=deadline
+    )
+
+    return choose_moves(
+        moves,
+        n,
+        strength=strength,
+        rack=rack,
+        alphabet=_worker.alphabet,
+        rng=random.Random(seed),
+    )
+
+
+class EngineService:
+    """Pool of worker processes searching moves for all games of one set of rules.
+
+    Workers are spawned rather than forked, a fork of a process running an event
+    loop and threads would copy their locks in whatever state they are.
+
+    Args:
+        lexicon_path (str | os.PathLike[str]): Compiled lexicon, see
+            `python -m core.lexicon build`, loaded by every worker.
+        config (GameConfig): Rules of the searched games, their language, board
+            layout, tiles per round and minimum word length.
+        workers (int | None): Number of worker processes, one per CPU if None.
+        max_pending (int | None): Maximum number of searches not finished yet,
+            `DEFAULT_QUEUE_DEPTH` per worker if None.
+    """
+
+    def __init__(
+        self,
+        lexicon_path: str | os.PathLike[str],
+        config: GameConfig,
+        *,
+        workers: int | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = (
+            max_pending
+            if max_pending is not None
+            else DEFAULT_QUEUE_DEPTH * self.workers
+        )
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(os.fspath(lexicon_path), config),
+        )
+        self._pending: dict[Hashable, set[asyncio.Future[list[GeneratedMove]]]] = {}
+        self._pending_count = 0
+        self._closed = False
+
+    @property
+    def pending_count(self) -> int:
+        """Returns the number of searches submitted and not finished yet."""
+        return self._pending_count
+
+    async def start(self) -> None:
+        """Starts the workers and waits until they have loaded the lexicon, otherwise
+        they are started by the first searches.
+        """
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(self._executor, _ping) for _ in range(self.workers))
+        )
+
+    async def search(
+        self,
+        key: Hashable,
+        position: bytes,
+        n: int,
+        *,
+        strength: ComputerStrength = ComputerStrength.GREEDY,
+        time_budget: float | None = None,
+        seed: int | None = None,
+    ) -> list[GeneratedMove]:
+        """Searches the best moves of a position in a worker process.
+
+        Args:
+            key (Hashable): Key the search is cancelled by, e.g. a room number.
+            position (bytes): Board and rack from `encode_position`.
+            n (int): Maximum number of moves returned.
+            strength (ComputerStrength): How the moves are ranked, see `choose_moves`.
+            time_budget (float | None): Seconds the search may take once a worker
+                has started it, unlimited if None. It stops generating moves early
+                enough to rank the ones found in time.
+            seed (int | None): Seed of random choices, random if None.
+
+        Returns:
+            list[GeneratedMove]: Up to `n` moves, best first.
+
+        Raises:
+            EngineOverloadedError: If `max_pending` searches are not finished yet.
+            EngineClosedError: If the engine has been closed.
+            EngineCancelledError: If the search was dropped with `cancel`.
+        """
+        if self._closed:
+            raise EngineClosedError()
+
+        if self._pending_count >= self.max_pending:
+            raise EngineOverloadedError(
+                pending=self._pending_count, max_pending=self.max_pending
+            )
+
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            partial(_search, position, n, strength, time_budget, seed),
+        )
+
+        self._pending.setdefault(key, set()).add(future)
+        self._pending_count += 1
+        future.add_done_callback(partial(self._forget, key))
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # dropped by `cancel` rather than cancelled together with the waiter
+            task = asyncio.current_task()
+            if task is not None and not task.cancelling():
+                raise EngineCancelledError() from None
+            raise
+
+    def cancel(self, key: Hashable) -> int:
+        """Drops all searches submitted under the key, their waiters get
+        `EngineCancelledError`. Returns the number of searches dropped.
+        """
+        futures = self._pending.get(key, ())
+        count = len(futures)
+
+        for future in list(futures):
+            future.cancel()
+
+        return count
+
+    def close(self) -> None:
+        """Drops all searches and stops the workers, without waiting for running
+        searches, whose results are discarded.
+        """
+        self._closed = True
+
+        for key in list(self._pending):
+            self.cancel(key)
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _forget(
+        self, key: Hashable, future: asyncio.Future[list[GeneratedMove]]
+    ) -> None:
+        futures = self._pending[key]
+        futures.discard(future)
+        self._pending_count -= 1
+
+        if not futures:
+            del self._pending[key]
+
+    def __repr__(self) -> str:
+        return (
+            f'EngineService(workers={self.workers}, pending={self._pending_count}, '
+            f'max_pending={self.max_pending})'
+        )
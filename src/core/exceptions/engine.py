@@ -0,0 +1,46 @@
+from abc import ABC
+from typing import Any
+
+
+class EngineError(Exception, ABC):
+    """Base class for all exceptions of the engine service.
+
+    Attributes:
+        message (str): A description of the error.
+        details (dict[str, Any] | None): Optional additional details about the error.
+    """
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        super().__init__(message)
+
+        self.message = message
+        self.details = details
+
+
+class EngineOverloadedError(EngineError):
+    """Raised when a search is submitted while the engine's queue is full.
+
+    Attributes:
+        message (str): A description of the error.
+        details (dict[str, Any] | None): Queue depth and its limit.
+    """
+
+    def __init__(self, *, pending: int, max_pending: int) -> None:
+        super().__init__(
+            message='The engine is busy, try again later.',
+            details={'pending': pending, 'max_pending': max_pending},
+        )
+
+
+class EngineClosedError(EngineError):
+    """Raised when a search is submitted to an engine which has been closed."""
+
+    def __init__(self) -> None:
+        super().__init__('The engine has been closed.')
+
+
+class EngineCancelledError(EngineError):
+    """Raised to the waiter of a search dropped with `EngineService.cancel`."""
+
+    def __init__(self) -> None:
+        super().__init__('The search has been cancelled.')
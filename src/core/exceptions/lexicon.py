@@ -0,0 +1,53 @@
+from abc import ABC
+from typing import Any
+
+
+class LexiconError(Exception, ABC):
+    """Base class for all lexicon-related exceptions.
+
+    Attributes:
+        message (str): A description of the error.
+        details (dict[str, Any] | None): Optional additional details about the error.
+    """
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        super().__init__(message)
+
+        self.message = message
+        self.details = details
+
+
+class LexiconFormatError(LexiconError):
+    """Raised when a lexicon file is not a valid compiled lexicon.
+
+    Attributes:
+        message (str): A description of the error.
+        details (dict[str, Any] | None): Optional additional details about the error.
+    """
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        super().__init__(message=message, details=details)
+
+
+class LexiconBuildError(LexiconError):
+    """Raised when a word list cannot be compiled into a lexicon.
+
+    Attributes:
+        message (str): A description of the error.
+        details (dict[str, Any] | None): Optional additional details about the error.
+    """
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        super().__init__(message=message, details=details)
+
+
+class LexiconAlphabetError(LexiconError):
+    """Raised when the alphabet of a lexicon does not match the letters of a language.
+
+    Attributes:
+        message (str): A description of the error.
+        details (dict[str, Any] | None): Optional additional details about the error.
+    """
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        super().__init__(message=message, details=details)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import cache
+
+from core.game.enums import Language
+from core.game.tile_sets import BLANK_SYMBOL, get_tile_distribution
+
+# letter code of a blank tile which has no letter chosen yet
+BLANK = 0
+
+# letter codes of every alphabet are below this bound, compiled lexicons
+# store them in 6 bits, so tables indexed by code can have a fixed size
+MAX_CODES = 64
+
+
+class Alphabet:
+    """Dense integer encoding of the letters of a language.
+
+    Tiles, boards, racks, lexicons and scoring work with small letter codes instead of
+    symbols, letters are only converted at the protocol edge. Code `BLANK` (0) is the
+    blank tile, letters get codes from 1 in the order of their symbols, which is the
+    same order compiled lexicons use, so lexicon codes and game codes are equal.
+    Use `Alphabet.for_language` to obtain the shared instance of a language.
+
+    Attributes:
+        language (Language): Language of the alphabet.
+        symbols (tuple[str, ...]): Symbol of every letter code, `BLANK_SYMBOL` for code 0.
+        points (bytes): Points of every letter code, 0 for the blank.
+    """
+
+    __slots__ = ('_codes', '_table', 'language', 'points', 'symbols')
+
+    def __init__(self, language: Language, letter_points: dict[str, int]) -> None:
+        if len(letter_points) >= MAX_CODES - 1:
+            raise ValueError(f'Alphabet cannot have more than {MAX_CODES - 2} letters.')
+
+        self.language = language
+        self.symbols = (BLANK_SYMBOL, *sorted(letter_points))
+        self.points = bytes([0, *(letter_points[s] for s in self.symbols[1:])])
+
+        self._codes = {symbol: code for code, symbol in enumerate(self.symbols)}
+        self._table = {ord(symbol): code for symbol, code in self._codes.items()}
+
+    @staticmethod
+    @cache
+    def for_language(language: Language) -> Alphabet:
+        """Returns the shared alphabet of the language, built from its tile distribution."""
+        letter_points = {
+            kind.symbol: kind.points
+            for kind in get_tile_distribution(language).kinds
+            if kind.symbol != BLANK_SYMBOL
+        }
+
+        return Alphabet(language, letter_points)
+
+    @property
+    def letters(self) -> str:
+        """Returns symbols of all letters without the blank, in the order of their codes."""
+        return ''.join(self.symbols[1:])
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def get_code(self, symbol: str) -> int | None:
+        """Returns the letter code of the symbol, None if it is not in the alphabet."""
+        return self._codes.get(symbol)
+
+    def is_letter(self, code: int) -> bool:
+        """Checks if the code is a letter, not the blank and not out of range."""
+        return 0 < code < len(self.symbols)
+
+    def encode(self, word: str) -> bytes:
+        """Returns the word as letter codes.
+
+        Raises:
+            ValueError: If the word contains a symbol outside of the alphabet.
+        """
+        if not self._codes.keys() >= set(word):
+            raise ValueError(f'Word {word!r} contains symbols outside of the alphabet.')
+
+        return bytes(word.translate(self._table), 'latin-1')
+
+    def decode(self, codes: Iterable[int]) -> str:
+        """Returns letter codes as a word of symbols."""
+        symbols = self.symbols
+        return ''.join([symbols[code] for code in codes])
+
+    def __repr__(self) -> str:
+        return f'Alphabet(language={self.language.name}, letters={self.letters!r})'
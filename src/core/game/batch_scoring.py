@@ -0,0 +1,147 @@
+"""Vectorized scoring of many candidate placements against one board state.
+
+Requires NumPy, install the `numpy` extra of the package to use it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from core.game.evaluation import BINGO_BONUS
+from core.game.objects.board import Board
+
+
+def score_placements(
+    board: Board,
+    positions: npt.ArrayLike,
+    letters: npt.ArrayLike,
+    blanks: npt.ArrayLike,
+    *,
+    letter_points: Sequence[int],
+    min_word_length: int = 2,
+    bingo_size: int = 7,
+) -> npt.NDArray[np.int64]:
+    """Scores candidate placements of tiles on the board, without placing them.
+
+    Every row of the input arrays is one candidate placement of up to `k` tiles,
+    candidates with fewer tiles are padded with position -1. Tiles of a candidate
+    must go to distinct empty cells, tiles already on the board score without bonuses.
+    Valid placements score the same as with `evaluate_placement`.
+
+    Args:
+        board (Board): Board the candidates are placed on.
+        positions (npt.ArrayLike): Flat cell indexes of the tiles, shape `(n, k)`.
+        letters (npt.ArrayLike): Letter codes of the tiles, indexes into `letter_points`.
+        blanks (npt.ArrayLike): Whether the tiles are blanks, which score no points.
+        letter_points (Sequence[int]): Points of every letter code, e.g. `Alphabet.points`.
+        min_word_length (int): Minimum length of a word to be scored.
+        bingo_size (int): Number of tiles which gives the bingo bonus when all are used.
+
+    Returns:
+        npt.NDArray[np.int64]: Score of every candidate, shape `(n,)`.
+
+    Raises:
+        ValueError: If the arrays do not have the same `(n, k)` shape, or a position
+            lies outside of the board.
+    """
+    positions = np.asarray(positions, dtype=np.intp)
+    letters = np.asarray(letters, dtype=np.intp)
+    blanks = np.asarray(blanks, dtype=bool)
+
+    if positions.ndim != 2 or not (positions.shape == letters.shape == blanks.shape):
+        raise ValueError(
+            'Positions, letters and blanks must be 2D arrays of the same shape.'
+        )
+
+    cells = len(board.geometry)
+
+    if positions.size and (positions.min() < -1 or positions.max() >= cells):
+        raise ValueError('All positions must be on the board or -1 for padding.')
+
+    count, size = positions.shape
+    placed = positions >= 0
+    points_table = np.asarray(letter_points, dtype=np.int64)
+    points = np.where(placed & ~blanks, points_table[np.where(placed, letters, 0)], 0)
+
+    tiles = board.get_tiles()
+    occupied = np.array([tile is not None for tile in tiles])
+    board_points = np.array([tile.points if tile else 0 for tile in tiles], np.int64)
+    letter_multipliers = np.frombuffer(board.layout.letter_multipliers, np.uint8)
+    word_multipliers = np.frombuffer(board.layout.word_multipliers, np.uint8)
+
+    # tiles of all candidates are addressed by `candidate * cells + cell`, sorted so
+    # a cell can be looked up among the candidate's tiles with a binary search,
+    # padding gets key -1 so it is never found
+    cell_indexes = np.where(placed, positions, 0)
+    keys = np.where(placed, np.arange(count)[:, None] * cells + positions, -1).ravel()
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    tile_scores = (points * letter_multipliers[cell_indexes]).ravel()
+    tile_word_bonuses = word_multipliers[cell_indexes].astype(np.int64).ravel()
+
+    rows, columns = np.divmod(cell_indexes, board.columns)
+    placed_tiles = np.flatnonzero(placed)
+    # earlier tile of the candidate in the same line, the word is already counted
+    earlier = np.tri(size, size, -1, dtype=bool)
+
+    total = np.zeros(count, np.int64)
+
+    for lines, offsets, stride, line_length in (
+        (rows, columns, 1, board.columns),
+        (columns, rows, board.columns, board.rows),
+    ):
+        word_scores = tile_scores.copy()
+        word_bonuses = tile_word_bonuses.copy()
+        lengths = np.ones(count * size, np.int64)
+
+        for direction in (-1, 1):
+            # tiles whose word still continues in this direction, most stop
+            # after a step or two, so only those are processed further
+            active = placed_tiles
+            active_offsets = offsets.ravel()[active]
+            active_keys = keys[active]
+
+            for step in range(1, line_length):
+                active_offsets = active_offsets + direction
+                active_keys = active_keys + direction * stride
+
+                inside = (active_offsets >= 0) & (active_offsets < line_length)
+                found = np.minimum(
+                    np.searchsorted(sorted_keys, active_keys), len(sorted_keys) - 1
+                )
+                is_new = inside & (sorted_keys[found] == active_keys)
+                is_old = inside & occupied[np.where(inside, active_keys % cells, 0)]
+
+                keep = is_new | is_old
+                if not keep.any():
+                    break
+
+                active = active[keep]
+                active_offsets = active_offsets[keep]
+                active_keys = active_keys[keep]
+                is_new = is_new[keep]
+                found = order[found[keep]]
+
+                word_scores[active] += np.where(
+                    is_new, tile_scores[found], board_points[active_keys % cells]
+                )
+                word_bonuses[active] *= np.where(is_new, tile_word_bonuses[found], 1)
+                lengths[active] += 1
+
+        duplicated = (
+            (lines[:, :, None] == lines[:, None, :]) & placed[:, None, :] & earlier
+        ).any(axis=2)
+        counted = (
+            placed & ~duplicated & (lengths.reshape(count, size) >= min_word_length)
+        )
+        word_totals = (word_scores * word_bonuses).reshape(count, size)
+
+        total += np.where(counted, word_totals, 0).sum(axis=1)
+
+    total += np.where(placed.sum(axis=1) == bingo_size, BINGO_BONUS, 0)
+
+    return total
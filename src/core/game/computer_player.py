@@ -0,0 +1,253 @@
+"""Computer opponents, seated in a game like human players.
+
+A `ComputerPlayer` is a `Player` which chooses its own moves. On the server the
+search runs in an engine worker process, see `core.engine`: the position goes there
+encoded, the worker generates the moves and picks one with `choose_moves`, and
+back in the process owning the game `get_turn` takes the tiles of the chosen move
+from the rack and `apply_turn` makes it. `play_turn` does all of it in the calling
+process, for tests and benchmarks. Every search has a hard time budget, the move
+generator stops before its end, leaving time to choose the best of the moves found.
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from core.exceptions.game import InvalidOperationError
+from core.game.alphabet import BLANK, Alphabet
+from core.game.enums import ComputerStrength, PlayerMoveType
+from core.game.move_generator import GeneratedMove
+from core.game.objects.player import Player
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import ScrabbleGame, SuggestedMove
+from core.game.tile_sets import get_tile_distribution
+
+# seconds a computer player may think about one move, stronger ones think longer
+DEFAULT_TIME_BUDGETS = {
+    ComputerStrength.RANDOM: 0.2,
+    ComputerStrength.GREEDY: 0.5,
+    ComputerStrength.EQUITY: 1.0,
+}
+
+# share of the time budget for generating moves, the rest is left for choosing one,
+# which takes up to a fifth of the generation time for the equity of every move
+SEARCH_SHARE = 0.8
+
+# rough static values of the tiles kept on the rack, in points
+_BLANK_VALUE = 25.0
+_POINTS_PENALTY = 1.0
+_DUPLICATE_PENALTY = 4.0
+_IMBALANCE_PENALTY = 3.0
+
+
+@dataclass(frozen=True, slots=True)
+class ComputerTurn:
+    """Turn chosen by a computer player.
+
+    Attributes:
+        type (PlayerMoveType): Kind of the turn.
+        move (SuggestedMove | None): Placed tiles, for `PLACE_WORD` turns.
+        tiles (tuple[Tile, ...]): Tiles to exchange, for `EXCHANGE` turns.
+    """
+
+    type: PlayerMoveType
+    move: SuggestedMove | None = None
+    tiles: tuple[Tile, ...] = ()
+
+
+def get_leave_value(leave: Sequence[int], alphabet: Alphabet, vowels: bytes) -> float:
+    """Returns a static estimate of how good the tiles kept on the rack are.
+
+    Blanks are worth the most, while high scoring letters, duplicates and racks
+    of mostly vowels or mostly consonants are hard to play in later turns.
+
+    Args:
+        leave (Sequence[int]): Number of kept tiles of every letter code, blanks
+            under `BLANK`.
+        alphabet (Alphabet): Letters of the game.
+        vowels (bytes): Letter codes of the vowels.
+    """
+    value = _BLANK_VALUE * leave[BLANK]
+    vowel_count = consonant_count = 0
+
+    for code in range(1, len(alphabet)):
+        if not (count := leave[code]):
+            continue
+
+        value -= _POINTS_PENALTY * (alphabet.points[code] - 1) * count
+        value -= _DUPLICATE_PENALTY * (count - 1)
+
+        if code in vowels:
+            vowel_count += count
+        else:
+            consonant_count += count
+
+    # one letter more of either kind is still balanced
+    imbalance = max(abs(vowel_count - consonant_count) - 1, 0)
+
+    return value - _IMBALANCE_PENALTY * imbalance
+
+
+def choose_moves(
+    moves: Sequence[GeneratedMove],
+    n: int,
+    *,
+    strength: ComputerStrength,
+    rack: Sequence[int],
+    alphabet: Alphabet,
+    rng: random.Random,
+) -> list[GeneratedMove]:
+    """Returns up to `n` of the moves, best first for the strength.
+
+    Args:
+        moves (Sequence[GeneratedMove]): Legal moves of the rack.
+        n (int): Maximum number of moves returned.
+        strength (ComputerStrength): How the moves are ranked, random ones are
+            sampled.
+        rack (Sequence[int]): Number of rack tiles of every letter code, blanks
+            under `BLANK`, the tiles not used by a move are its leave.
+        alphabet (Alphabet): Letters of the game.
+        rng (random.Random): Source of the random choices.
+    """
+    match strength:
+        case ComputerStrength.RANDOM:
+            return rng.sample(moves, min(n, len(moves)))
+        case ComputerStrength.GREEDY:
+            return heapq.nlargest(n, moves, key=lambda x: x.score)
+        case ComputerStrength.EQUITY:
+            vowels = alphabet.encode(get_tile_distribution(alphabet.language).vowels)
+            # many moves use the same tiles, each leave is valued once
+            leave_values: dict[bytes, float] = {}
+
+            def get_equity(move: GeneratedMove) -> float:
+                used = bytes(
+                    sorted(
+                        BLANK if blank else code
+                        for code, blank in zip(move.letters, move.blanks, strict=True)
+                    )
+                )
+
+                if (value := leave_values.get(used)) is None:
+                    leave = bytearray(rack)
+                    for code in used:
+                        leave[code] -= 1
+
+                    value = leave_values[used] = get_leave_value(
+                        leave, alphabet, vowels
+                    )
+
+                return move.score + value
+
+            return heapq.nlargest(n, moves, key=get_equity)
+
+
+class ComputerPlayer(Player):
+    """Player whose moves are chosen by the computer.
+
+    Args:
+        name (str): Name of the player.
+        id (str): ID of the player.
+        strength (ComputerStrength): How the move is chosen among the legal ones.
+        time_budget (float | None): Seconds a move may take, the default of the
+            strength if None.
+        seed (int | None): Seed of the random choices, random if None.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        id: str,
+        *,
+        strength: ComputerStrength = ComputerStrength.EQUITY,
+        time_budget: float | None = None,
+        seed: int | None = None,
+    ) -> None:
+        super().__init__(name, id)
+
+        self.strength = strength
+        self.time_budget = (
+            time_budget if time_budget is not None else DEFAULT_TIME_BUDGETS[strength]
+        )
+        self._rng = random.Random(seed)
+
+    def get_turn(self, game: ScrabbleGame, move: GeneratedMove | None) -> ComputerTurn:
+        """Returns the turn placing a move chosen elsewhere, e.g. in another process,
+        with tiles from the current rack. Without a move the tiles are exchanged.
+        """
+        rack = self.tiles
+
+        if move is not None:
+            return ComputerTurn(
+                type=PlayerMoveType.PLACE_WORD,
+                move=game.get_suggested_move(move, rack),
+            )
+
+        # nothing to place, fresh tiles give better chances next turn
+        if exchangeable := min(len(rack), game.remaining_tiles_count):
+            return ComputerTurn(
+                type=PlayerMoveType.EXCHANGE, tiles=tuple(rack[:exchangeable])
+            )
+
+        return ComputerTurn(type=PlayerMoveType.SKIP)
+
+    def draw_seed(self) -> int:
+        """Returns a seed for the random choices of a search made elsewhere."""
+        return self._rng.getrandbits(64)
+
+    def apply_turn(self, game: ScrabbleGame, turn: ComputerTurn) -> None:
+        """Makes the turn in the game, the move is validated like a human one."""
+        match turn.type:
+            case PlayerMoveType.PLACE_WORD:
+                assert turn.move is not None
+                game.place_tiles(
+                    self,
+                    list(turn.move.tile_positions),
+                    blank_symbols=list(turn.move.blank_symbols),
+                )
+            case PlayerMoveType.EXCHANGE:
+                game.exchange_tiles(self, list(turn.tiles))
+            case PlayerMoveType.SKIP:
+                game.skip_turn(self)
+
+    def play_turn(self, game: ScrabbleGame) -> ComputerTurn:
+        """Chooses and makes the next turn in the calling process, with the move
+        generator of the game. The time budget starts now.
+
+        Raises:
+            InvalidOperationError: If the game has no lexicon to generate moves from.
+            InvalidMoveError: If it is not the player's turn.
+        """
+        game.before_turn(self)
+
+        generator = game.move_generator
+        if generator is None:
+            raise InvalidOperationError(
+                'Computer players cannot play without a lexicon.'
+            )
+
+        deadline = time.monotonic() + self.time_budget * SEARCH_SHARE
+        counts = self.letter_counts
+        moves = generator.generate(game.board, counts, deadline=deadline)
+        chosen = choose_moves(
+            moves,
+            1,
+            strength=self.strength,
+            rack=counts,
+            alphabet=game.alphabet,
+            rng=self._rng,
+        )
+
+        turn = self.get_turn(game, chosen[0] if chosen else None)
+        self.apply_turn(game, turn)
+
+        return turn
+
+    def __repr__(self) -> str:
+        return (
+            f'ComputerPlayer(name={self.name}, id={self.id}, '
+            f'strength={self.strength.name}, score={self.score})'
+        )
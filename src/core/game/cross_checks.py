@@ -0,0 +1,195 @@
+"""Cross-checks of the empty cells of a board, kept up to date line by line.
+
+The cross-check of an empty cell for moves in one direction is the set of letters
+which form a valid word with the tiles perpendicular to the move, together with
+the points of those tiles. A placement changes only the perpendicular lines of its
+cells, so a table attached to a board recomputes just those lines after each change.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from core.game.geometry import BoardGeometry
+from core.lexicon.graph import LexiconGraph
+
+if TYPE_CHECKING:
+    from core.game.objects.board import Board
+
+# cross-check mask of a cell without a perpendicular word, every letter fits
+ANY_LETTER = -1
+
+
+@dataclass(frozen=True, slots=True)
+class CrossChecks:
+    """Cross-checks of every cell for moves in one direction, by flat index.
+
+    Attributes:
+        masks (Sequence[int]): Bit `code` is set if the letter forms a valid word
+            with the tiles perpendicular to the move, `ANY_LETTER` if there are no
+            such tiles or they form a word too short to be checked.
+        scores (Sequence[int]): Points of the perpendicular tiles, -1 if no
+            perpendicular word is scored.
+    """
+
+    masks: Sequence[int]
+    scores: Sequence[int]
+
+
+class CrossCheckTable:
+    """Cross-checks of a board for horizontal and vertical moves.
+
+    Attach the table to a board with `Board.attach_cross_checks`, the board then
+    updates it on every placement and revert. Occupied cells keep `ANY_LETTER`.
+
+    Args:
+        lexicon (LexiconGraph): DAWG of valid words, with the game's letter codes.
+        geometry (BoardGeometry): Geometry of the boards the table is used with.
+        min_word_length (int): Minimum length of a word to be checked and scored.
+    """
+
+    def __init__(
+        self,
+        lexicon: LexiconGraph,
+        geometry: BoardGeometry,
+        *,
+        min_word_length: int = 2,
+    ) -> None:
+        self.lexicon = lexicon
+        self.geometry = geometry
+        self.min_word_length = min_word_length
+
+        cells = len(geometry)
+        # masks fit a signed 64 bit integer, letter codes are below `MAX_CODES`
+        self._masks = (
+            array('q', [ANY_LETTER]) * cells,
+            array('q', [ANY_LETTER]) * cells,
+        )
+        self._scores = (array('h', [-1]) * cells, array('h', [-1]) * cells)
+
+    def copy(self) -> CrossCheckTable:
+        table = CrossCheckTable.__new__(CrossCheckTable)
+        table.lexicon = self.lexicon
+        table.geometry = self.geometry
+        table.min_word_length = self.min_word_length
+        table._masks = (array('q', self._masks[0]), array('q', self._masks[1]))
+        table._scores = (array('h', self._scores[0]), array('h', self._scores[1]))
+
+        return table
+
+    def get(self, *, horizontal: bool) -> CrossChecks:
+        """Returns cross-checks for moves in the given direction."""
+        direction = 0 if horizontal else 1
+        return CrossChecks(
+            masks=tuple(self._masks[direction]),
+            scores=tuple(self._scores[direction]),
+        )
+
+    def rebuild(self, board: Board) -> None:
+        """Recomputes cross-checks of all cells of the board."""
+        self._update_lines(board, self.geometry.column_lines, self.geometry.row_lines)
+
+    def update(self, board: Board, indexes: Iterable[int]) -> None:
+        """Recomputes cross-checks of the lines going through changed cells.
+
+        Args:
+            board (Board): Board with the changes already applied.
+            indexes (Iterable[int]): Indexes of the cells whose tiles changed.
+        """
+        geometry = self.geometry
+        rows: set[int] = set()
+        columns: set[int] = set()
+
+        for index in indexes:
+            row, column = divmod(index, geometry.columns)
+            rows.add(row)
+            columns.add(column)
+
+        self._update_lines(
+            board,
+            [geometry.column_lines[column] for column in sorted(columns)],
+            [geometry.row_lines[row] for row in sorted(rows)],
+        )
+
+    def _update_lines(
+        self,
+        board: Board,
+        columns: Iterable[range],
+        rows: Iterable[range],
+    ) -> None:
+        tiles = board.get_tiles()
+        letters = board.get_letters()
+
+        # horizontal moves are checked against columns, vertical moves against rows
+        for direction, lines in enumerate((columns, rows)):
+            masks = self._masks[direction]
+            scores = self._scores[direction]
+
+            for line in lines:
+                self._update_line(tiles, letters, line, masks, scores)
+
+    def _update_line(
+        self,
+        tiles: Sequence,
+        letters: bytes,
+        line: range,
+        masks: array[int],
+        scores: array[int],
+    ) -> None:
+        size = len(line)
+        occupied = [tiles[index] is not None for index in line]
+        min_length = max(self.min_word_length, 2)
+
+        for offset, index in enumerate(line):
+            masks[index] = ANY_LETTER
+            scores[index] = -1
+
+            if occupied[offset]:
+                continue
+
+            start = offset
+            while start > 0 and occupied[start - 1]:
+                start -= 1
+
+            end = offset
+            while end + 1 < size and occupied[end + 1]:
+                end += 1
+
+            if end - start + 1 < min_length:
+                continue
+
+            masks[index] = self._get_mask(
+                [letters[i] for i in line[start:offset]],
+                [letters[i] for i in line[offset + 1 : end + 1]],
+            )
+            scores[index] = sum(
+                tiles[i].points for i in line[start : end + 1] if i != index
+            )
+
+    def _get_mask(self, prefix: Sequence[int], suffix: Sequence[int]) -> int:
+        # code 0 is a blank without a letter, no word contains it
+        if 0 in prefix or 0 in suffix:
+            return 0
+
+        lexicon = self.lexicon
+        node: int | None = lexicon.root
+
+        for code in prefix:
+            if (node := lexicon.child(node, code)) is None:
+                return 0
+
+        mask = 0
+
+        for code, child in lexicon.arcs(node):
+            end: int | None = child
+            for letter in suffix:
+                if (end := lexicon.child(end, letter)) is None:
+                    break
+
+            if end is not None and lexicon.is_terminal(end):
+                mask |= 1 << code
+
+        return mask
@@ -46,6 +46,17 @@ class Language(IntEnum):
     GERMAN = 2
 
 
+class ComputerStrength(IntEnum):
+    """Enumeration of computer player strengths, from the weakest."""
+
+    # any legal move
+    RANDOM = 0
+    # the highest scoring move
+    GREEDY = 1
+    # the highest score plus the value of the tiles kept on the rack
+    EQUITY = 2
+
+
 class PlayerMoveType(IntEnum):
     """Enumeration of player move types."""
 
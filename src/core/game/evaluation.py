@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from core import tools
+from core.exceptions.game import GameError, InvalidMoveError
+from core.game.objects.board import Board
+from core.game.objects.tile import Tile
+from core.game.types import Position
+from core.lexicon.graph import LexiconGraph
+
+# bonus for using all tiles of a round in one move
+BINGO_BONUS = 50
+
+
+@dataclass(frozen=True, slots=True)
+class WordScore:
+    """Word created by a move together with its score.
+
+    Attributes:
+        letters (bytes): Letter codes of the word, blanks are given their chosen letters.
+        positions (tuple[Position, ...]): Positions of the word's letters, in reading order.
+        score (int): Score of the word, including letter and word bonuses.
+    """
+
+    letters: bytes
+    positions: tuple[Position, ...]
+    score: int
+
+
+@dataclass(frozen=True, slots=True)
+class MoveEvaluation:
+    """Result of validating and scoring a move, without applying it.
+
+    Applying a move, previewing it and generating moves all use this same result,
+    so they cannot disagree on whether a move is valid or what it scores.
+
+    Attributes:
+        error (GameError | None): Reason why the move is invalid, None if it is valid.
+        words (tuple[WordScore, ...]): Words the move creates with their scores.
+        bingo (bool): Whether all tiles of a round are used, which gives a bonus.
+        score (int): Total score of the move.
+    """
+
+    error: GameError | None = None
+    words: tuple[WordScore, ...] = ()
+    bingo: bool = False
+    score: int = 0
+
+    @property
+    def is_valid(self) -> bool:
+        return self.error is None
+
+
+def evaluate_placement(
+    board: Board,
+    tile_positions: Sequence[tuple[Tile, Position]],
+    *,
+    tiles_per_round: int,
+    min_word_length: int,
+    blank_codes: Mapping[int, int] | None = None,
+    lexicon: LexiconGraph | None = None,
+) -> MoveEvaluation:
+    """Validates placement of tiles on the board and scores the words it creates.
+
+    The placement is walked once, checking the number of tiles, that all fields exist
+    and are empty, that the tiles make a continuous line and that they go through
+    the center or next to already placed tiles. Words are then read from the board
+    with the new tiles overlaid, the board itself is never modified, and looked up
+    in the lexicon, if one is given.
+
+    Args:
+        board (Board): Board the tiles are placed on.
+        tile_positions (Sequence[tuple[Tile, Position]]): Tiles with their target positions.
+        tiles_per_round (int): Maximum number of tiles, using all of them gives a bingo.
+        min_word_length (int): Minimum length of a word to be scored.
+        blank_codes (Mapping[int, int] | None): Chosen letter codes of blank tiles by tile ID.
+        lexicon (LexiconGraph | None): Valid words, words are not checked if None.
+            It must use the alphabet of the game's language.
+
+    Returns:
+        MoveEvaluation: Evaluation of the placement, with an `InvalidMoveError` if it is invalid.
+    """
+    try:
+        placed = _verify_placement(board, tile_positions, tiles_per_round)
+    except InvalidMoveError as e:
+        return MoveEvaluation(error=e)
+
+    tiles = board.get_tiles()
+    board_letters = board.get_letters()
+    codes = blank_codes or {}
+    letter_multipliers = board.layout.letter_multipliers
+    word_multipliers = board.layout.word_multipliers
+    positions = board.geometry.positions
+    columns = board.columns
+
+    words: list[WordScore] = []
+
+    # one horizontal word per row and one vertical word per column of the placement
+    for horizontal, indexes in (
+        (True, tools.distinct_by(placed, key=lambda x: x // columns)),
+        (False, tools.distinct_by(placed, key=lambda x: x % columns)),
+    ):
+        for index in indexes:
+            word = _get_word_indexes(board, tiles, placed, index, horizontal=horizontal)
+
+            if len(word) < min_word_length:
+                continue
+
+            score = 0
+            # word bonus is accumulative
+            word_bonus = 1
+            letters = bytearray()
+
+            for i in word:
+                # new tiles - with bonuses, old tiles - without bonus
+                if (tile := placed.get(i)) is not None:
+                    score += tile.points * letter_multipliers[i]
+                    word_bonus *= word_multipliers[i]
+                    letters.append(codes.get(tile.id, tile.code))
+                else:
+                    tile = tiles[i]
+                    assert tile, 'Word must not contain empty fields.'
+                    score += tile.points
+                    letters.append(board_letters[i])
+
+            words.append(
+                WordScore(
+                    letters=bytes(letters),
+                    positions=tuple(map(positions.__getitem__, word)),
+                    score=score * word_bonus,
+                )
+            )
+
+    bingo = len(tile_positions) == tiles_per_round
+    score = sum(word.score for word in words) + (BINGO_BONUS if bingo else 0)
+
+    evaluation = MoveEvaluation(words=tuple(words), bingo=bingo, score=score)
+
+    return check_words(evaluation, lexicon) if lexicon is not None else evaluation
+
+
+def check_words(evaluation: MoveEvaluation, lexicon: LexiconGraph) -> MoveEvaluation:
+    """Looks up words of a valid evaluation in the lexicon.
+
+    Returns:
+        MoveEvaluation: The same evaluation if all words are valid, otherwise a copy
+            with an `InvalidMoveError` listing the unknown words.
+    """
+    if evaluation.error is not None:
+        return evaluation
+
+    unknown_words = [
+        lexicon.decode(word.letters)
+        for word in evaluation.words
+        if not lexicon.contains_codes(word.letters)
+    ]
+    if not unknown_words:
+        return evaluation
+
+    return dataclasses.replace(
+        evaluation,
+        error=InvalidMoveError(
+            message='Words are not in the lexicon.',
+            details={'words': unknown_words},
+        ),
+    )
+
+
+def _verify_placement(
+    board: Board,
+    tile_positions: Sequence[tuple[Tile, Position]],
+    tiles_per_round: int,
+) -> dict[int, Tile]:
+    if len(tile_positions) == 0:
+        raise InvalidMoveError('No tiles provided.')
+
+    if len(tile_positions) > tiles_per_round:
+        raise InvalidMoveError(
+            message=f'Cannot use more than {tiles_per_round} tiles in one turn.',
+            details={
+                'max_tiles': tiles_per_round,
+                'tiles': len(tile_positions),
+            },
+        )
+
+    geometry = board.geometry
+    tiles = board.get_tiles()
+    placed: dict[int, Tile] = {}
+
+    first_row, first_column = tile_positions[0][1]
+    is_horizontal = is_vertical = True
+    row_bits = column_bits = 0
+
+    for tile, position in tile_positions:
+        index = geometry.index_of(position)
+
+        # field must exist on board
+        if index is None:
+            raise InvalidMoveError(
+                message='Field does not exist on board.',
+                details={
+                    'position': position,
+                    'board_size': board.size,
+                },
+            )
+
+        # field cannot be already occupied
+        if (occupant := tiles[index]) is not None:
+            raise InvalidMoveError(
+                message='Field is already occupied by another tile.',
+                details={
+                    'position': position,
+                    'tile_id': occupant.id,
+                },
+            )
+
+        placed[index] = tile
+
+        row, column = position
+        is_horizontal = is_horizontal and row == first_row
+        is_vertical = is_vertical and column == first_column
+        row_bits |= 1 << row
+        column_bits |= 1 << column
+
+    positions = [position for _, position in tile_positions]
+
+    # same rows --> horizontal alignment, same columns --> vertical alignment
+    if is_horizontal:
+        line_mask = board.get_row_mask(first_row)
+        placed_mask = column_bits
+    elif is_vertical:
+        line_mask = board.get_column_mask(first_column)
+        placed_mask = row_bits
+    else:
+        raise InvalidMoveError(
+            message='Tiles must be placed in one line, either horizontally or vertically.',
+            details={
+                'positions': positions,
+            },
+        )
+
+    start = (placed_mask & -placed_mask).bit_length() - 1
+    span_mask = (1 << placed_mask.bit_length()) - (1 << start)
+
+    # every position between the ends must be either just placed or already occupied
+    if gaps := span_mask & ~(line_mask | placed_mask):
+        empty = (gaps & -gaps).bit_length() - 1
+        raise InvalidMoveError(
+            message='Tiles must be placed in a continuous line.',
+            details={
+                'empty_position': Position(first_row, empty)
+                if is_horizontal
+                else Position(empty, first_column),
+            },
+        )
+
+    # on first tile placement, tiles must go through the center field
+    if board.is_empty:
+        center_field = board.center_field
+        if center_field.index not in placed:
+            raise InvalidMoveError(
+                message='First placement must go through the center field.',
+                details={
+                    'center_field': center_field.position,
+                    'positions': positions,
+                },
+            )
+
+    # on any other move, tiles must be placed next to already placed tiles
+    elif not board.has_adjacent_tiles(positions):
+        raise InvalidMoveError(
+            message='Tiles must be placed next to already placed tiles.',
+            details={
+                'positions': positions,
+            },
+        )
+
+    return placed
+
+
+def _get_word_indexes(
+    board: Board,
+    tiles: Sequence[Tile | None],
+    placed: Mapping[int, Tile],
+    index: int,
+    *,
+    horizontal: bool,
+) -> Sequence[int]:
+    # occupied run through the cell, with the placed tiles overlaid on the board
+    row, column = divmod(index, board.columns)
+    if horizontal:
+        line, offset = board.geometry.row_lines[row], column
+    else:
+        line, offset = board.geometry.column_lines[column], row
+
+    start = end = offset
+
+    while start > 0 and (
+        tiles[line[start - 1]] is not None or line[start - 1] in placed
+    ):
+        start -= 1
+
+    while end + 1 < len(line) and (
+        tiles[line[end + 1]] is not None or line[end + 1] in placed
+    ):
+        end += 1
+
+    return line[start : end + 1]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from functools import cache
+
+from core.game.types import Position
+
+
+class BoardGeometry:
+    """Immutable geometry of a board with given dimensions.
+
+    Built once per `(rows, columns)` and shared by all boards of that size.
+    Cells are addressed by flat index `row * columns + column`.
+
+    Attributes:
+        rows (int): The number of rows.
+        columns (int): The number of columns.
+        positions (tuple[Position, ...]): Interned position of every cell, by index.
+        neighbours (tuple[tuple[int, ...], ...]): Indexes of orthogonal neighbours
+            of every cell, positions outside of the board are already left out.
+        row_lines (tuple[range, ...]): Indexes of the cells of every row.
+        column_lines (tuple[range, ...]): Indexes of the cells of every column.
+        center (int | None): Index of the center cell, None for even dimensions.
+    """
+
+    __slots__ = (
+        '_indexes',
+        'center',
+        'column_lines',
+        'columns',
+        'neighbours',
+        'positions',
+        'row_lines',
+        'rows',
+    )
+
+    def __init__(self, rows: int, columns: int) -> None:
+        if rows < 1 or columns < 1:
+            raise ValueError('Board must have at least one row and column.')
+
+        self.rows = rows
+        self.columns = columns
+
+        self.positions = tuple(
+            Position(row, column) for row in range(rows) for column in range(columns)
+        )
+        self._indexes = {
+            position: index for index, position in enumerate(self.positions)
+        }
+
+        self.neighbours = tuple(
+            tuple(
+                self._indexes[neighbour]
+                for neighbour in (
+                    Position(row, column - 1),
+                    Position(row, column + 1),
+                    Position(row - 1, column),
+                    Position(row + 1, column),
+                )
+                if neighbour in self._indexes
+            )
+            for row, column in self.positions
+        )
+
+        self.row_lines = tuple(
+            range(row * columns, (row + 1) * columns) for row in range(rows)
+        )
+        self.column_lines = tuple(
+            range(column, rows * columns, columns) for column in range(columns)
+        )
+
+        self.center = (
+            (rows // 2) * columns + columns // 2
+            if rows % 2 == 1 and columns % 2 == 1
+            else None
+        )
+
+    @staticmethod
+    @cache
+    def get(rows: int, columns: int) -> BoardGeometry:
+        """Returns the shared geometry for the given board dimensions."""
+        return BoardGeometry(rows, columns)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def index_of(self, position: tuple[int, int]) -> int | None:
+        """Returns the index of the position, or None if it lies outside of the board."""
+        return self._indexes.get(position)
+
+    def __repr__(self) -> str:
+        return f'BoardGeometry(rows={self.rows}, columns={self.columns})'
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Iterable
+from typing import ClassVar
+
+from core.game.enums import FieldType
+from core.game.geometry import BoardGeometry
+
+# multipliers by `FieldType` value
+LETTER_MULTIPLIERS = bytes([1, 2, 3, 1, 1])
+WORD_MULTIPLIERS = bytes([1, 1, 1, 2, 3])
+
+_FIELD_TYPES = tuple(FieldType)
+
+
+class BoardLayout:
+    """Immutable board layout, interned in a registry keyed by a hash of its content.
+
+    Every game played on the same layout shares one instance, including the per-cell
+    multiplier tables used for scoring. Use `BoardLayout.get` to obtain one.
+
+    Attributes:
+        key (str): Content hash of the layout.
+        geometry (BoardGeometry): Geometry of the layout's dimensions.
+        field_types (bytes): `FieldType` value of every cell, by flat index.
+        letter_multipliers (bytes): Letter multiplier of every cell, by flat index.
+        word_multipliers (bytes): Word multiplier of every cell, by flat index.
+    """
+
+    __slots__ = (
+        'field_types',
+        'geometry',
+        'key',
+        'letter_multipliers',
+        'word_multipliers',
+    )
+
+    _registry: ClassVar[dict[str, BoardLayout]] = {}
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, key: str, rows: int, columns: int, field_types: bytes) -> None:
+        self.key = key
+        self.geometry = BoardGeometry.get(rows, columns)
+        self.field_types = field_types
+        self.letter_multipliers = field_types.translate(LETTER_MULTIPLIERS.ljust(256))
+        self.word_multipliers = field_types.translate(WORD_MULTIPLIERS.ljust(256))
+
+    @property
+    def rows(self) -> int:
+        return self.geometry.rows
+
+    @property
+    def columns(self) -> int:
+        return self.geometry.columns
+
+    @staticmethod
+    def get(board_layout: Iterable[Iterable[FieldType]] | BoardLayout) -> BoardLayout:
+        """Returns the shared layout with the given content, registering it on first use.
+
+        Raises:
+            ValueError: If the layout is empty or not rectangular.
+        """
+        if isinstance(board_layout, BoardLayout):
+            return board_layout
+
+        rows = [bytes(row) for row in board_layout]
+
+        if len(rows) == 0 or len(rows[0]) == 0:
+            raise ValueError('Board layout must have at least one row and column.')
+
+        if not all(len(row) == len(rows[0]) for row in rows):
+            raise ValueError(
+                'Board layout must be a rectangular grid (all rows must have the same length).'
+            )
+
+        field_types = b''.join(rows)
+        if max(field_types) >= len(_FIELD_TYPES):
+            raise ValueError('Board layout contains unknown field types.')
+
+        key = hashlib.blake2b(
+            f'{len(rows)}x{len(rows[0])}:'.encode() + field_types, digest_size=16
+        ).hexdigest()
+
+        if (layout := BoardLayout._registry.get(key)) is not None:
+            return layout
+
+        with BoardLayout._registry_lock:
+            return BoardLayout._registry.setdefault(
+                key, BoardLayout(key, len(rows), len(rows[0]), field_types)
+            )
+
+    def get_field_type(self, index: int) -> FieldType:
+        return _FIELD_TYPES[self.field_types[index]]
+
+    def to_grid(self) -> list[list[FieldType]]:
+        """Returns the layout as a grid of field types."""
+        return [
+            [_FIELD_TYPES[self.field_types[index]] for index in line]
+            for line in self.geometry.row_lines
+        ]
+
+    def __repr__(self) -> str:
+        return (
+            f'BoardLayout(key={self.key!r}, rows={self.rows}, columns={self.columns})'
+        )
@@ -0,0 +1,393 @@
+"""Generation of all legal placements of a rack on a board.
+
+The generator follows Appel and Jacobson, "The World's Fastest Scrabble Program":
+moves are built along one line at a time, starting at anchors, the empty cells next
+to placed tiles. For every anchor a left part is formed from rack tiles on the empty
+cells to the left of it, which are not anchors themselves, or taken from the tiles
+already there, and extended to the right through the anchor while the letters
+follow a path in the DAWG. Cross-checks, the letters which form valid perpendicular
+words on an empty cell, prune the extension. Each move is found exactly once,
+from the leftmost anchor it covers.
+
+Scores follow the same rules as `evaluate_placement`, they are accumulated while
+the move is built instead of reading the words back from the board.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from core.game.alphabet import BLANK
+from core.game.cross_checks import CrossChecks, CrossCheckTable
+from core.game.evaluation import BINGO_BONUS
+from core.game.objects.board import Board
+from core.game.types import Position
+from core.lexicon.graph import LexiconGraph
+
+# word prefix formed from the rack: lexicon node, letter codes, which tiles are
+# blanks and the mask of letters the rest of the rack can continue it with
+LeftPart = tuple[int, bytes, tuple[bool, ...], int]
+
+
+@dataclass(frozen=True, slots=True)
+class GeneratedMove:
+    """Placement found by the move generator.
+
+    Attributes:
+        positions (tuple[Position, ...]): Positions of the new tiles, in reading order.
+        letters (bytes): Letter codes of the new tiles, blanks have their chosen letters.
+        blanks (tuple[bool, ...]): Whether each new tile is a blank.
+        horizontal (bool): Whether the main word of the move is horizontal.
+        score (int): Score of the move.
+    """
+
+    positions: tuple[Position, ...]
+    letters: bytes
+    blanks: tuple[bool, ...]
+    horizontal: bool
+    score: int
+
+
+class MoveGenerator:
+    """Generates legal placements of a rack using a DAWG lexicon.
+
+    Moves are those which a game with the same lexicon and rules accepts, whose main
+    word is at least `min_word_length` letters long. Placements which form no word
+    long enough to be checked, e.g. a single tile on an empty board, are left out.
+
+    Args:
+        lexicon (LexiconGraph): DAWG of valid words, with the game's letter codes.
+        letter_points (Sequence[int]): Points of every letter code, e.g. `Alphabet.points`.
+        tiles_per_round (int): Size of a full rack, using all of it gives a bingo.
+        min_word_length (int): Minimum length of a word to be checked and scored.
+    """
+
+    def __init__(
+        self,
+        lexicon: LexiconGraph,
+        letter_points: Sequence[int],
+        *,
+        tiles_per_round: int = 7,
+        min_word_length: int = 2,
+    ) -> None:
+        self.lexicon = lexicon
+        self.letter_points = tuple(letter_points)
+        self.tiles_per_round = tiles_per_round
+        self.min_word_length = min_word_length
+
+        # outgoing edges of the visited lexicon nodes, the lexicon is immutable
+        self._arcs: dict[int, dict[int, int]] = {}
+
+    def get_arcs(self, node: int) -> dict[int, int]:
+        """Returns children of the node by letter code, memoized."""
+        if (arcs := self._arcs.get(node)) is None:
+            arcs = self._arcs[node] = dict(self.lexicon.arcs(node))
+
+        return arcs
+
+    def generate(
+        self,
+        board: Board,
+        rack: Sequence[int],
+        *,
+        cross_checks: tuple[CrossChecks, CrossChecks] | None = None,
+        deadline: float | None = None,
+    ) -> list[GeneratedMove]:
+        """Generates all legal placements of the rack on the board.
+
+        Cross-checks are the given ones, otherwise they come from the table attached
+        to the board if it uses the same lexicon and rules, otherwise they are
+        computed for the whole board.
+
+        Args:
+            board (Board): Board to place the tiles on.
+            rack (Sequence[int]): Number of rack tiles of every letter code, blanks
+                under `BLANK`, e.g. `Player.letter_counts`.
+            cross_checks (tuple[CrossChecks, CrossChecks] | None): Cross-checks of
+                the board for horizontal and vertical moves, computed with the
+                lexicon and rules of the generator, e.g. by `decode_position`.
+            deadline (float | None): `time.monotonic()` value after which the search
+                stops and returns the moves found so far. It is checked before
+                every left part, so the search overruns it by milliseconds at most.
+
+        Returns:
+            list[GeneratedMove]: Every legal placement with its score.
+        """
+        anchors = set(board.get_anchors())
+        if not anchors:
+            return []
+
+        if cross_checks is None:
+            table = board.cross_checks
+            if (
+                table is None
+                or table.lexicon is not self.lexicon
+                or table.min_word_length != self.min_word_length
+            ):
+                table = CrossCheckTable(
+                    self.lexicon, board.geometry, min_word_length=self.min_word_length
+                )
+                table.rebuild(board)
+
+            cross_checks = (table.get(horizontal=True), table.get(horizontal=False))
+
+        counts = bytearray(rack)
+        left_parts = self._get_left_parts(bytes(rack))
+        moves: list[GeneratedMove] = []
+        geometry = board.geometry
+
+        for horizontal, lines, checks in (
+            (True, geometry.row_lines, cross_checks[0]),
+            (False, geometry.column_lines, cross_checks[1]),
+        ):
+            for line in lines:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return moves
+
+                if any(index in anchors for index in line):
+                    self._generate_line(
+                        board,
+                        line,
+                        anchors,
+                        checks,
+                        counts,
+                        left_parts,
+                        horizontal,
+                        moves,
+                        deadline,
+                    )
+
+        return moves
+
+    def _get_left_parts(self, rack: bytes) -> list[LeftPart]:
+        # word prefixes which the rack can form and extend with one more tile, sorted
+        # by length; they are the same for every anchor, only the number of free
+        # cells before it differs
+        get_arcs = self.get_arcs
+        limit = min(sum(rack), self.tiles_per_round) - 1
+        level = [(self.lexicon.root, b'', (), rack)]
+        parts: list[LeftPart] = []
+
+        for length in range(limit + 1):
+            next_level = []
+
+            for node, codes, blanks, remaining in level:
+                # letters which the rest of the rack can place next
+                next_mask = 0
+
+                for code, child in get_arcs(node).items():
+                    for rack_code, blank in ((code, False), (BLANK, True)):
+                        if not remaining[rack_code]:
+                            continue
+
+                        next_mask |= 1 << code
+                        if length == limit:
+                            continue
+
+                        left = bytearray(remaining)
+                        left[rack_code] -= 1
+                        next_level.append(
+                            (child, codes + bytes((code,)), (*blanks, blank), left)
+                        )
+
+                if next_mask:
+                    parts.append((node, codes, blanks, next_mask))
+
+            level = next_level
+
+        return parts
+
+    def _generate_line(
+        self,
+        board: Board,
+        line: range,
+        anchors: set[int],
+        checks: CrossChecks,
+        rack: bytearray,
+        left_parts: list[LeftPart],
+        horizontal: bool,
+        moves: list[GeneratedMove],
+        deadline: float | None,
+    ) -> None:
+        lexicon = self.lexicon
+        get_arcs = self.get_arcs
+        is_terminal = lexicon.is_terminal
+        letter_points = self.letter_points
+        min_length = self.min_word_length
+        bingo_size = self.tiles_per_round
+
+        tiles = board.get_tiles()
+        board_letters = board.get_letters()
+        size = len(line)
+
+        # line state by offset, letter code of the tile on the cell or -1 if empty
+        letters = [board_letters[i] if tiles[i] is not None else -1 for i in line]
+        points = [
+            tile.points if tile is not None else 0
+            for tile in map(tiles.__getitem__, line)
+        ]
+        positions = [board.geometry.positions[i] for i in line]
+        letter_multipliers = [board.layout.letter_multipliers[i] for i in line]
+        word_multipliers = [board.layout.word_multipliers[i] for i in line]
+        masks = [checks.masks[i] for i in line]
+        cross_scores = [checks.scores[i] for i in line]
+
+        # new tiles of the move being built, they fill the empty cells from `start`
+        placed_codes: list[int] = []
+        placed_blanks: list[bool] = []
+        start = anchor = 0
+
+        def record(offset: int, total: int) -> None:
+            new = [i for i in range(start, offset) if letters[i] < 0]
+
+            # a single tile forming a checked perpendicular word is a move of the
+            # other direction too, it is reported by the horizontal pass only
+            if len(new) == 1 and not horizontal and cross_scores[new[0]] >= 0:
+                return
+
+            if len(new) == bingo_size:
+                total += BINGO_BONUS
+
+            moves.append(
+                GeneratedMove(
+                    tuple(map(positions.__getitem__, new)),
+                    bytes(placed_codes),
+                    tuple(placed_blanks),
+                    horizontal,
+                    total,
+                )
+            )
+
+        def extend_right(
+            offset: int, node: int, score: int, multiplier: int, cross: int
+        ) -> None:
+            # tiles already on the board are part of the word
+            while offset < size and (letter := letters[offset]) >= 0:
+                if (next_node := get_arcs(node).get(letter)) is None:
+                    return
+
+                node = next_node
+                score += points[offset]
+                offset += 1
+
+            if offset > anchor and offset - start >= min_length and is_terminal(node):
+                record(offset, score * multiplier + cross)
+
+            if offset == size:
+                return
+
+            allowed = masks[offset]
+            letter_multiplier = letter_multipliers[offset]
+            word_multiplier = word_multipliers[offset]
+            cross_score = cross_scores[offset]
+            multiplier *= word_multiplier
+
+            for code, child in get_arcs(node).items():
+                if not (allowed >> code) & 1:
+                    continue
+
+                if rack[code]:
+                    tile_score = letter_points[code] * letter_multiplier
+                    rack[code] -= 1
+                    placed_codes.append(code)
+                    placed_blanks.append(False)
+
+                    extend_right(
+                        offset + 1,
+                        child,
+                        score + tile_score,
+                        multiplier,
+                        cross + (cross_score + tile_score) * word_multiplier
+                        if cross_score >= 0
+                        else cross,
+                    )
+
+                    placed_codes.pop()
+                    placed_blanks.pop()
+                    rack[code] += 1
+
+                if rack[BLANK]:
+                    rack[BLANK] -= 1
+                    placed_codes.append(code)
+                    placed_blanks.append(True)
+
+                    extend_right(
+                        offset + 1,
+                        child,
+                        score,
+                        multiplier,
+                        cross + cross_score * word_multiplier
+                        if cross_score >= 0
+                        else cross,
+                    )
+
+                    placed_codes.pop()
+                    placed_blanks.pop()
+                    rack[BLANK] += 1
+
+        for anchor in range(size):
+            if line[anchor] not in anchors:
+                continue
+
+            if anchor > 0 and letters[anchor - 1] >= 0:
+                # the left part is the word already on the board before the anchor
+                start = anchor - 1
+                while start > 0 and letters[start - 1] >= 0:
+                    start -= 1
+
+                node: int | None = lexicon.root
+                for offset in range(start, anchor):
+                    if (node := get_arcs(node).get(letters[offset])) is None:
+                        break
+
+                if node is not None:
+                    extend_right(anchor, node, sum(points[start:anchor]), 1, 0)
+                continue
+
+            # empty cells before the anchor up to the previous anchor; the left part
+            # lies on them and they have no neighbours, so there are no cross words
+            limit = 0
+            while (
+                limit < anchor
+                and letters[anchor - limit - 1] < 0
+                and line[anchor - limit - 1] not in anchors
+            ):
+                limit += 1
+
+            allowed = masks[anchor]
+
+            for node, codes, blanks, next_mask in left_parts:
+                if len(codes) > limit:
+                    break
+
+                if not next_mask & allowed:
+                    continue
+
+                if deadline is not None and time.monotonic() >= deadline:
+                    return
+
+                start = anchor - len(codes)
+                score = 0
+                multiplier = 1
+
+                for offset, code, blank in zip(
+                    range(start, anchor), codes, blanks, strict=True
+                ):
+                    if blank:
+                        rack[BLANK] -= 1
+                    else:
+                        rack[code] -= 1
+                        score += letter_points[code] * letter_multipliers[offset]
+                    multiplier *= word_multipliers[offset]
+
+                placed_codes.extend(codes)
+                placed_blanks.extend(blanks)
+
+                extend_right(anchor, node, score, multiplier, 0)
+
+                placed_codes.clear()
+                placed_blanks.clear()
+                for code, blank in zip(codes, blanks, strict=True):
+                    rack[BLANK if blank else code] += 1
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Operation:
+    """Single reversible change of the game state.
+
+    Attributes:
+        apply (Callable[[], object]): Applies the change, must be deterministic so it can be redone.
+        revert (Callable[[], object]): Reverts the change.
+    """
+
+    apply: Callable[[], object]
+    revert: Callable[[], object]
+
+
+class Transaction:
+    """Ordered list of operations applied as one move."""
+
+    def __init__(self) -> None:
+        self._operations: list[Operation] = []
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def record(self, apply: Callable[[], object], revert: Callable[[], object]) -> None:
+        """Records a change that has already been applied."""
+        self._operations.append(Operation(apply, revert))
+
+    def rollback(self) -> None:
+        """Reverts all operations, last one first. Costs O(operations)."""
+        for operation in reversed(self._operations):
+            operation.revert()
+
+    def replay(self) -> None:
+        """Applies all operations again, first one first."""
+        for operation in self._operations:
+            operation.apply()
+
+
+class MoveLog:
+    """Log of applied moves that can be undone and redone.
+
+    Every move runs in a transaction, if it raises, all its operations applied so far
+    are rolled back and the move is not logged.
+    """
+
+    def __init__(self) -> None:
+        self._undo_stack: list[Transaction] = []
+        self._redo_stack: list[Transaction] = []
+        self._transaction: Transaction | None = None
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo_stack)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo_stack)
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._transaction is not None
+
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        if self._transaction is not None:
+            raise RuntimeError('Transaction is already in progress.')
+
+        self._transaction = transaction = Transaction()
+
+        try:
+            yield transaction
+        except BaseException:
+            transaction.rollback()
+            raise
+        finally:
+            self._transaction = None
+
+        self._undo_stack.append(transaction)
+        self._redo_stack.clear()
+
+    def apply[T](self, apply: Callable[[], T], revert: Callable[[], object]) -> T:
+        """Applies the change and records it in the current transaction, if there is one."""
+        result = apply()
+        self.record(apply, revert)
+
+        return result
+
+    def record(self, apply: Callable[[], object], revert: Callable[[], object]) -> None:
+        """Records an already applied change in the current transaction, if there is one."""
+        if self._transaction is not None:
+            self._transaction.record(apply, revert)
+
+    def undo(self) -> None:
+        if self._transaction is not None:
+            raise RuntimeError('Cannot undo while a transaction is in progress.')
+
+        transaction = self._undo_stack.pop()
+        transaction.rollback()
+        self._redo_stack.append(transaction)
+
+    def redo(self) -> None:
+        if self._transaction is not None:
+            raise RuntimeError('Cannot redo while a transaction is in progress.')
+
+        transaction = self._redo_stack.pop()
+        transaction.replay()
+        self._undo_stack.append(transaction)
@@ -1,36 +1,246 @@
-from collections.abc import Iterable, Iterator
+from __future__ import annotations
+
+import copy
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from typing import Literal, overload
 
+from core.game.cross_checks import CrossCheckTable
 from core.game.enums import FieldType
+from core.game.geometry import BoardGeometry
+from core.game.layout import BoardLayout
 from core.game.objects.field import Field
 from core.game.objects.tile import Tile
-from core.game.types import Grid, Position
+from core.game.types import Position
+
+
+@dataclass(frozen=True, slots=True)
+class Placement:
+    """Journal entry describing tiles set on the board in a single move.
+
+    Attributes:
+        move (int): Number of the move in which the tiles were placed.
+        player_id (str | None): ID of the player who placed the tiles, if known.
+        positions (tuple[Position, ...]): Positions of the placed tiles.
+    """
+
+    move: int
+    player_id: str | None
+    positions: tuple[Position, ...]
 
 
 class Board:
-    def __init__(self, board_layout: Iterable[Iterable[FieldType]]) -> None:
-        fields = [
-            Field(position=Position(i, j), type=cell)
-            for i, row in enumerate(board_layout)
-            for j, cell in enumerate(row)
-        ]
+    """Game board backed by flat buffers indexed by `row * columns + column`.
+
+    Field types, tiles, letter codes and "recently placed" flags are kept in one flat
+    buffer each.
+    `Field` objects are only views over these buffers and are created on request.
+    Occupancy is additionally tracked as integer bitmasks per row and per column,
+    so placement checks can be done with a few bitwise operations, and every
+    occupied cell knows the extent of the horizontal and vertical word going through it.
+    """
+
+    def __init__(
+        self, board_layout: Iterable[Iterable[FieldType]] | BoardLayout
+    ) -> None:
+        # layout and geometry are shared by all boards of the same layout
+        self._layout = BoardLayout.get(board_layout)
+        self._geometry = self._layout.geometry
+        self._rows = self._geometry.rows
+        self._columns = self._geometry.columns
+
+        self._types = self._layout.field_types
+        self._tiles: list[Tile | None] = [None] * len(self._types)
+        # letter code of every cell's tile, only meaningful for occupied cells
+        self._letters = bytearray(len(self._types))
+        self._recent = bytearray(len(self._types))
+
+        # occupancy bitboards, bit `column` of a row mask / bit `row` of a column mask
+        self._row_masks = [0] * self._rows
+        self._column_masks = [0] * self._columns
+        self._tile_count = 0
+
+        # anchors, empty cells next to a tile, as a bitmask of columns per row
+        self._anchor_masks = [0] * self._rows
+        self._full_row_mask = (1 << self._columns) - 1
+
+        # cross-checks for move generation, updated line by line when attached
+        self._cross_checks: CrossCheckTable | None = None
+
+        # word extent index, for every occupied cell the first and last offset of the
+        # occupied run going through it, within its row and within its column
+        cells = len(self._types)
+        self._row_run_starts = array('H', bytes(2 * cells))
+        self._row_run_ends = array('H', bytes(2 * cells))
+        self._column_run_starts = array('H', bytes(2 * cells))
+        self._column_run_ends = array('H', bytes(2 * cells))
+
+        # placement journal, recently placed flags are reset only where they were set
+        self._placements: list[Placement] = []
+        self._recent_indexes: list[int] = []
 
-        self._grid = Grid.from_flat(fields)
+        # incremented on every change of tiles, lets callers cache derived data
+        self._version = 0
+
+        # set when mutable buffers are shared with a snapshot, see `snapshot`
+        self._shared = False
+
+    def snapshot(self) -> Board:
+        """Returns a copy-on-write snapshot of the board.
+
+        Taking a snapshot is O(1), the board and the snapshot share their buffers until
+        either of them is modified, then the modified one copies them. Snapshots can be
+        used to place tiles hypothetically, e.g. to score a move without touching the game.
+        """
+        snapshot = copy.copy(self)
+        self._shared = snapshot._shared = True
+
+        return snapshot
+
+    def _own_buffers(self) -> None:
+        if not self._shared:
+            return
+
+        self._tiles = self._tiles.copy()
+        self._letters = self._letters.copy()
+        self._recent = self._recent.copy()
+        self._row_masks = self._row_masks.copy()
+        self._column_masks = self._column_masks.copy()
+        self._anchor_masks = self._anchor_masks.copy()
+        if self._cross_checks is not None:
+            self._cross_checks = self._cross_checks.copy()
+        self._row_run_starts = array('H', self._row_run_starts)
+        self._row_run_ends = array('H', self._row_run_ends)
+        self._column_run_starts = array('H', self._column_run_starts)
+        self._column_run_ends = array('H', self._column_run_ends)
+        self._placements = self._placements.copy()
+        self._recent_indexes = self._recent_indexes.copy()
+
+        self._shared = False
 
     @property
     def rows(self) -> int:
-        return self._grid.rows
+        return self._rows
 
     @property
     def columns(self) -> int:
-        return self._grid.columns
+        return self._columns
 
     @property
     def size(self) -> tuple[int, int]:
-        return self._grid.size
+        return self._rows, self._columns
+
+    @property
+    def layout(self) -> BoardLayout:
+        return self._layout
+
+    @property
+    def geometry(self) -> BoardGeometry:
+        return self._geometry
+
+    def index_of(self, position: Position) -> int | None:
+        """Returns the flat index of the position, or None if it lies outside of the board."""
+        return self._geometry.index_of(position)
+
+    @property
+    def version(self) -> int:
+        """Returns the number of tile changes made on the board so far."""
+        return self._version
+
+    @property
+    def is_empty(self) -> bool:
+        return self._tile_count == 0
+
+    def get_row_mask(self, row: int) -> int:
+        """Returns occupancy of the row as a bitmask, bit `n` is set if column `n` has a tile."""
+        return self._row_masks[row]
+
+    def get_column_mask(self, column: int) -> int:
+        """Returns occupancy of the column as a bitmask, bit `n` is set if row `n` has a tile."""
+        return self._column_masks[column]
+
+    def has_adjacent_tiles(self, positions: Iterable[Position]) -> bool:
+        """Checks if any already placed tile is directly next to one of the given positions.
+        Positions outside of the board are ignored.
+        """
+        placed_masks: dict[int, int] = {}
+
+        for row, column in positions:
+            if 0 <= row < self._rows and 0 <= column < self._columns:
+                placed_masks[row] = placed_masks.get(row, 0) | (1 << column)
+
+        for row, mask in placed_masks.items():
+            if self._row_masks[row] & ((mask << 1) | (mask >> 1)):
+                return True
+            if row > 0 and self._row_masks[row - 1] & mask:
+                return True
+            if row + 1 < self._rows and self._row_masks[row + 1] & mask:
+                return True
+
+        return False
+
+    def get_anchor_mask(self, row: int) -> int:
+        """Returns anchors of the row as a bitmask, bit `n` is set if column `n` is empty
+        and next to a tile. The center of an empty board is not included.
+        """
+        return self._anchor_masks[row]
+
+    def get_anchors(self) -> list[int]:
+        """Returns indexes of the cells where a move can start, the empty cells next
+        to a tile, or the center field on an empty board.
+        """
+        if self.is_empty:
+            center = self._geometry.center
+            return [center] if center is not None else []
+
+        anchors = []
+
+        for row, mask in enumerate(self._anchor_masks):
+            offset = row * self._columns
+            while mask:
+                bit = mask & -mask
+                anchors.append(offset + bit.bit_length() - 1)
+                mask ^= bit
+
+        return anchors
+
+    @property
+    def cross_checks(self) -> CrossCheckTable | None:
+        """Returns the attached cross-check table, see `attach_cross_checks`."""
+        return self._cross_checks
+
+    def attach_cross_checks(self, table: CrossCheckTable | None) -> None:
+        """Attaches a cross-check table to the board, or detaches it if None.
+
+        The table is rebuilt for the current tiles, then every placement and revert
+        recomputes only the rows and columns of the changed cells.
+
+        Raises:
+            ValueError: If the table was made for boards of another size.
+        """
+        if table is not None:
+            if table.geometry is not self._geometry:
+                raise ValueError('Cross-check table does not match the board size.')
+
+            table.rebuild(self)
+
+        self._cross_checks = table
+
+    def get_tiles(self) -> tuple[Tile | None, ...]:
+        """Returns tiles of all cells by flat index, None for empty cells."""
+        return tuple(self._tiles)
+
+    def get_letters(self) -> bytes:
+        """Returns letter codes of all cells by flat index, 0 for empty cells.
+        Use occupancy to tell empty cells apart, a blank without a letter has code 0 too.
+        """
+        return bytes(self._letters)
 
     def get_fields(self) -> Iterator[Field]:
-        yield from self._grid
+        for index in range(len(self._types)):
+            yield Field(self, index)
 
     @property
     def center_field(self) -> Field:
@@ -42,13 +252,10 @@ class Board:
                 'Board does not have a center field. Board has even dimensions.'
             )
 
-        center_row = self.rows // 2
-        center_column = self.columns // 2
+        if self._geometry.center is None:
+            raise IndexError('Board does not have a center field.')
 
-        try:
-            return self.get_field(center_row, center_column)
-        except IndexError as e:
-            raise IndexError('Board does not have a center field.') from e
+        return Field(self, self._geometry.center)
 
     def get_horizontal_fields(self, start: Position) -> Iterator[Field]:
         return self._get_fields_by_orientation(start, 'horizontal')
@@ -59,44 +266,41 @@ class Board:
     def _get_fields_by_orientation(
         self, start: Position, orientation: Literal['horizontal', 'vertical']
     ) -> Iterator[Field]:
-        if orientation == 'horizontal':
-            directions = [(0, 1), (0, -1)]
-        elif orientation == 'vertical':
-            directions = [(1, 0), (-1, 0)]
-        else:
+        if orientation not in ('horizontal', 'vertical'):
             raise ValueError(
                 f'Invalid orientation: {orientation!r}. Expected "horizontal" or "vertical".'
             )
 
-        seen: set[Position] = set()
-
-        for direction in directions:
-            for field in self._get_fields_in_direction(start, direction):
-                if field.position in seen:
-                    continue
+        index = self._geometry.index_of(start)
+        if index is None:
+            return
 
-                yield field
-                seen.add(field.position)
+        word = self.get_word_indexes(index, horizontal=orientation == 'horizontal')
+        if not word:
+            return
 
-    def _get_fields_in_direction(
-        self, start: Position, direction: tuple[int, int]
-    ) -> Iterator[Field]:
-        if direction == (0, 0):
-            return start
-
-        position = start
+        # starting field first, then forward and backward
+        split = word.index(index)
+        yield from (Field(self, i) for i in word[split:])
+        yield from (Field(self, i) for i in reversed(word[:split]))
 
-        while True:
-            try:
-                field = self.get_field(position)
-            except IndexError:
-                break
+    def get_word_indexes(self, index: int, *, horizontal: bool) -> Sequence[int]:
+        """Returns indexes of the occupied run of cells going through the given cell,
+        in reading order. An empty cell gives an empty sequence.
+        This is a lookup in the word extent index, no cells are scanned.
+        """
+        if self._tiles[index] is None:
+            return range(0)
 
-            if field.tile is None:
-                break
-
-            yield field
-            position += direction
+        row, column = divmod(index, self._columns)
+        if horizontal:
+            line = self._geometry.row_lines[row]
+            return line[self._row_run_starts[index] : self._row_run_ends[index] + 1]
+        else:
+            line = self._geometry.column_lines[column]
+            return line[
+                self._column_run_starts[index] : self._column_run_ends[index] + 1
+            ]
 
     @overload
     def get_field(self, position: Position, /) -> Field: ...
@@ -107,26 +311,209 @@ class Board:
     def get_field(
         self, position_or_row: int | Position, column: int | None = None, /
     ) -> Field:
-        match (position_or_row, column):
-            case (Position(), None):
-                position = position_or_row
-                return self._grid[position]
-            case (int(), int()):
-                row, column = position_or_row, column
-                return self._grid[row, column]
-            case _:
-                raise TypeError(
-                    f'Invalid arguments: {position_or_row}, {column}. '
-                    'Expected Position or (row, column) pair.'
-                )
-
-    def place_tiles(self, tile_positions: list[tuple[Tile, Position]]) -> list[Field]:
+        if column is None and isinstance(position_or_row, Position):
+            row, column = position_or_row
+        elif isinstance(position_or_row, int) and isinstance(column, int):
+            row = position_or_row
+        else:
+            raise TypeError(
+                f'Invalid arguments: {position_or_row}, {column}. '
+                'Expected Position or (row, column) pair.'
+            )
+
+        return Field(self, self._get_index(row, column))
+
+    def place_tiles(
+        self,
+        tile_positions: list[tuple[Tile, Position]],
+        *,
+        move: int | None = None,
+        player_id: str | None = None,
+    ) -> list[Field]:
+        """Places tiles on the board and records the placement in the journal.
+
+        Args:
+            tile_positions (list[tuple[Tile, Position]]): Tiles with their target positions.
+            move (int | None): Number of the move, defaults to the next journal entry number.
+            player_id (str | None): ID of the player placing the tiles.
+
+        Returns:
+            list[Field]: Fields the tiles were placed on.
+        """
+        indexes = [self._get_index(row, column) for _, (row, column) in tile_positions]
         fields: list[Field] = []
 
-        for tile, position in tile_positions:
-            field = self.get_field(position)
-            field.tile = tile
-            field.is_tile_recently_placed = True
-            fields.append(field)
+        self._own_buffers()
+
+        for (tile, _), index in zip(tile_positions, indexes):
+            self._set_tile(index, tile)
+            self._set_recent(index, True)
+            fields.append(Field(self, index))
+
+        if self._cross_checks is not None:
+            self._cross_checks.update(self, indexes)
+
+        if move is None:
+            move = self._placements[-1].move + 1 if self._placements else 0
+
+        self._placements.append(
+            Placement(
+                move=move,
+                player_id=player_id,
+                positions=tuple(self._geometry.positions[index] for index in indexes),
+            )
+        )
 
         return fields
+
+    def last_placement(self) -> Placement | None:
+        """Returns the most recent placement, or None if no tiles were placed yet."""
+        return self._placements[-1] if self._placements else None
+
+    def placements_since(self, move: int) -> list[Placement]:
+        """Returns placements made in the given move or later, oldest first."""
+        start = bisect_left(self._placements, move, key=lambda x: x.move)
+        return self._placements[start:]
+
+    def revert_last_placement(self) -> Placement:
+        """Removes tiles of the most recent placement from the board and the journal.
+
+        Raises:
+            IndexError: If there is no placement to revert.
+        """
+        if not self._placements:
+            raise IndexError('There is no placement to revert.')
+
+        self._own_buffers()
+        placement = self._placements.pop()
+        indexes = [self._get_index(*position) for position in placement.positions]
+
+        for index in indexes:
+            self._set_tile(index, None)
+            self._set_recent(index, False)
+
+        if self._cross_checks is not None:
+            self._cross_checks.update(self, indexes)
+
+        return placement
+
+    def clear_recently_placed(self) -> list[int]:
+        """Resets the "recently placed" flag of all fields, costs O(tiles placed since the last reset).
+
+        Returns:
+            list[int]: Indexes of the fields whose flag was reset.
+        """
+        self._own_buffers()
+
+        indexes = [index for index in self._recent_indexes if self._recent[index]]
+        for index in indexes:
+            self._recent[index] = False
+
+        self._recent_indexes.clear()
+
+        return indexes
+
+    def mark_recently_placed(self, indexes: Iterable[int]) -> None:
+        """Sets the "recently placed" flag of the fields with given indexes."""
+        for index in indexes:
+            self._set_recent(index, True)
+
+    def _set_recent(self, index: int, value: bool) -> None:
+        self._own_buffers()
+
+        if value and not self._recent[index]:
+            self._recent_indexes.append(index)
+
+        self._recent[index] = value
+
+    def _set_tile(self, index: int, tile: Tile | None) -> None:
+        self._own_buffers()
+
+        row, column = divmod(index, self._columns)
+        bit = 1 << column
+
+        was_occupied = self._tiles[index] is not None
+        self._tiles[index] = tile
+        self._letters[index] = tile.code if tile is not None else 0
+        self._version += 1
+
+        if tile is not None and not was_occupied:
+            self._row_masks[row] |= bit
+            self._column_masks[column] |= 1 << row
+            self._tile_count += 1
+        elif tile is None and was_occupied:
+            self._row_masks[row] &= ~bit
+            self._column_masks[column] &= ~(1 << row)
+            self._tile_count -= 1
+        else:
+            return
+
+        self._update_anchors(row)
+
+        self._update_runs(
+            self._geometry.row_lines[row],
+            column,
+            self._row_run_starts,
+            self._row_run_ends,
+        )
+        self._update_runs(
+            self._geometry.column_lines[column],
+            row,
+            self._column_run_starts,
+            self._column_run_ends,
+        )
+
+    def _update_anchors(self, row: int) -> None:
+        # occupancy of the row has just changed, anchors of the rows around it follow
+        masks = self._row_masks
+        full = self._full_row_mask
+
+        for r in range(max(row - 1, 0), min(row + 2, self._rows)):
+            mask = masks[r]
+            adjacent = (mask << 1) | (mask >> 1)
+            if r > 0:
+                adjacent |= masks[r - 1]
+            if r + 1 < self._rows:
+                adjacent |= masks[r + 1]
+
+            self._anchor_masks[r] = adjacent & ~mask & full
+
+    def _update_runs(
+        self, line: range, offset: int, starts: array[int], ends: array[int]
+    ) -> None:
+        # occupancy of the cell at `offset` has just changed, only the run(s)
+        # next to it need to be rewritten
+        tiles = self._tiles
+
+        has_previous = offset > 0 and tiles[line[offset - 1]] is not None
+        has_next = offset + 1 < len(line) and tiles[line[offset + 1]] is not None
+
+        if tiles[line[offset]] is not None:
+            start = starts[line[offset - 1]] if has_previous else offset
+            end = ends[line[offset + 1]] if has_next else offset
+
+            for index in line[start : end + 1]:
+                starts[index] = start
+                ends[index] = end
+            return
+
+        # cell was cleared, run is split into the parts before and after it
+        if has_previous:
+            start = starts[line[offset - 1]]
+            for index in line[start:offset]:
+                ends[index] = offset - 1
+
+        if has_next:
+            end = ends[line[offset + 1]]
+            for index in line[offset + 1 : end + 1]:
+                starts[index] = offset + 1
+
+    def _get_index(self, row: int, column: int) -> int:
+        index = self._geometry.index_of((row, column))
+
+        if index is None:
+            if not (0 <= row < self._rows):
+                raise IndexError(f'Row index {row} out of range.')
+            raise IndexError(f'Column index {column} out of range.')
+
+        return index
@@ -1,25 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from core.game.enums import FieldType
 from core.game.objects.tile import Tile
 from core.game.types import Position
 
+if TYPE_CHECKING:
+    from core.game.objects.board import Board
+
+_FIELD_TYPES = tuple(FieldType)
+
 
 class Field:
-    def __init__(
-        self, position: Position, type: FieldType, tile: Tile | None = None
-    ) -> None:
-        self.position = position
-        self.type = type
-        self.tile = tile
+    """Lightweight view of a single board cell.
+
+    Fields do not own any data, they read and write the flat buffers of the board
+    they were created from. Two views of the same cell compare equal.
+    """
+
+    __slots__ = ('_board', '_index')
+
+    def __init__(self, board: Board, index: int) -> None:
+        self._board = board
+        self._index = index
+
+    @property
+    def board(self) -> Board:
+        return self._board
+
+    @property
+    def index(self) -> int:
+        return self._index
 
-        self.is_tile_recently_placed: bool = False
+    @property
+    def position(self) -> Position:
+        return self._board.geometry.positions[self._index]
+
+    @property
+    def type(self) -> FieldType:
+        return _FIELD_TYPES[self._board._types[self._index]]
+
+    @property
+    def tile(self) -> Tile | None:
+        return self._board._tiles[self._index]
+
+    @tile.setter
+    def tile(self, tile: Tile | None) -> None:
+        self._board._set_tile(self._index, tile)
+
+    @property
+    def is_tile_recently_placed(self) -> bool:
+        return bool(self._board._recent[self._index])
+
+    @is_tile_recently_placed.setter
+    def is_tile_recently_placed(self, value: bool) -> None:
+        self._board._set_recent(self._index, value)
 
     @property
     def row(self) -> int:
-        return self.position.row
+        return self._index // self._board.columns
 
     @property
     def column(self) -> int:
-        return self.position.column
+        return self._index % self._board.columns
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Field):
+            return self._board is other._board and self._index == other._index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._board), self._index))
 
     def __repr__(self) -> str:
         return f'Field(position={self.position}, type={self.type}, tile={self.tile})'
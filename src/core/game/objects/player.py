@@ -1,3 +1,6 @@
+from collections.abc import Iterable, Sequence
+
+from core.game.alphabet import BLANK, MAX_CODES
 from core.game.objects.tile import Tile
 
 
@@ -6,9 +9,28 @@ class Player:
         self.name = name
         self.id = id
 
-        self.tiles: list[Tile] = []
+        # rack as a multiset: tiles in drawing order indexed by tile ID for constant
+        # time lookups, and the number of tiles of every letter code, blanks counted
+        # under `BLANK` whatever letter they were given
+        self._tiles: dict[int, Tile] = {}
+        self._letter_counts = bytearray(MAX_CODES)
         self.scores: list[int] = []
 
+    @property
+    def tiles(self) -> Sequence[Tile]:
+        return tuple(self._tiles.values())
+
+    @tiles.setter
+    def tiles(self, tiles: Iterable[Tile]) -> None:
+        self._tiles = {}
+        self._letter_counts = bytearray(MAX_CODES)
+        self.add_tiles(tiles)
+
+    @property
+    def letter_counts(self) -> bytes:
+        """Returns the number of rack tiles of every letter code, blanks under `BLANK`."""
+        return bytes(self._letter_counts)
+
     @property
     def score(self) -> int:
         return sum(self.scores)
@@ -17,40 +39,62 @@ class Player:
         self.scores.append(score)
 
     def add_tile(self, tile: Tile) -> None:
-        self.tiles.append(tile)
+        if tile.id in self._tiles:
+            raise ValueError(f"Tile with id {tile.id!r} is already in player's tiles.")
+
+        self._tiles[tile.id] = tile
+        self._letter_counts[BLANK if tile.is_blank else tile.code] += 1
 
-    def add_tiles(self, tiles: list[Tile]) -> None:
-        self.tiles.extend(tiles)
+    def add_tiles(self, tiles: Iterable[Tile]) -> None:
+        for tile in tiles:
+            self.add_tile(tile)
 
     def remove_tile(self, tile: Tile) -> None:
-        try:
-            self.tiles.remove(tile)
-        except ValueError as e:
-            raise ValueError("Tile not found in player's tiles.") from e
+        if not self.has_tile(tile):
+            raise ValueError("Tile not found in player's tiles.")
+
+        del self._tiles[tile.id]
+        self._letter_counts[BLANK if tile.is_blank else tile.code] -= 1
 
-    def remove_tiles(self, tiles: list[Tile]) -> None:
+    def remove_tiles(self, tiles: Iterable[Tile]) -> None:
         for tile in tiles:
             self.remove_tile(tile)
 
-    def replace_tiles(self, old: list[Tile], new: list[Tile]) -> None:
+    def replace_tiles(self, old: Iterable[Tile], new: Iterable[Tile]) -> None:
         self.remove_tiles(old)
         self.add_tiles(new)
 
     def has_tile(self, tile: Tile) -> bool:
-        return tile in self.tiles
+        return self._tiles.get(tile.id) is tile
+
+    def count_letter(self, code: int) -> int:
+        """Returns the number of rack tiles with the letter code, `BLANK` counts blanks."""
+        return self._letter_counts[code]
+
+    def can_form(self, codes: Iterable[int]) -> bool:
+        """Checks if the rack has tiles for all letter codes, blanks standing in for
+        missing letters. Costs O(letters + alphabet size).
+        """
+        counts = bytearray(self._letter_counts)
 
-    def get_tile_by_id(self, tile_id: str) -> Tile:
+        for code in codes:
+            if counts[code]:
+                counts[code] -= 1
+            elif counts[BLANK]:
+                counts[BLANK] -= 1
+            else:
+                return False
+
+        return True
+
+    def get_tile_by_id(self, tile_id: int) -> Tile:
         if not (tile := self.try_get_tile_by_id(tile_id)):
             raise ValueError(f"Tile with id {tile_id!r} not found in player's tiles.")
 
         return tile
 
-    def try_get_tile_by_id(self, tile_id: str) -> Tile | None:
-        for tile in self.tiles:
-            if tile.id == tile_id:
-                return tile
-
-        return None
+    def try_get_tile_by_id(self, tile_id: int) -> Tile | None:
+        return self._tiles.get(tile_id)
 
     def __repr__(self) -> str:
         return f'Player(name={self.name}, id={self.id}, score={self.score})'
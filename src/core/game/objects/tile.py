@@ -1,12 +1,21 @@
 class Tile:
-    def __init__(self, symbol: str, points: int, id: str) -> None:
-        self._symbol = symbol
+    """A tile with its letter code in the game's `Alphabet`.
+
+    A blank tile has code `BLANK` (0) until its player chooses a letter for it.
+    IDs are small integers, unique within a game, see `TileSet`.
+    Symbols are not stored, they are looked up in the alphabet at the protocol edge.
+    """
+
+    __slots__ = ('_code', '_points', 'id')
+
+    def __init__(self, code: int, points: int, id: int) -> None:
+        self._code = code
         self._points = points
         self.id = id
 
     @property
-    def symbol(self) -> str:
-        return self._symbol
+    def code(self) -> int:
+        return self._code
 
     @property
     def points(self) -> int:
@@ -16,11 +25,11 @@ class Tile:
     def is_blank(self):
         return self.points == 0
 
-    def set_blank_symbol(self, symbol: str) -> None:
+    def set_blank_code(self, code: int) -> None:
         if not self.is_blank:
-            raise ValueError('Cannot set blank symbol for a non-blank tile.')
+            raise ValueError('Cannot set blank letter for a non-blank tile.')
 
-        self._symbol = symbol
+        self._code = code
 
     def __repr__(self) -> str:
-        return f'Tile(symbol={self.symbol!r}, points={self.points!r})'
+        return f'Tile(code={self.code!r}, points={self.points!r})'
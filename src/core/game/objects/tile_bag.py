@@ -1,45 +1,132 @@
+from __future__ import annotations
+
 import random
-import uuid
-from collections.abc import Iterator
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import cache
+from itertools import accumulate
 
+from core.game.alphabet import BLANK, Alphabet
 from core.game.enums import Language
 from core.game.objects.tile import Tile
+from core.game.tile_sets import get_tile_distribution
+
+
+@dataclass(frozen=True, slots=True)
+class TileSet:
+    """Immutable template of a language's tiles, shared by all games in that language.
+
+    Tile `n` of a game has ID `n`, letter code `codes[n]` and points `points[n]`,
+    so a bag is filled with plain object creation, no IDs have to be generated.
+
+    Attributes:
+        alphabet (Alphabet): Letter encoding of the tiles.
+        codes (bytes): Letter code of every tile.
+        points (bytes): Points of every tile.
+    """
+
+    alphabet: Alphabet
+    codes: bytes
+    points: bytes
+
+    @staticmethod
+    @cache
+    def for_language(language: Language) -> TileSet:
+        """Returns the shared tile set of the language.
+
+        Raises:
+            ValueError: If the language has no tile set or its data file is invalid.
+        """
+        alphabet = Alphabet.for_language(language)
+        kinds = get_tile_distribution(language).kinds
+
+        return TileSet(
+            alphabet=alphabet,
+            codes=bytes(
+                alphabet.get_code(kind.symbol) or 0
+                for kind in kinds
+                for _ in range(kind.count)
+            ),
+            points=bytes(kind.points for kind in kinds for _ in range(kind.count)),
+        )
+
+    def create_tiles(self) -> list[Tile]:
+        """Returns new tiles of one bag."""
+        return [
+            Tile(code, points, index)
+            for index, (code, points) in enumerate(zip(self.codes, self.points))
+        ]
 
 
 def get_tiles_for_language(language: Language) -> list[Tile]:
-    match language:
-        case Language.POLISH:
-            return list(polish_tiles())
-        case _:
-            raise Exception('Unsupported language for tile bag')
-
-
-def polish_tiles() -> Iterator[Tile]:
-    # fmt: off
-    tile_value_map = {
-        0: [('?', 2)],
-        1: [('A', 9), ('E', 7), ('I', 8), ('N', 5), ('O', 6), ('R', 4), ('S', 4), ('W', 4), ('Z', 5)],
-        2: [('C', 3), ('D', 3), ('K', 3), ('L', 3), ('M', 3), ('P', 3), ('T', 3), ('Y', 4)],
-        3: [('B', 2), ('G', 2), ('H', 2), ('J', 2), ('Ł', 2), ('U', 2)],
-        5: [('Ą', 1), ('Ę', 1), ('F', 1), ('Ó', 1), ('Ś', 1), ('Ż', 1)],
-        6: [('Ć', 1)],
-        7: [('Ń', 1)],
-        9: [('Ź', 1)],
-    }
-    # fmt: on
-
-    for points, collection in tile_value_map.items():
-        for symbol, count in collection:
-            for _ in range(count):
-                yield Tile(symbol, points, str(uuid.uuid4()))
+    return TileSet.for_language(language).create_tiles()
+
+
+def draw_letters(counts: bytearray, n: int, rng: random.Random | None = None) -> bytes:
+    """Draws up to `n` letter codes from a bag given as counts of every letter code.
+
+    The bag is seen as its tiles sorted by letter code, distinct tile positions are
+    sampled and mapped to letter codes by a binary search over the cumulative counts.
+    That is the same as drawing tiles one by one from a shuffled bag, every pick
+    weighted by the remaining counts, and costs O(alphabet size + n log alphabet size)
+    when `n` is small compared to the number of remaining tiles.
+    The counts are updated in place, adding the drawn codes back undoes the draw.
+    Nothing but the count vector is touched, so simulations can draw and return
+    racks on a copy of it.
+
+    Args:
+        counts (bytearray): Number of tiles of every letter code, updated in place.
+        n (int): Number of letters to draw, fewer are drawn if the bag runs out.
+        rng (random.Random | None): Source of randomness, the `random` module if None.
+
+    Returns:
+        bytes: Drawn letter codes, in the order they were drawn.
+    """
+    bounds = list(accumulate(counts))
+    total = bounds[-1] if bounds else 0
+    n = min(n, total)
+    source = rng if rng is not None else random
+
+    if 2 * n > total:
+        positions = source.sample(range(total), n)
+    else:
+        # rejection of repeated positions is cheaper than `sample` for a small `n`
+        positions = []
+        seen = set()
+        uniform = source.random
+
+        while len(positions) < n:
+            if (position := int(uniform() * total)) not in seen:
+                seen.add(position)
+                positions.append(position)
+
+    drawn = bytes([bisect_right(bounds, position) for position in positions])
+
+    for code in drawn:
+        counts[code] -= 1
+
+    return drawn
 
 
 class TileBag:
-    def __init__(self, language: Language) -> None:
+    """Bag of tiles kept as counts of every letter code.
+
+    Draws are weighted picks from the count vector, tile objects are only assigned
+    to the drawn letters afterwards, taken from a stack of the bag's tiles per
+    letter code. Blanks are kept under `BLANK` whatever letter they were given.
+    """
+
+    def __init__(self, language: Language, *, rng: random.Random | None = None) -> None:
         self.language = language
+        # the global `random` module is used if None
+        self._rng = rng
+        self.alphabet = TileSet.for_language(language).alphabet
+
+        self._counts = bytearray(len(self.alphabet))
+        self._stacks: list[list[Tile]] = [[] for _ in self.alphabet.symbols]
+        self._count = 0
 
-        self._all_tiles = get_tiles_for_language(language)
-        self._remaining_tiles = self._all_tiles.copy()
+        self.put_back(get_tiles_for_language(language))
 
     @property
     def is_empty(self) -> bool:
@@ -47,28 +134,43 @@ class TileBag:
 
     @property
     def remaining_tiles_count(self) -> int:
-        return len(self._remaining_tiles)
+        return self._count
+
+    @property
+    def letter_counts(self) -> bytes:
+        """Returns the number of remaining tiles of every letter code, blanks under `BLANK`."""
+        return bytes(self._counts)
 
     def all_letters(self, with_blank: bool = True) -> set[str]:
-        return set(
-            tile.symbol
-            for tile in self._all_tiles
-            if not with_blank and not tile.is_blank
-        )
+        return set(self.alphabet.symbols if with_blank else self.alphabet.letters)
 
     def scrabble(self, n: int) -> list[Tile]:
-        n = min(n, len(self._remaining_tiles))
+        codes = draw_letters(self._counts, n, self._rng)
+        self._count -= len(codes)
+
+        return [self._stacks[code].pop() for code in codes]
+
+    def take(self, tiles: list[Tile]) -> None:
+        """Removes the specific tiles from the bag, e.g. to redo a draw."""
+        for tile in tiles:
+            code = BLANK if tile.is_blank else tile.code
 
-        tiles = random.sample(self._remaining_tiles, n)
+            self._stacks[code].remove(tile)
+            self._counts[code] -= 1
+            self._count -= 1
 
+    def put_back(self, tiles: list[Tile]) -> None:
+        """Returns the tiles to the bag, e.g. to undo a draw."""
         for tile in tiles:
-            self._remaining_tiles.remove(tile)
+            code = BLANK if tile.is_blank else tile.code
 
-        return tiles
+            self._stacks[code].append(tile)
+            self._counts[code] += 1
+            self._count += 1
 
     def exchange(self, tiles: list[Tile]) -> list[Tile]:
         new_tiles = self.scrabble(len(tiles))
 
-        self._remaining_tiles.extend(tiles)
+        self.put_back(tiles)
 
         return new_tiles
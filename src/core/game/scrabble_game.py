@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import dataclasses
 import random
-from collections.abc import Callable, Collection, Iterable
+import secrets
+from collections.abc import Callable, Collection, Iterable, Sequence
 from dataclasses import dataclass
-from functools import wraps
+from functools import partial, wraps
 from typing import assert_never
 
 from core import tools
 from core.exceptions.game import (
     GameAlreadyStartedError,
+    GameError,
     GameFinishedError,
     GameNotInProgressError,
     GameStartFailureError,
@@ -17,17 +20,52 @@ from core.exceptions.game import (
     PlayerAlreadyExistsError,
     PlayerNotFoundError,
 )
+from core.game.alphabet import BLANK, Alphabet
+from core.game.cross_checks import CrossCheckTable
 from core.game.enums import FieldType, GameState, Language
+from core.game.evaluation import MoveEvaluation, check_words, evaluate_placement
+from core.game.layout import BoardLayout
+from core.game.move_generator import GeneratedMove, MoveGenerator
+from core.game.move_log import MoveLog
 from core.game.objects.board import Board
-from core.game.objects.field import Field
 from core.game.objects.player import Player
 from core.game.objects.tile import Tile
 from core.game.objects.tile_bag import TileBag
 from core.game.types import Position
-
-
-def _convert_grid(grid: list[list[int]]) -> list[list[FieldType]]:
-    return [[FieldType(cell) for cell in row] for row in grid]
+from core.lexicon.artifacts import verify_alphabet
+from core.lexicon.graph import LexiconGraph
+
+# previews are memoized per board state, this caps memory used by one game
+_PREVIEW_CACHE_SIZE = 256
+
+# hints are memoized per board state and rack, this caps their number
+_HINT_CACHE_SIZE = 8
+
+
+def _convert_grid(grid: list[list[int]]) -> tuple[tuple[FieldType, ...], ...]:
+    return tuple(tuple(FieldType(cell) for cell in row) for row in grid)
+
+
+# built once, the layout is immutable and shared by all default game configs
+_DEFAULT_BOARD_LAYOUT = _convert_grid(
+    [
+        [4, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 4],  # a
+        [0, 3, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 3, 0],  # b
+        [0, 0, 3, 0, 0, 0, 1, 0, 1, 0, 0, 0, 3, 0, 0],  # c
+        [1, 0, 0, 3, 0, 0, 0, 1, 0, 0, 0, 3, 0, 0, 1],  # d
+        [0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0],  # e
+        [0, 2, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 2, 0],  # f
+        [0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0],  # g
+        [4, 0, 0, 1, 0, 0, 0, 3, 0, 0, 0, 1, 0, 0, 4],  # h
+        [0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0],  # i
+        [0, 2, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 2, 0],  # j
+        [0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0],  # k
+        [1, 0, 0, 3, 0, 0, 0, 1, 0, 0, 0, 3, 0, 0, 1],  # l
+        [0, 0, 3, 0, 0, 0, 1, 0, 1, 0, 0, 0, 3, 0, 0],  # m
+        [0, 3, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 3, 0],  # n
+        [4, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 4],  # o
+    ]
+)
 
 
 @dataclass
@@ -40,7 +78,10 @@ class GameConfig:
         max_players (int): Maximum number of players allowed in the game.
         min_word_length (int): Minimum length of a word that can be formed with the tiles.
         language (Language): Language of the game, which determines the tile set.
-        board_layout (list[list[FieldType]]): Layout of the game board represented as a grid of FieldType.
+        board_layout (Sequence[Sequence[FieldType]]): Layout of the game board represented as a grid of FieldType.
+        seed (int | None): Seed of the game's random number generator, which draws tiles and
+            sets the player order. A game created without one draws a random seed and
+            records it in its own config, so it can be replayed from its config and moves.
 
     Raises:
         ValueError: If any of the attributes are invalid.
@@ -51,7 +92,8 @@ class GameConfig:
     max_players: int
     min_word_length: int
     language: Language
-    board_layout: list[list[FieldType]]
+    board_layout: Sequence[Sequence[FieldType]]
+    seed: int | None = None
 
     def __post_init__(self) -> None:
         if self.tiles_per_round < 1:
@@ -82,6 +124,11 @@ class GameConfig:
                 'Board must be a rectangular grid (all rows must have the same length).'
             )
 
+    @property
+    def layout(self) -> BoardLayout:
+        """Returns the shared, interned layout of the game board."""
+        return BoardLayout.get(self.board_layout)
+
     @staticmethod
     def default() -> GameConfig:
         """Returns the default game configuration for Scrabble with the 15x15 board."""
@@ -92,28 +139,25 @@ class GameConfig:
             max_players=4,
             min_word_length=2,
             language=Language.POLISH,
-            board_layout=_convert_grid(
-                [
-                    [4, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 4],  # a
-                    [0, 3, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 3, 0],  # b
-                    [0, 0, 3, 0, 0, 0, 1, 0, 1, 0, 0, 0, 3, 0, 0],  # c
-                    [1, 0, 0, 3, 0, 0, 0, 1, 0, 0, 0, 3, 0, 0, 1],  # d
-                    [0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0],  # e
-                    [0, 2, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 2, 0],  # f
-                    [0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0],  # g
-                    [4, 0, 0, 1, 0, 0, 0, 3, 0, 0, 0, 1, 0, 0, 4],  # h
-                    [0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0],  # i
-                    [0, 2, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 2, 0],  # j
-                    [0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0],  # k
-                    [1, 0, 0, 3, 0, 0, 0, 1, 0, 0, 0, 3, 0, 0, 1],  # l
-                    [0, 0, 3, 0, 0, 0, 1, 0, 1, 0, 0, 0, 3, 0, 0],  # m
-                    [0, 3, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 0, 3, 0],  # n
-                    [4, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 4],  # o
-                ]
-            ),
+            board_layout=_DEFAULT_BOARD_LAYOUT,
         )
 
 
+@dataclass(frozen=True, slots=True)
+class SuggestedMove:
+    """Placement of a player's tiles found by the move generator.
+
+    Attributes:
+        tile_positions (tuple[tuple[Tile, Position], ...]): Rack tiles with their positions.
+        blank_symbols (tuple[tuple[Tile, str], ...]): Blank tiles with their chosen symbols.
+        score (int): Score of the move.
+    """
+
+    tile_positions: tuple[tuple[Tile, Position], ...]
+    blank_symbols: tuple[tuple[Tile, str], ...]
+    score: int
+
+
 def player_move[**P, TResult](func: Callable[P, TResult]) -> Callable[P, TResult]:
     @wraps(func)
     def wrapper(*args, **kwargs) -> TResult:
@@ -122,13 +166,15 @@ def player_move[**P, TResult](func: Callable[P, TResult]) -> Callable[P, TResult
 
         score_count = len(player.scores)
 
-        game.before_turn(player)
-        result = func(*args, **kwargs)
-        game.after_turn()
+        # any exception rolls back everything the move has changed so far
+        with game._move_log.transaction():
+            game.before_turn(player)
+            result = func(*args, **kwargs)
+            game.after_turn()
 
-        assert len(player.scores) == score_count + 1, (
-            "Player's score should be updated after a turn."
-        )
+            assert len(player.scores) == score_count + 1, (
+                "Player's score should be updated after a turn."
+            )
 
         return result
 
@@ -137,18 +183,67 @@ def player_move[**P, TResult](func: Callable[P, TResult]) -> Callable[P, TResult
 
 class ScrabbleGame:
     def __init__(
-        self, config: GameConfig, *, players: list[Player] | None = None
+        self,
+        config: GameConfig,
+        *,
+        players: list[Player] | None = None,
+        lexicon: LexiconGraph | None = None,
     ) -> None:
+        if config.seed is None:
+            config = dataclasses.replace(config, seed=secrets.randbits(64))
+
         self.config = config
         self._players: list[Player] = []
 
-        self._tile_bag = TileBag(self.config.language)
+        # every random decision of the game comes from here, never from the global
+        # `random` module, so games with the same seed and moves play out the same
+        self._rng = random.Random(config.seed)
 
-        self._board = Board(self.config.board_layout)
+        self._alphabet = Alphabet.for_language(config.language)
+
+        # valid words, e.g. a `core.lexicon.graph.Dawg`, words are not checked without it
+        if lexicon is not None:
+            verify_alphabet(lexicon, config.language)
+        self._lexicon = lexicon
+
+        self._tile_bag = TileBag(self.config.language, rng=self._rng)
+
+        self._board = Board(self.config.layout)
+
+        # cross-checks for move generation are kept up to date as tiles are placed
+        if lexicon is not None:
+            self._board.attach_cross_checks(
+                CrossCheckTable(
+                    lexicon,
+                    self._board.geometry,
+                    min_word_length=config.min_word_length,
+                )
+            )
 
         self._move_count: int = 0
         self._state: GameState = GameState.GAME_NOT_STARTED
 
+        self._move_log = MoveLog()
+
+        self._preview_cache: dict[tuple, MoveEvaluation] = {}
+        self._preview_cache_version: tuple[int, int, GameState] | None = None
+
+        # moves of computer players are generated from the lexicon
+        self._move_generator = (
+            MoveGenerator(
+                lexicon,
+                self._alphabet.points,
+                tiles_per_round=config.tiles_per_round,
+                min_word_length=config.min_word_length,
+            )
+            if lexicon is not None
+            else None
+        )
+
+        # moves found for hints, per board version and rack, see `get_hint_key`
+        self._hint_cache: dict[tuple[int, bytes], list[GeneratedMove]] = {}
+        self._hint_cache_version = -1
+
         # using `add_player` method in order to validate data
         # also has to be done after all fields are initialized
         for player in players or []:
@@ -158,6 +253,10 @@ class ScrabbleGame:
     def players(self) -> Collection[Player]:
         return tuple(self._players)
 
+    @property
+    def layout(self) -> BoardLayout:
+        return self._board.layout
+
     @property
     def board(self) -> Board:
         return self._board
@@ -166,6 +265,20 @@ class ScrabbleGame:
     def language(self) -> Language:
         return self.config.language
 
+    @property
+    def move_generator(self) -> MoveGenerator | None:
+        """Returns the generator of legal moves, None if the game has no lexicon."""
+        return self._move_generator
+
+    @property
+    def remaining_tiles_count(self) -> int:
+        return self._tile_bag.remaining_tiles_count
+
+    @property
+    def alphabet(self) -> Alphabet:
+        """Returns the letter encoding of the game's tiles."""
+        return self._alphabet
+
     @property
     def state(self) -> GameState:
         return self._state
@@ -238,7 +351,7 @@ class ScrabbleGame:
             player.tiles = self._tile_bag.scrabble(self.config.tiles_per_round)
 
         # set random player order
-        random.shuffle(self._players)
+        self._rng.shuffle(self._players)
 
         self._move_count = 0
 
@@ -258,10 +371,49 @@ class ScrabbleGame:
         self._verify_is_player_turn(player)
 
     def after_turn(self) -> None:
-        for field in self.board.get_fields():
-            field.is_tile_recently_placed = False
+        indexes = self.board.clear_recently_placed()
+        self._move_log.record(
+            apply=self.board.clear_recently_placed,
+            revert=partial(self.board.mark_recently_placed, indexes),
+        )
 
-        self._move_count += 1
+        self._move_log.apply(
+            apply=partial(self._set_move_count, self._move_count + 1),
+            revert=partial(self._set_move_count, self._move_count),
+        )
+
+    def _set_move_count(self, move_count: int) -> None:
+        self._move_count = move_count
+
+    # --- undo / redo ---
+
+    @property
+    def can_undo(self) -> bool:
+        return self._move_log.can_undo
+
+    @property
+    def can_redo(self) -> bool:
+        return self._move_log.can_redo
+
+    def undo(self) -> None:
+        """Reverts the last move, costs O(tiles changed by the move).
+        Can also be used to take back a move applied optimistically, e.g. after a challenge.
+        """
+        self._verify_game_in_progress()
+
+        if not self._move_log.can_undo:
+            raise InvalidOperationError('There is no move to undo.')
+
+        self._move_log.undo()
+
+    def redo(self) -> None:
+        """Applies the last undone move again."""
+        self._verify_game_in_progress()
+
+        if not self._move_log.can_redo:
+            raise InvalidOperationError('There is no move to redo.')
+
+        self._move_log.redo()
 
     # --- player moves ---
 
@@ -273,25 +425,35 @@ class ScrabbleGame:
         *,
         blank_symbols: list[tuple[Tile, str]] | None = None,
     ) -> None:
-        tiles, positions = tools.split_pairs(tile_positions)
         blank_symbols = blank_symbols or []
 
-        self._verify_min_tiles(tiles)
-        self._verify_max_tiles(tiles)
-        self._verify_tiles_placements(positions)
-        self._verify_tiles_ownership(player, tiles)
-        self._verify_is_valid_symbols([symbol for tile, symbol in blank_symbols])
+        evaluation = self._evaluate_move(player, tile_positions, blank_symbols)
+        if evaluation.error is not None:
+            raise evaluation.error
 
-        fields = self.board.place_tiles(tile_positions)
+        tiles = [tile for tile, _ in tile_positions]
 
+        # blanks get their letters first, so the board stores the chosen letter codes
         for tile, symbol in blank_symbols:
-            tile.set_blank_symbol(symbol)
+            self._move_log.apply(
+                apply=partial(tile.set_blank_code, self._get_blank_code(symbol)),
+                revert=partial(tile.set_blank_code, tile.code),
+            )
+
+        self._move_log.apply(
+            apply=partial(
+                self.board.place_tiles,
+                list(tile_positions),
+                move=self.move_count,
+                player_id=player.id,
+            ),
+            revert=self.board.revert_last_placement,
+        )
 
-        score = self._calculate_score(fields)
-        player.add_score(score)
+        self._add_score(player, evaluation.score)
 
-        new_tiles = self._tile_bag.scrabble(len(tiles))
-        player.replace_tiles(old=tiles, new=new_tiles)
+        new_tiles = self._draw_tiles(len(tiles))
+        self._replace_tiles(player, old=tiles, new=new_tiles)
 
     @player_move
     def exchange_tiles(self, player: Player, tiles: list[Tile]) -> None:
@@ -299,15 +461,198 @@ class ScrabbleGame:
         self._verify_max_tiles(tiles)
         self._verify_tiles_ownership(player, tiles)
 
-        player.add_score(0)
+        self._add_score(player, 0)
 
-        new_tiles = self._tile_bag.exchange(tiles)
-        player.replace_tiles(old=tiles, new=new_tiles)
+        new_tiles = self._draw_tiles(len(tiles))
+        self._move_log.apply(
+            apply=partial(self._tile_bag.put_back, tiles),
+            revert=partial(self._tile_bag.take, tiles),
+        )
+        self._replace_tiles(player, old=tiles, new=new_tiles)
 
     @player_move
     def skip_turn(self, player: Player) -> None:
         # 'player_move' decorator does most of the work
-        player.add_score(0)
+        self._add_score(player, 0)
+
+    # --- reversible state changes ---
+
+    def _add_score(self, player: Player, score: int) -> None:
+        self._move_log.apply(
+            apply=partial(player.add_score, score),
+            revert=player.scores.pop,
+        )
+
+    def _draw_tiles(self, count: int) -> list[Tile]:
+        tiles = self._tile_bag.scrabble(count)
+        self._move_log.record(
+            apply=partial(self._tile_bag.take, tiles),
+            revert=partial(self._tile_bag.put_back, tiles),
+        )
+
+        return tiles
+
+    def _replace_tiles(self, player: Player, old: list[Tile], new: list[Tile]) -> None:
+        rack = list(player.tiles)
+        self._move_log.apply(
+            apply=partial(player.replace_tiles, old=old, new=new),
+            revert=partial(self._set_tiles, player, rack),
+        )
+
+    @staticmethod
+    def _set_tiles(player: Player, tiles: list[Tile]) -> None:
+        player.tiles = list(tiles)
+
+    # --- previews ---
+
+    def preview_move(
+        self,
+        player: Player,
+        tile_positions: list[tuple[Tile, Position]],
+        *,
+        blank_symbols: list[tuple[Tile, str]] | None = None,
+    ) -> MoveEvaluation:
+        """Validates and scores a move without changing the game state.
+
+        Turn order is not checked, so players can preview moves while waiting for their turn.
+        Results are memoized until the board, the move number or the game state
+        changes, so repeated previews of the same placement are free.
+        """
+        blank_symbols = blank_symbols or []
+
+        # the state decides whether moves can be made at all, e.g. before `start`
+        version = (self.board.version, self.move_count, self.state)
+        if version != self._preview_cache_version:
+            self._preview_cache.clear()
+            self._preview_cache_version = version
+
+        key = (
+            player.id,
+            tuple((tile.id, position) for tile, position in tile_positions),
+            tuple((tile.id, symbol) for tile, symbol in blank_symbols),
+        )
+
+        if (evaluation := self._preview_cache.get(key)) is None:
+            if len(self._preview_cache) >= _PREVIEW_CACHE_SIZE:
+                self._preview_cache.clear()
+
+            try:
+                self._verify_game_in_progress()
+                self._verify_player_in_game(player)
+            except GameError as e:
+                evaluation = MoveEvaluation(error=e)
+            else:
+                evaluation = self._evaluate_move(player, tile_positions, blank_symbols)
+
+            self._preview_cache[key] = evaluation
+
+        return evaluation
+
+    # --- hints ---
+
+    def get_hint_key(self, player: Player) -> tuple[int, bytes]:
+        """Returns the key hints for the player's rack are memoized under, the board
+        version and the letter counts of the rack. Turn order is not checked, like
+        for previews.
+
+        Raises:
+            GameNotInProgressError: If the game has not been started yet.
+            GameFinishedError: If the game has already finished.
+            PlayerNotFoundError: If the player is not in the game.
+        """
+        self._verify_game_in_progress()
+        self._verify_player_in_game(player)
+
+        return self._board.version, player.letter_counts
+
+    def get_cached_hints(self, key: tuple[int, bytes]) -> list[GeneratedMove] | None:
+        """Returns the moves memoized under a key from `get_hint_key`, best first,
+        or None if there are none, so a repeated request costs no search.
+        """
+        if key[0] != self._board.version or key[0] != self._hint_cache_version:
+            return None
+
+        return self._hint_cache.get(key)
+
+    def cache_hints(
+        self, key: tuple[int, bytes], moves: Sequence[GeneratedMove]
+    ) -> None:
+        """Memoizes moves found for a key from `get_hint_key`, best first, e.g. by
+        a search in another process. Moves found for an older board are dropped.
+        """
+        if key[0] != self._board.version:
+            return
+
+        if key[0] != self._hint_cache_version:
+            self._hint_cache.clear()
+            self._hint_cache_version = key[0]
+        elif len(self._hint_cache) >= _HINT_CACHE_SIZE:
+            self._hint_cache.clear()
+
+        self._hint_cache[key] = list(moves)
+
+    def get_suggested_move(
+        self, move: GeneratedMove, rack: Sequence[Tile]
+    ) -> SuggestedMove:
+        """Picks tiles for a generated move from the rack, which must have them."""
+        tiles: dict[int, list[Tile]] = {}
+        for tile in rack:
+            tiles.setdefault(BLANK if tile.is_blank else tile.code, []).append(tile)
+
+        tile_positions = []
+        blank_symbols = []
+
+        for position, code, blank in zip(
+            move.positions, move.letters, move.blanks, strict=True
+        ):
+            tile = tiles[BLANK if blank else code].pop()
+            tile_positions.append((tile, position))
+
+            if blank:
+                blank_symbols.append((tile, self._alphabet.symbols[code]))
+
+        return SuggestedMove(
+            tile_positions=tuple(tile_positions),
+            blank_symbols=tuple(blank_symbols),
+            score=move.score,
+        )
+
+    def _evaluate_move(
+        self,
+        player: Player,
+        tile_positions: list[tuple[Tile, Position]],
+        blank_symbols: list[tuple[Tile, str]],
+    ) -> MoveEvaluation:
+        evaluation = evaluate_placement(
+            self.board,
+            tile_positions,
+            tiles_per_round=self.config.tiles_per_round,
+            min_word_length=self.config.min_word_length,
+            blank_codes={
+                tile.id: self._get_blank_code(symbol) for tile, symbol in blank_symbols
+            },
+        )
+
+        if evaluation.error is not None:
+            return evaluation
+
+        try:
+            self._verify_tiles_ownership(player, [tile for tile, _ in tile_positions])
+            if blank_symbols:
+                self._verify_is_valid_symbols([symbol for _, symbol in blank_symbols])
+        except GameError as e:
+            return MoveEvaluation(error=e)
+
+        if self._lexicon is not None:
+            return check_words(evaluation, self._lexicon)
+
+        return evaluation
+
+    def _get_blank_code(self, symbol: str) -> int:
+        # unknown symbols leave the blank without a letter, they are rejected
+        # by `_verify_is_valid_symbols` before the move is applied
+        code = self._alphabet.get_code(symbol)
+        return code if code is not None else BLANK
 
     # --- verifiers ---
 
@@ -336,108 +681,6 @@ class ScrabbleGame:
                 },
             )
 
-    def _verify_tiles_placements(self, positions: list[Position]) -> None:
-        self._verify_fields_availability(positions)
-        self._verify_tiles_make_continuous_line(positions)
-        self._verify_first_or_next_move_placement(positions)
-
-    def _verify_fields_availability(self, positions: list[Position]) -> None:
-        for position in positions:
-            # field must exist on board
-            try:
-                field = self.board.get_field(position)
-            except IndexError as e:
-                raise InvalidMoveError(
-                    message='Field does not exist on board.',
-                    details={
-                        'position': position,
-                        'board_size': self.board.size,
-                    },
-                ) from e
-
-            # field cannot be already occupied
-            if field.tile is not None:
-                raise InvalidMoveError(
-                    message='Field is already occupied by another tile.',
-                    details={
-                        'position': position,
-                        'tile_id': field.tile.id,
-                    },
-                )
-
-    def _verify_tiles_make_continuous_line(self, positions: list[Position]) -> None:
-        # same rows --> horizontal alignment
-        if tools.all_same(position.row for position in positions):
-            start, end = tools.min_max(positions, key=lambda x: x.column)
-        # same columns --> vertical alignment
-        elif tools.all_same(position.column for position in positions):
-            start, end = tools.min_max(positions, key=lambda x: x.row)
-        else:
-            raise InvalidMoveError(
-                message='Tiles must be placed in one line, either horizontally or vertically.',
-                details={
-                    'positions': positions,
-                },
-            )
-
-        positions_between = list(Position.get_positions_between(start, end))
-        for position in positions_between:
-            # tile position that player just placed
-            if position in positions:
-                continue
-
-            # if not just placed, then there should already have been a tile placed
-            field = self.board.get_field(position)
-            if field.tile is None:
-                raise InvalidMoveError(
-                    message='Tiles must be placed in a continuous line.',
-                    details={
-                        'empty_position': position,
-                    },
-                )
-
-    def _verify_first_or_next_move_placement(self, positions: list[Position]) -> None:
-        # this method could be replace with a BFS, where we find if the center field
-        # is reachable from any player's position
-        # but this way seems to be more readable and we get straightforward error messages
-
-        center_position = self.board.center_field.position
-        is_first_move = all(field.tile is None for field in self.board.get_fields())
-
-        # on first tile placement, tiles must go through the center field
-        if is_first_move and center_position not in positions:
-            raise InvalidMoveError(
-                message='First placement must go through the center field.',
-                details={
-                    'center_field': self.board.center_field.position,
-                    'positions': positions,
-                },
-            )
-
-        # on any other move, tiles must be placed next to already placed tiles
-        if not is_first_move:
-            surrounding_positions = (
-                x
-                for position in positions
-                for x in position.surrounding_positions()
-                if x not in positions
-            )
-
-            for surrounding_position in surrounding_positions:
-                try:
-                    # found adjacent tile that have been already there
-                    if self.board.get_field(surrounding_position).tile is not None:
-                        break
-                except IndexError:
-                    continue
-            else:
-                raise InvalidMoveError(
-                    message='Tiles must be placed next to already placed tiles.',
-                    details={
-                        'positions': positions,
-                    },
-                )
-
     def _verify_tiles_ownership(self, player: Player, tiles: list[Tile]) -> None:
         wrong_tiles: list[Tile] = []
 
@@ -507,7 +750,7 @@ class ScrabbleGame:
             )
 
     def _verify_is_valid_symbols(self, symbols: Iterable[str]) -> None:
-        valid_letters = self._tile_bag.all_letters(with_blank=False)
+        valid_letters = set(self._alphabet.letters)
 
         for symbol in symbols:
             if symbol not in valid_letters:
@@ -517,89 +760,3 @@ class ScrabbleGame:
                         'valid_symbols': valid_letters,
                     },
                 )
-
-    # --- score ---
-
-    def _calculate_score(self, fields: list[Field]) -> int:
-        assert all(field.tile for field in fields), (
-            'All fields must have a tile placed on them to calculate score.'
-        )
-
-        words = self._get_created_words([field.position for field in fields])
-        words = filter(lambda x: len(x) >= self.config.min_word_length, words)
-
-        score = 0
-
-        # all letters placed bonus
-        if len(fields) == self.config.tiles_per_round:
-            score += 50
-
-        for word in words:
-            score += ScrabbleGame._calculate_word_score(word)
-
-        return score
-
-    def _get_created_words(self, positions: list[Position]) -> list[list[Field]]:
-        horizontal_words = [
-            list(self.board.get_horizontal_fields(position))
-            for position in tools.distinct_by(positions, key=lambda x: x.row)
-        ]
-
-        vertical_words = [
-            list(self.board.get_vertical_fields(position))
-            for position in tools.distinct_by(positions, key=lambda x: x.column)
-        ]
-
-        return horizontal_words + vertical_words
-
-    @staticmethod
-    def _calculate_word_score(fields: list[Field]) -> int:
-        assert fields, 'Fields should not be empty when calculating word score.'
-        assert all(field.tile is not None for field in fields), (
-            'All fields must have a tile placed on them.'
-        )
-
-        new_fields, old_fields = tools.split(
-            fields, key=lambda x: x.is_tile_recently_placed
-        )
-
-        score = 0
-
-        # old tiles - without bonus
-        for field in old_fields:
-            assert field.tile, 'All fields must have a tile placed on them.'
-            score += field.tile.points
-
-        # new tiles - with letter bonus
-        for field in new_fields:
-            assert field.tile, 'All fields must have a tile placed on them.'
-            score += field.tile.points * ScrabbleGame.get_letter_bonus(field.type)
-
-        # word bonus is accumulative
-        word_bonus = 1
-        for field in new_fields:
-            word_bonus *= ScrabbleGame.get_word_bonus(field.type)
-
-        score *= word_bonus
-
-        return score
-
-    @staticmethod
-    def get_letter_bonus(field_type: FieldType) -> int:
-        match field_type:
-            case FieldType.DOUBLE_LETTER:
-                return 2
-            case FieldType.TRIPLE_LETTER:
-                return 3
-            case _:
-                return 1
-
-    @staticmethod
-    def get_word_bonus(field_type: FieldType) -> int:
-        match field_type:
-            case FieldType.DOUBLE_WORD:
-                return 2
-            case FieldType.TRIPLE_WORD:
-                return 3
-            case _:
-                return 1
@@ -0,0 +1,102 @@
+"""Tile distributions of the supported languages.
+
+Distributions are data files in `core/game/data/tile_sets`, one JSON file per
+`Language` named after it in lower case, listing every kind of tile once:
+
+    {"language": "POLISH", "vowels": "AEIOUYĄĘÓ",
+     "tiles": [{"symbol": "?", "points": 0, "count": 2}, ...]}
+
+The blank has symbol `BLANK_SYMBOL` and no points. Vowels are optional, they only
+guide computer players in keeping a balanced rack. Files are parsed once per process.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import cache
+from importlib import resources
+
+from core.game.enums import Language
+
+BLANK_SYMBOL = '?'
+
+_DATA_PACKAGE = 'core.game.data'
+
+
+@dataclass(frozen=True, slots=True)
+class TileKind:
+    """One kind of tile of a distribution.
+
+    Attributes:
+        symbol (str): Letter of the tile, `BLANK_SYMBOL` for the blank.
+        points (int): Points of the tile.
+        count (int): Number of tiles of this kind in the bag.
+    """
+
+    symbol: str
+    points: int
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class TileDistribution:
+    """Immutable tile distribution of a language, see `get_tile_distribution`.
+
+    Attributes:
+        language (Language): Language of the tiles.
+        kinds (tuple[TileKind, ...]): Kinds of tiles in the order of the data file.
+        vowels (str): Symbols of the letters which are vowels.
+    """
+
+    language: Language
+    kinds: tuple[TileKind, ...]
+    vowels: str = ''
+
+    @property
+    def tile_count(self) -> int:
+        return sum(kind.count for kind in self.kinds)
+
+
+@cache
+def get_tile_distribution(language: Language) -> TileDistribution:
+    """Returns the tile distribution of the language, loaded on first use.
+
+    Raises:
+        ValueError: If the language has no tile set or its data file is invalid.
+    """
+    resource = (
+        resources.files(_DATA_PACKAGE) / 'tile_sets' / f'{language.name.lower()}.json'
+    )
+
+    try:
+        data = json.loads(resource.read_text(encoding='utf-8'))
+    except FileNotFoundError as e:
+        raise ValueError(f'No tile set for language {language.name}.') from e
+
+    try:
+        kinds = tuple(
+            TileKind(
+                symbol=str(x['symbol']), points=int(x['points']), count=int(x['count'])
+            )
+            for x in data['tiles']
+        )
+        vowels = str(data.get('vowels', ''))
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f'Tile set of {language.name} is invalid.') from e
+
+    symbols = [kind.symbol for kind in kinds]
+    # only the blank has no points, so `Tile.is_blank` holds
+    is_valid = (
+        data.get('language') == language.name
+        and len(set(symbols)) == len(symbols)
+        and all(len(kind.symbol) == 1 and kind.count > 0 for kind in kinds)
+        and all(kind.points >= 0 for kind in kinds)
+        and all((kind.symbol == BLANK_SYMBOL) == (kind.points == 0) for kind in kinds)
+        and set(vowels) <= set(symbols) - {BLANK_SYMBOL}
+    )
+
+    if not is_valid:
+        raise ValueError(f'Tile set of {language.name} is invalid.')
+
+    return TileDistribution(language=language, kinds=kinds, vowels=vowels)
@@ -0,0 +1,86 @@
+"""Lexicon compiler.
+
+Compiles a word list into cached lexicon artifacts, run from the `src` directory:
+
+    python -m core.lexicon build words.txt --language polish --kind dawg
+
+The path of every artifact is printed, pass the DAWG to the server
+with the `SCRABBLE_LEXICON` environment variable.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from core.exceptions.lexicon import LexiconError
+from core.game.enums import Language
+from core.lexicon.artifacts import build_artifact
+from core.lexicon.format import LexiconKind
+
+DEFAULT_CACHE_DIR = Path('lexicons')
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m core.lexicon')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser(
+        'build', help='compile a word list into lexicon artifacts'
+    )
+    build.add_argument('words', type=Path, help='word list, one word per line')
+    build.add_argument(
+        '--language',
+        choices=[language.name.lower() for language in Language],
+        default=Language.POLISH.name.lower(),
+    )
+    build.add_argument(
+        '--kind',
+        choices=[kind.name.lower() for kind in LexiconKind],
+        action='append',
+        help='kind of lexicon to build, can be repeated (default: dawg)',
+    )
+    build.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR)
+    build.add_argument(
+        '--force', action='store_true', help='rebuild even if already cached'
+    )
+
+    return parser
+
+
+def _build(args: argparse.Namespace) -> None:
+    language = Language[args.language.upper()]
+
+    for kind_name in args.kind or ['dawg']:
+        kind = LexiconKind[kind_name.upper()]
+
+        start = time.perf_counter()
+        path, header = build_artifact(
+            args.words, args.cache_dir, kind=kind, language=language, force=args.force
+        )
+
+        if header is None:
+            print(f'{kind.name}: cached {path}')
+        else:
+            print(
+                f'{kind.name}: built {path} ({header.word_count:,} words, '
+                f'{header.edge_count:,} edges, {time.perf_counter() - start:.1f} s)'
+            )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _get_parser().parse_args(argv)
+
+    try:
+        match args.command:
+            case 'build':
+                _build(args)
+    except LexiconError as e:
+        print(f'error: {e.message} {e.details or ""}', file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
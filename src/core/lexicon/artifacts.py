@@ -0,0 +1,109 @@
+"""Compiled lexicon artifacts, cached on disk by the content they were built from.
+
+An artifact is named after a hash of the source word list, the lexicon kind,
+the alphabet and the format version, so building the same word list again only
+returns the existing file, and a changed word list or format never reuses a stale one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+from core.exceptions.lexicon import LexiconAlphabetError
+from core.game.alphabet import Alphabet
+from core.game.enums import Language
+from core.lexicon.builder import build_dawg, build_gaddag, get_alphabet
+from core.lexicon.format import VERSION, LexiconHeader, LexiconKind
+from core.lexicon.graph import LexiconGraph
+
+ARTIFACT_SUFFIX = '.lex'
+
+_BUILDERS = {
+    LexiconKind.DAWG: build_dawg,
+    LexiconKind.GADDAG: build_gaddag,
+}
+
+
+def get_language_alphabet(language: Language) -> str:
+    """Returns letters of the language's tile set, blank excluded, sorted.
+    Lexicons compiled with it use the letter codes of the language's `Alphabet`.
+    """
+    return Alphabet.for_language(language).letters
+
+
+def get_artifact_path(
+    cache_dir: str | os.PathLike[str],
+    source: bytes,
+    *,
+    kind: LexiconKind,
+    language: Language,
+) -> Path:
+    """Returns the path of the artifact compiled from the source word list."""
+    key = hashlib.blake2b(digest_size=16)
+    key.update(f'{VERSION}:{kind.name}:{get_language_alphabet(language)}:'.encode())
+    key.update(source)
+
+    return Path(cache_dir) / (
+        f'{language.name.lower()}-{kind.name.lower()}-{key.hexdigest()}{ARTIFACT_SUFFIX}'
+    )
+
+
+def build_artifact(
+    words_path: str | os.PathLike[str],
+    cache_dir: str | os.PathLike[str],
+    *,
+    kind: LexiconKind,
+    language: Language,
+    force: bool = False,
+) -> tuple[Path, LexiconHeader | None]:
+    """Compiles a word list file into a cached lexicon artifact.
+
+    Args:
+        words_path (str | os.PathLike[str]): Word list, one UTF-8 encoded word per line.
+        cache_dir (str | os.PathLike[str]): Directory the artifacts are stored in.
+        kind (LexiconKind): Kind of the lexicon to build.
+        language (Language): Language whose tile set the words must be spelled with.
+        force (bool): Rebuild the artifact even if it is already cached.
+
+    Returns:
+        tuple[Path, LexiconHeader | None]: Path of the artifact and its header,
+            the header is None if the artifact was already cached.
+
+    Raises:
+        LexiconAlphabetError: If a word uses letters outside of the language's tile set.
+    """
+    source = Path(words_path).read_bytes()
+    path = get_artifact_path(cache_dir, source, kind=kind, language=language)
+
+    if path.exists() and not force:
+        return path, None
+
+    words = source.decode('utf-8').upper().split()
+    alphabet = get_language_alphabet(language)
+
+    if unknown_letters := set(get_alphabet(words)) - set(alphabet):
+        raise LexiconAlphabetError(
+            message=f'Word list uses letters outside of the {language.name} tile set.',
+            details={'letters': sorted(unknown_letters), 'alphabet': alphabet},
+        )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    return path, _BUILDERS[kind](words, path, alphabet=alphabet)
+
+
+def verify_alphabet(graph: LexiconGraph, language: Language) -> None:
+    """Checks that the lexicon was compiled for the language's tile set.
+
+    Raises:
+        LexiconAlphabetError: If the alphabets differ.
+    """
+    alphabet = get_language_alphabet(language)
+
+    if graph.alphabet != alphabet:
+        raise LexiconAlphabetError(
+            message=f'Lexicon was not compiled for the {language.name} tile set.',
+            details={'alphabet': graph.alphabet, 'expected_alphabet': alphabet},
+        )
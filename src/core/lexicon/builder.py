@@ -0,0 +1,342 @@
+"""Compiles word lists into minimized lexicon graphs.
+
+The graph is built with the incremental algorithm for sorted input by Daciuk et al.:
+words are added in order and every suffix which can no longer change is merged
+with an equal, already registered one, so the graph stays minimal while it grows.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from core.exceptions.lexicon import LexiconBuildError
+from core.lexicon.format import (
+    LAST_FLAG,
+    MAX_EDGES,
+    MAX_LETTER_CODE,
+    TARGET_SHIFT,
+    LexiconHeader,
+    LexiconKind,
+)
+
+
+class _Node:
+    __slots__ = ('children', 'is_terminal')
+
+    def __init__(self) -> None:
+        # letter code -> child, inserted in sorted order
+        self.children: dict[int, _Node] = {}
+        self.is_terminal = False
+
+    def key(self) -> tuple:
+        # children are already registered, so their identity stands for their content
+        return (self.is_terminal, *((c, id(n)) for c, n in self.children.items()))
+
+
+class GraphBuilder:
+    """Builds a minimized graph from sequences of letter codes added in sorted order."""
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._register: dict[tuple, _Node] = {}
+        # path of the last added sequence which is not minimized yet
+        self._unchecked: list[tuple[_Node, int, _Node]] = []
+        self._previous = b''
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """Returns the number of sequences added so far."""
+        return self._count
+
+    def add(self, codes: bytes) -> None:
+        """Adds a sequence of letter codes, must not be smaller than the previous one.
+        Adding the same sequence again has no effect.
+
+        Raises:
+            LexiconBuildError: If the sequence is out of order.
+        """
+        if self._count and codes <= self._previous:
+            if codes == self._previous:
+                return
+            raise LexiconBuildError('Words must be added in sorted order.')
+
+        common = 0
+        for a, b in zip(codes, self._previous):
+            if a != b:
+                break
+            common += 1
+
+        self._minimize(common)
+
+        node = self._unchecked[-1][2] if self._unchecked else self._root
+        for code in codes[common:]:
+            child = _Node()
+            node.children[code] = child
+            self._unchecked.append((node, code, child))
+            node = child
+
+        node.is_terminal = True
+        self._previous = codes
+        self._count += 1
+
+    def _minimize(self, down_to: int) -> None:
+        while len(self._unchecked) > down_to:
+            parent, code, child = self._unchecked.pop()
+            key = child.key()
+
+            if (registered := self._register.get(key)) is not None:
+                parent.children[code] = registered
+            else:
+                self._register[key] = child
+
+    def finish(self) -> tuple[array[int], bytearray, int]:
+        """Minimizes the rest of the graph and lays it out as flat edge and terminal arrays.
+
+        Returns:
+            tuple[array[int], bytearray, int]: Packed edges, terminal bitmap and root node id.
+
+        Raises:
+            LexiconBuildError: If the graph does not fit in the format.
+        """
+        self._minimize(0)
+
+        # breadth-first layout, nodes close to the root end up close to each other
+        ids: dict[int, int] = {id(self._root): 0}
+        order = [self._root]
+        queue = deque(order)
+        edge_count = 0
+
+        while queue:
+            node = queue.popleft()
+            edge_count += max(len(node.children), 1)
+
+            for child in node.children.values():
+                if id(child) not in ids:
+                    ids[id(child)] = 0
+                    order.append(child)
+                    queue.append(child)
+
+        if edge_count > MAX_EDGES:
+            raise LexiconBuildError(
+                message='Lexicon is too large for the lexicon format.',
+                details={'edges': edge_count, 'max_edges': MAX_EDGES},
+            )
+
+        offset = 0
+        for node in order:
+            ids[id(node)] = offset
+            offset += max(len(node.children), 1)
+
+        edges = array('I', bytes(4 * edge_count))
+        terminals = bytearray((edge_count + 7) // 8)
+
+        for node in order:
+            node_id = ids[id(node)]
+
+            if node.is_terminal:
+                terminals[node_id >> 3] |= 1 << (node_id & 7)
+
+            if not node.children:
+                edges[node_id] = LAST_FLAG
+                continue
+
+            for i, (code, child) in enumerate(node.children.items()):
+                edges[node_id + i] = code | (ids[id(child)] << TARGET_SHIFT)
+            edges[node_id + len(node.children) - 1] |= LAST_FLAG
+
+        return edges, terminals, 0
+
+
+def normalize_words(words: Iterable[str]) -> list[str]:
+    """Returns distinct words of a word list, upper-cased and sorted.
+    Empty lines and surrounding whitespace are ignored.
+    """
+    return sorted({word for line in words if (word := line.strip().upper())})
+
+
+def get_alphabet(words: Iterable[str]) -> str:
+    """Returns letters used in the words, sorted."""
+    return ''.join(sorted(set().union(*words)))
+
+
+def encode_words(words: Iterable[str], alphabet: str) -> list[bytes]:
+    """Returns words as letter codes, `alphabet[n - 1]` is given code `n`.
+
+    Raises:
+        LexiconBuildError: If a word uses a letter outside of the alphabet.
+    """
+    if len(alphabet) > MAX_LETTER_CODE - 1:
+        raise LexiconBuildError(
+            message='Alphabet is too large for the lexicon format.',
+            details={'letters': len(alphabet), 'max_letters': MAX_LETTER_CODE - 1},
+        )
+
+    letters = set(alphabet)
+    table = {ord(letter): code for code, letter in enumerate(alphabet, start=1)}
+    encoded = []
+
+    for word in words:
+        if not letters.issuperset(word):
+            raise LexiconBuildError(
+                message=f'Word {word!r} uses letters outside of the alphabet.',
+                details={'word': word, 'alphabet': alphabet},
+            )
+        encoded.append(word.translate(table).encode('latin-1'))
+
+    return encoded
+
+
+def get_source_digest(words: Iterable[str]) -> bytes:
+    """Returns a digest of a normalized word list, identifying the lexicon content."""
+    digest = hashlib.blake2b(digest_size=16)
+    for word in words:
+        digest.update(word.encode())
+        digest.update(b'\n')
+
+    return digest.digest()
+
+
+def write_lexicon(
+    path: str | os.PathLike[str],
+    *,
+    kind: LexiconKind,
+    alphabet: str,
+    sequences: Iterable[bytes],
+    word_count: int,
+    source_digest: bytes,
+) -> LexiconHeader:
+    """Builds a graph from sorted letter code sequences and writes it to a lexicon file.
+
+    The file is written next to the target and renamed, so readers never see
+    a partially written lexicon.
+    """
+    builder = GraphBuilder()
+    for codes in sequences:
+        builder.add(codes)
+
+    edges, terminals, root = builder.finish()
+
+    header = LexiconHeader(
+        kind=kind,
+        alphabet=alphabet,
+        edge_count=len(edges),
+        root=root,
+        word_count=word_count,
+        source_digest=source_digest,
+    )
+
+    if sys.byteorder != 'little':
+        edges.byteswap()
+
+    path = Path(path)
+    temporary = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+
+    with open(temporary, 'wb') as file:
+        file.write(header.pack())
+        file.write(edges.tobytes())
+        file.write(terminals)
+
+    os.replace(temporary, path)
+
+    return header
+
+
+def get_gaddag_sequences(codes: bytes, separator: int) -> Iterator[bytes]:
+    """Yields GADDAG paths of a word given as letter codes.
+
+    For every split of the word into a non-empty prefix and a suffix, the path is the
+    reversed prefix, the separator and the suffix, e.g. `CAT` gives `C^AT`, `AC^T`
+    and `TAC^`. Every path starts with a letter of the word, so a move can be built
+    from any tile on the board, first extending it to the left and then to the right.
+    """
+    separator_code = bytes([separator])
+
+    for split in range(1, len(codes) + 1):
+        yield codes[split - 1 :: -1] + separator_code + codes[split:]
+
+
+def build_dawg(
+    words: Iterable[str],
+    path: str | os.PathLike[str],
+    *,
+    alphabet: str | None = None,
+) -> LexiconHeader:
+    """Compiles a word list into a minimized DAWG lexicon file.
+
+    Args:
+        words (Iterable[str]): Words of the lexicon, in any order and case.
+        path (str | os.PathLike[str]): Path of the lexicon file to write.
+        alphabet (str | None): Letters of the lexicon, in the order of their codes,
+            defaults to the letters used in the words.
+
+    Returns:
+        LexiconHeader: Header of the written lexicon.
+
+    Raises:
+        LexiconBuildError: If a word uses a letter outside of the alphabet,
+            or the lexicon is too large for the format.
+    """
+    words = normalize_words(words)
+    alphabet = alphabet if alphabet is not None else get_alphabet(words)
+    encoded = sorted(encode_words(words, alphabet))
+
+    return write_lexicon(
+        path,
+        kind=LexiconKind.DAWG,
+        alphabet=alphabet,
+        sequences=encoded,
+        word_count=len(words),
+        source_digest=get_source_digest(words),
+    )
+
+
+def build_gaddag(
+    words: Iterable[str],
+    path: str | os.PathLike[str],
+    *,
+    alphabet: str | None = None,
+) -> LexiconHeader:
+    """Compiles a word list into a minimized GADDAG lexicon file.
+
+    The separator has the letter code following the last letter of the alphabet.
+    The GADDAG holds a path for every letter of every word, see `get_gaddag_sequences`,
+    so it takes longer to build and is larger than the DAWG of the same words.
+
+    Args:
+        words (Iterable[str]): Words of the lexicon, in any order and case.
+        path (str | os.PathLike[str]): Path of the lexicon file to write.
+        alphabet (str | None): Letters of the lexicon, in the order of their codes,
+            defaults to the letters used in the words.
+
+    Returns:
+        LexiconHeader: Header of the written lexicon.
+
+    Raises:
+        LexiconBuildError: If a word uses a letter outside of the alphabet,
+            or the lexicon is too large for the format.
+    """
+    words = normalize_words(words)
+    alphabet = alphabet if alphabet is not None else get_alphabet(words)
+    separator = len(alphabet) + 1
+
+    sequences = sorted(
+        sequence
+        for codes in encode_words(words, alphabet)
+        for sequence in get_gaddag_sequences(codes, separator)
+    )
+
+    return write_lexicon(
+        path,
+        kind=LexiconKind.GADDAG,
+        alphabet=alphabet,
+        sequences=sequences,
+        word_count=len(words),
+        source_digest=get_source_digest(words),
+    )
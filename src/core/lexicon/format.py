@@ -0,0 +1,149 @@
+"""Binary format of compiled lexicons.
+
+A lexicon file is a little-endian flat image which can be memory-mapped as is:
+
+    header      `HEADER` struct, see `LexiconHeader`
+    alphabet    UTF-8 encoded letters, padded with zeros to a multiple of 4 bytes
+    edges       `edge_count` uint32 values
+    terminals   bitmap of terminal nodes, one bit per edge index
+
+The graph is a minimized automaton stored as an array of edges. Edges of one node
+are stored next to each other, sorted by letter, and a node is identified by the index
+of its first edge. Every edge packs the letter code, a flag marking the last edge
+of its node and the index of the node it leads to. A node without children still
+has one edge, with letter code 0 which never matches, so every node id is unique.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from enum import IntEnum
+
+from core.exceptions.lexicon import LexiconFormatError
+
+MAGIC = b'SCRBLLEX'
+VERSION = 1
+
+# magic, version, kind, alphabet size, edge count, root, word count, source digest
+HEADER = struct.Struct('<8sHHIIII16s')
+
+LETTER_BITS = 6
+LETTER_MASK = (1 << LETTER_BITS) - 1
+LAST_FLAG = 1 << LETTER_BITS
+TARGET_SHIFT = LETTER_BITS + 1
+
+# letter codes start at 1, code 0 marks the edge of a node without children,
+# the code after the last letter is the GADDAG separator
+MAX_LETTER_CODE = LETTER_MASK
+MAX_EDGES = 1 << (32 - TARGET_SHIFT)
+
+
+class LexiconKind(IntEnum):
+    """Kind of the graph stored in a lexicon file."""
+
+    DAWG = 0
+    GADDAG = 1
+
+
+@dataclass(frozen=True, slots=True)
+class LexiconHeader:
+    """Header of a lexicon file.
+
+    Attributes:
+        kind (LexiconKind): Kind of the stored graph.
+        alphabet (str): Letters of the lexicon, letter code `n` is `alphabet[n - 1]`.
+        edge_count (int): Number of edges of the graph.
+        root (int): Node id of the root.
+        word_count (int): Number of words the lexicon was built from.
+        source_digest (bytes): Digest of the normalized, sorted source word list.
+    """
+
+    kind: LexiconKind
+    alphabet: str
+    edge_count: int
+    root: int
+    word_count: int
+    source_digest: bytes
+
+    @property
+    def alphabet_offset(self) -> int:
+        return HEADER.size
+
+    @property
+    def edges_offset(self) -> int:
+        return self.alphabet_offset + _padded(len(self.alphabet.encode()))
+
+    @property
+    def terminals_offset(self) -> int:
+        return self.edges_offset + 4 * self.edge_count
+
+    @property
+    def size(self) -> int:
+        """Returns the size of the whole file."""
+        return self.terminals_offset + (self.edge_count + 7) // 8
+
+    def pack(self) -> bytes:
+        """Returns the header followed by the padded alphabet."""
+        alphabet = self.alphabet.encode()
+
+        return HEADER.pack(
+            MAGIC,
+            VERSION,
+            self.kind,
+            len(alphabet),
+            self.edge_count,
+            self.root,
+            self.word_count,
+            self.source_digest,
+        ) + alphabet.ljust(_padded(len(alphabet)), b'\0')
+
+    @staticmethod
+    def unpack(buffer: bytes | memoryview) -> LexiconHeader:
+        """Reads the header from the beginning of a lexicon file.
+
+        Raises:
+            LexiconFormatError: If the buffer is not a lexicon file of a supported version.
+        """
+        if len(buffer) < HEADER.size:
+            raise LexiconFormatError('Lexicon file is too short.')
+
+        magic, version, kind, alphabet_size, edge_count, root, word_count, digest = (
+            HEADER.unpack_from(buffer)
+        )
+
+        if magic != MAGIC:
+            raise LexiconFormatError('Not a lexicon file.')
+
+        if version != VERSION:
+            raise LexiconFormatError(
+                message=f'Unsupported lexicon format version {version}.',
+                details={'version': version, 'supported_version': VERSION},
+            )
+
+        try:
+            kind = LexiconKind(kind)
+            alphabet = bytes(buffer[HEADER.size : HEADER.size + alphabet_size]).decode()
+        except (ValueError, UnicodeDecodeError) as e:
+            raise LexiconFormatError('Lexicon header is corrupted.') from e
+
+        header = LexiconHeader(
+            kind=kind,
+            alphabet=alphabet,
+            edge_count=edge_count,
+            root=root,
+            word_count=word_count,
+            source_digest=digest,
+        )
+
+        if len(buffer) != header.size or root >= edge_count:
+            raise LexiconFormatError(
+                message='Lexicon file is truncated or corrupted.',
+                details={'size': len(buffer), 'expected_size': header.size},
+            )
+
+        return header
+
+
+def _padded(size: int) -> int:
+    return (size + 3) & ~3
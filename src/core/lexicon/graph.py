@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterator
+from typing import Self
+
+from core.exceptions.lexicon import LexiconFormatError
+from core.lexicon.format import (
+    LAST_FLAG,
+    LETTER_MASK,
+    TARGET_SHIFT,
+    LexiconHeader,
+    LexiconKind,
+)
+
+
+class LexiconGraph(ABC):
+    """Read-only view of a compiled lexicon graph, see `core.lexicon.format`.
+
+    Loaded with `load`, the file is memory-mapped and nothing is copied, so loading
+    is instant and all processes using the same file share its pages.
+    Nodes are plain integers, `root` is the start of every traversal.
+    """
+
+    kind: LexiconKind
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+
+        self.header = LexiconHeader.unpack(self._view)
+
+        if self.header.kind != self.kind:
+            raise LexiconFormatError(
+                message=f'Expected a {self.kind.name} lexicon, got {self.header.kind.name}.',
+                details={
+                    'kind': self.header.kind.name,
+                    'expected_kind': self.kind.name,
+                },
+            )
+
+        header = self.header
+        edges = self._view[header.edges_offset : header.terminals_offset]
+
+        if sys.byteorder == 'little':
+            self._edges: memoryview | array[int] = edges.cast('I')
+        else:
+            self._edges = array('I', edges)
+            self._edges.byteswap()
+
+        self._terminals = self._view[header.terminals_offset : header.size]
+
+        self.alphabet = header.alphabet
+        self.root = header.root
+        # letter -> letter code
+        self._codes = {letter: code for code, letter in enumerate(self.alphabet, 1)}
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> Self:
+        """Memory-maps a lexicon file.
+
+        Raises:
+            LexiconFormatError: If the file is not a lexicon of this kind.
+        """
+        with open(path, 'rb') as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise LexiconFormatError('Lexicon file is empty.') from e
+
+        return cls(buffer)
+
+    def close(self) -> None:
+        """Releases the mapped file, the lexicon cannot be used afterwards."""
+        self._terminals.release()
+        if isinstance(self._edges, memoryview):
+            self._edges.release()
+        self._view.release()
+
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def word_count(self) -> int:
+        return self.header.word_count
+
+    @property
+    def edge_count(self) -> int:
+        return self.header.edge_count
+
+    def get_code(self, letter: str) -> int | None:
+        """Returns the letter code of a letter, None if it is not in the alphabet."""
+        return self._codes.get(letter)
+
+    def get_letter(self, code: int) -> str:
+        return self.alphabet[code - 1]
+
+    def decode(self, codes: bytes) -> str:
+        """Returns letter codes as a word, codes outside of the alphabet are shown as `?`."""
+        alphabet = self.alphabet
+        size = len(alphabet)
+
+        return ''.join([alphabet[c - 1] if 0 < c <= size else '?' for c in codes])
+
+    @abstractmethod
+    def contains_codes(self, codes: bytes) -> bool:
+        """Checks if the word given as letter codes is in the lexicon."""
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+
+        return self.contains_codes(bytes([self._codes.get(x, 0) for x in word]))
+
+    def is_terminal(self, node: int) -> bool:
+        """Checks if a word ends in the node."""
+        return bool(self._terminals[node >> 3] & (1 << (node & 7)))
+
+    def arcs(self, node: int) -> Iterator[tuple[int, int]]:
+        """Yields `(letter code, child)` pairs of the node's outgoing edges, by letter code."""
+        edges = self._edges
+
+        while True:
+            edge = edges[node]
+
+            if code := edge & LETTER_MASK:
+                yield code, edge >> TARGET_SHIFT
+
+            if edge & LAST_FLAG:
+                return
+
+            node += 1
+
+    def child(self, node: int, code: int) -> int | None:
+        """Returns the child of the node along the edge with the letter code, if there is one."""
+        edges = self._edges
+
+        while True:
+            edge = edges[node]
+            letter = edge & LETTER_MASK
+
+            if letter == code:
+                return edge >> TARGET_SHIFT
+
+            # edges are sorted by letter code
+            if letter > code or edge & LAST_FLAG:
+                return None
+
+            node += 1
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(alphabet={self.alphabet!r}, '
+            f'words={self.word_count}, edges={self.edge_count})'
+        )
+
+
+class Dawg(LexiconGraph):
+    """Minimized DAWG of a word list, answers membership queries.
+
+    A lookup follows one edge per letter, costing O(word length * alphabet size)
+    in the worst case, independent of the number of words.
+    """
+
+    kind = LexiconKind.DAWG
+
+    def contains_codes(self, codes: bytes) -> bool:
+        # code 0 would match the edge of a node without children
+        if 0 in codes:
+            return False
+
+        edges = self._edges
+        node = self.root
+
+        for code in codes:
+            while True:
+                edge = edges[node]
+                found = edge & LETTER_MASK
+
+                if found == code:
+                    node = edge >> TARGET_SHIFT
+                    break
+
+                if found > code or edge & LAST_FLAG:
+                    return False
+
+                node += 1
+
+        return bool(self._terminals[node >> 3] & (1 << (node & 7)))
+
+
+class Gaddag(LexiconGraph):
+    """Minimized GADDAG of a word list, used to generate moves.
+
+    Every word is stored once for each of its letters, as the reversed prefix up to
+    that letter, the separator and the rest of the word. Starting from a tile on
+    the board, a generator follows letters to the left, crosses the separator and
+    continues to the right, using `arcs`, `child` and `is_terminal`.
+    """
+
+    kind = LexiconKind.GADDAG
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        super().__init__(buffer)
+
+        self.separator = len(self.alphabet) + 1
+
+    def contains_codes(self, codes: bytes) -> bool:
+        if not codes or 0 in codes or max(codes) >= self.separator:
+            return False
+
+        # first letter, separator and the rest of the word
+        node = self.root
+        for code in [codes[0], self.separator, *codes[1:]]:
+            child = self.child(node, code)
+            if child is None:
+                return False
+            node = child
+
+        return self.is_terminal(node)
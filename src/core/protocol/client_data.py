@@ -1,4 +1,5 @@
 from core.data_model import DataModel
+from core.game.enums import ComputerStrength
 from core.protocol.data_types import TileData
 
 
@@ -22,6 +23,11 @@ class StartGameData(DataModel):
     session_id: str
 
 
+class AddComputerPlayerData(DataModel):
+    session_id: str
+    strength: ComputerStrength = ComputerStrength.EQUITY
+
+
 # --- game moves ---
 
 
@@ -39,3 +45,12 @@ class ExchangeTilesData(GameMove):
 
 class SkipTurnData(GameMove):
     pass
+
+
+class PreviewMoveData(GameMove):
+    tiles_data: list[TileData]
+
+
+class RequestHintData(GameMove):
+    # number of best moves to return, the server caps it
+    count: int = 3
@@ -3,10 +3,13 @@ from __future__ import annotations
 from typing import Self
 
 from core.data_model import DataModel
+from core.game.alphabet import Alphabet
+from core.game.evaluation import WordScore
 from core.game.objects.board import Board
 from core.game.objects.field import Field
 from core.game.objects.player import Player
 from core.game.objects.tile import Tile
+from core.game.scrabble_game import SuggestedMove
 from core.game.types import Position
 
 
@@ -24,30 +27,33 @@ class PlayerData(DataModel):
     scores: list[int] | None = None
 
     @classmethod
-    def from_player(cls, player: Player, with_tiles: bool = False) -> Self:
+    def from_player(cls, player: Player, alphabet: Alphabet | None = None) -> Self:
+        """Tiles of the player are included only if an alphabet to encode them is given."""
         obj = cls(
             id=player.id,
             name=player.name,
             scores=player.scores,
         )
 
-        if with_tiles:
-            obj.tiles = [TileData.from_tile(tile) for tile in player.tiles]
+        if alphabet is not None:
+            obj.tiles = [TileData.from_tile(tile, alphabet) for tile in player.tiles]
 
         return obj
 
 
 class TileData(DataModel):
-    id: str
+    id: int
     symbol: str
     points: int
     position: Position | None = None
 
     @classmethod
-    def from_tile(cls, tile: Tile, position: Position | None = None) -> Self:
+    def from_tile(
+        cls, tile: Tile, alphabet: Alphabet, position: Position | None = None
+    ) -> Self:
         return cls(
             id=tile.id,
-            symbol=tile.symbol,
+            symbol=alphabet.symbols[tile.code],
             points=tile.points,
             position=position,
         )
@@ -60,7 +66,7 @@ class FieldData(DataModel):
     tile: TileData | None = None
 
     @classmethod
-    def from_field(cls, field: Field) -> Self:
+    def from_field(cls, field: Field, alphabet: Alphabet) -> Self:
         obj = cls(
             row=field.row,
             column=field.column,
@@ -68,20 +74,55 @@ class FieldData(DataModel):
         )
 
         if field.tile:
-            obj.tile = TileData.from_tile(field.tile)
+            obj.tile = TileData.from_tile(field.tile, alphabet)
 
         return obj
 
 
+class WordScoreData(DataModel):
+    word: str
+    positions: list[Position]
+    score: int
+
+    @classmethod
+    def from_word_score(cls, word_score: WordScore, alphabet: Alphabet) -> Self:
+        return cls(
+            word=alphabet.decode(word_score.letters),
+            positions=list(word_score.positions),
+            score=word_score.score,
+        )
+
+
+class SuggestedMoveData(DataModel):
+    # tiles as a placement request expects them, blanks with their chosen symbols
+    tiles: list[TileData]
+    score: int
+
+    @classmethod
+    def from_suggested_move(cls, move: SuggestedMove, alphabet: Alphabet) -> Self:
+        symbols = {tile.id: symbol for tile, symbol in move.blank_symbols}
+
+        tiles = []
+        for tile, position in move.tile_positions:
+            tile_data = TileData.from_tile(tile, alphabet, position)
+            if tile.id in symbols:
+                tile_data.symbol = symbols[tile.id]
+            tiles.append(tile_data)
+
+        return cls(tiles=tiles, score=move.score)
+
+
 class BoardData(DataModel):
     rows: int
     columns: int
     fields: list[FieldData]
 
     @classmethod
-    def from_board(cls, board: Board) -> Self:
+    def from_board(cls, board: Board, alphabet: Alphabet) -> Self:
         return cls(
-            fields=[FieldData.from_field(field) for field in board.get_fields()],
+            fields=[
+                FieldData.from_field(field, alphabet) for field in board.get_fields()
+            ],
             rows=board.rows,
             columns=board.columns,
         )
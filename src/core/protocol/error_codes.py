@@ -43,6 +43,12 @@ class ErrorCode(StrEnum):
     INVALID_PLAYER_DATA = 'invalid_player_data'
     PLAYER_NOT_IN_ROOM = 'player_not_in_room'
     DUPLICATED_CONNECTION = 'duplicated_connection'
+
+    # --- engine ---
+    ENGINE_ERROR = 'engine_error'
+    ENGINE_OVERLOADED = 'engine_overloaded'
+    ENGINE_CANCELLED = 'engine_cancelled'
+
     INTERNAL_ERROR = 'internal_error'
 
     #
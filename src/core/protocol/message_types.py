@@ -7,10 +7,14 @@ class ClientMessageType(StrEnum):
     START_GAME = 'start_game'
     CREATE_ROOM = 'create_room'
     REJOIN = 'rejoin'
+    ADD_COMPUTER_PLAYER = 'add_computer_player'
     # game moves
     PLACE_TILES = 'place_tiles'
     EXCHANGE_TILES = 'exchange_tiles'
     SKIP_TURN = 'skip_turn'
+    # read-only requests
+    PREVIEW_MOVE = 'preview_move'
+    REQUEST_HINT = 'request_hint'
 
 
 class ServerMessageType(StrEnum):
@@ -24,3 +28,5 @@ class ServerMessageType(StrEnum):
     REJOIN_GAME = 'rejoin_game'
     NEXT_TURN = 'next_turn'
     NEW_TILES = 'new_tiles'
+    MOVE_PREVIEW = 'move_preview'
+    HINT = 'hint'
@@ -1,5 +1,11 @@
 from core.data_model import DataModel
-from core.protocol.data_types import BoardData, PlayerData
+from core.protocol.data_types import (
+    BoardData,
+    PlayerData,
+    SuggestedMoveData,
+    WordScoreData,
+)
+from core.protocol.errors import ErrorData
 
 
 class NewRoomData(DataModel):
@@ -43,6 +49,18 @@ class NewGameData(DataModel):
     board: BoardData
 
 
+class MovePreviewData(DataModel):
+    is_valid: bool
+    words: list[WordScoreData]
+    bingo: bool
+    score: int
+    error: ErrorData | None = None
+
+
+class HintData(DataModel):
+    moves: list[SuggestedMoveData]
+
+
 class NextTurnData(DataModel):
     player: PlayerData
     current_player_id: str
@@ -1,4 +1,9 @@
 from core.game.enums import FieldType
+from core.game.move_generator import MoveGenerator
+from core.game.objects.board import Board
+from core.game.objects.player import Player
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.lexicon.graph import Dawg
 
 # --- grid ---
 
@@ -48,3 +53,46 @@ def get_15x15_grid() -> list[list[FieldType]]:
             [4, 0, 0, 1, 0, 0, 0, 4, 0, 0, 0, 1, 0, 0, 4],  # o
         ]
     )
+
+
+# --- games ---
+
+
+def play_greedy(dawg: Dawg, seed: int, turns: int) -> list[tuple[Board, bytes]]:
+    # highest scoring move every turn, returns the board and the rack before each
+    config = GameConfig.default()
+    config.seed = seed
+    game = ScrabbleGame(
+        config, players=[Player('a', 'a'), Player('b', 'b')], lexicon=dawg
+    )
+    game.start()
+
+    generator = MoveGenerator(dawg, game.alphabet.points)
+    positions = []
+
+    for _ in range(turns):
+        player = game.current_player
+        positions.append((game.board.snapshot(), player.letter_counts))
+
+        moves = generator.generate(game.board, player.letter_counts)
+        if not moves:
+            game.skip_turn(player)
+            continue
+
+        move = max(moves, key=lambda x: x.score)
+        rack = list(player.tiles)
+        tile_positions, blank_symbols = [], []
+
+        for position, code, blank in zip(
+            move.positions, move.letters, move.blanks, strict=True
+        ):
+            tile = next(t for t in rack if (t.is_blank if blank else t.code == code))
+            rack.remove(tile)
+            tile_positions.append((tile, position))
+            if blank:
+                blank_symbols.append((tile, game.alphabet.symbols[code]))
+
+        game.place_tiles(player, tile_positions, blank_symbols=blank_symbols)
+        assert player.scores[-1] == move.score
+
+    return positions
@@ -0,0 +1,36 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from core.game.alphabet import Alphabet
+from core.game.enums import Language
+from core.game.tile_sets import get_tile_distribution
+from core.lexicon.builder import build_dawg
+from core.lexicon.graph import Dawg
+
+
+@pytest.fixture(scope='session')
+def dawg_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # short words with letters as frequent as in the bag, so that racks form some
+    kinds = get_tile_distribution(Language.POLISH).kinds
+    letters = [kind.symbol for kind in kinds if kind.points]
+    weights = [kind.count for kind in kinds if kind.points]
+
+    rng = random.Random(0)
+    words = {
+        ''.join(rng.choices(letters, weights, k=rng.randint(2, 7)))
+        for _ in range(40_000)
+    }
+
+    path = tmp_path_factory.mktemp('lexicon') / 'words.dawg'
+    build_dawg(
+        sorted(words), path, alphabet=Alphabet.for_language(Language.POLISH).letters
+    )
+
+    return path
+
+
+@pytest.fixture(scope='session')
+def dawg(dawg_path: Path) -> Dawg:
+    return Dawg.load(dawg_path)
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+from core.exceptions.lexicon import LexiconAlphabetError
+from core.game.alphabet import BLANK, Alphabet
+from core.game.enums import Language
+from core.game.objects.player import Player
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.game.types import Position
+from core.lexicon.builder import build_dawg
+from core.lexicon.graph import Dawg
+
+
+def test_alphabet_codes_match_lexicon_codes(tmp_path: Path) -> None:
+    alphabet = Alphabet.for_language(Language.POLISH)
+    assert Alphabet.for_language(Language.POLISH) is alphabet
+
+    assert alphabet.symbols[BLANK] == '?'
+    assert alphabet.decode(alphabet.encode('ŻÓŁW')) == 'ŻÓŁW'
+    assert alphabet.points[alphabet.get_code('Ź')] == 9
+
+    with pytest.raises(ValueError):
+        alphabet.encode('QUIZ')
+
+    build_dawg(['ŻÓŁW'], tmp_path / 'words.dawg', alphabet=alphabet.letters)
+
+    with Dawg.load(tmp_path / 'words.dawg') as dawg:
+        assert dawg.contains_codes(alphabet.encode('ŻÓŁW'))
+        assert not dawg.contains_codes(alphabet.encode('ŻÓŁ'))
+        assert not dawg.contains_codes(bytes([BLANK]))
+
+
+def test_blank_is_stored_with_chosen_letter(tmp_path: Path) -> None:
+    alphabet = Alphabet.for_language(Language.POLISH)
+    build_dawg(['KOT'], tmp_path / 'words.dawg', alphabet=alphabet.letters)
+
+    with Dawg.load(tmp_path / 'words.dawg') as dawg:
+        player = Player('a', 'a')
+        game = ScrabbleGame(GameConfig.default(), players=[player], lexicon=dawg)
+        game.start()
+
+        k, o = alphabet.encode('KO')
+        blank = Tile(BLANK, 0, 102)
+        tiles = [Tile(k, 2, 100), Tile(o, 1, 101), blank]
+        player.tiles = [*tiles, *player.tiles[3:]]
+
+        game.place_tiles(
+            player,
+            [(tile, Position(7, 7 + i)) for i, tile in enumerate(tiles)],
+            blank_symbols=[(blank, 'T')],
+        )
+
+        assert player.scores == [6]
+        assert blank.code == alphabet.get_code('T')
+        assert game.board.get_letters()[7 * 15 + 9] == blank.code
+
+        game.undo()
+        assert blank.code == BLANK
+
+
+def test_game_rejects_lexicon_of_other_alphabet(tmp_path: Path) -> None:
+    build_dawg(['KOT'], tmp_path / 'words.dawg')
+
+    with (
+        Dawg.load(tmp_path / 'words.dawg') as dawg,
+        pytest.raises(LexiconAlphabetError),
+    ):
+        ScrabbleGame(GameConfig.default(), lexicon=dawg)
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from core.game.evaluation import evaluate_placement
+from core.game.objects.board import Board
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig
+
+np = pytest.importorskip('numpy')
+
+from core.game.batch_scoring import score_placements
+
+LETTER_POINTS = [0, 1, 1, 2, 3, 5, 9]
+
+
+def _get_board(rng: random.Random, config: GameConfig, tiles: int) -> Board:
+    board = Board(config.layout)
+
+    for _ in range(tiles):
+        index = rng.randrange(board.rows * board.columns)
+        if board.get_tiles()[index] is None:
+            position = board.geometry.positions[index]
+            code = rng.randrange(len(LETTER_POINTS))
+            board.place_tiles([(Tile(code, LETTER_POINTS[code], index), position)])
+
+    board.clear_recently_placed()
+
+    return board
+
+
+def _get_candidate(rng: random.Random, board: Board, size: int) -> list[int]:
+    # empty cells of a line from a random start, gaps are filled by placed tiles
+    if rng.random() < 0.5:
+        line = board.geometry.row_lines[rng.randrange(board.rows)]
+    else:
+        line = board.geometry.column_lines[rng.randrange(board.columns)]
+
+    start = rng.randrange(len(line))
+    return [i for i in line[start:] if board.get_tiles()[i] is None][:size]
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_score_placements_matches_scoring_one_by_one(seed: int) -> None:
+    rng = random.Random(seed)
+    config = GameConfig.default()
+    board = _get_board(rng, config, tiles=rng.randrange(0, 120))
+
+    candidates = [
+        _get_candidate(rng, board, rng.randint(1, config.tiles_per_round))
+        for _ in range(200)
+    ]
+    candidates = [candidate for candidate in candidates if candidate]
+
+    positions = np.full((len(candidates), config.tiles_per_round), -1)
+    letters = np.zeros_like(positions)
+    blanks = np.zeros(positions.shape, dtype=bool)
+
+    expected = {}
+    for row, candidate in enumerate(candidates):
+        tile_positions = []
+
+        for column, index in enumerate(candidate):
+            code = rng.randrange(len(LETTER_POINTS))
+            blank = rng.random() < 0.1
+            points = 0 if blank else LETTER_POINTS[code]
+
+            positions[row, column] = index
+            letters[row, column] = code
+            blanks[row, column] = blank
+            tile_positions.append(
+                (Tile(code, points, column), board.geometry.positions[index])
+            )
+
+        # moves are scored by the evaluator, invalid placements have no score there
+        evaluation = evaluate_placement(
+            board,
+            tile_positions,
+            tiles_per_round=config.tiles_per_round,
+            min_word_length=config.min_word_length,
+        )
+        if evaluation.is_valid:
+            expected[row] = evaluation.score
+
+    scores = score_placements(
+        board,
+        positions,
+        letters,
+        blanks,
+        letter_points=LETTER_POINTS,
+        min_word_length=config.min_word_length,
+        bingo_size=config.tiles_per_round,
+    )
+
+    assert len(expected) >= len(candidates) // 2
+    assert {row: int(scores[row]) for row in expected} == expected
+
+
+def test_score_placements_rejects_positions_outside_board() -> None:
+    board = Board(GameConfig.default().layout)
+
+    with pytest.raises(ValueError):
+        score_placements(board, [[225]], [[1]], [[False]], letter_points=LETTER_POINTS)
+
+
+def test_score_placements_empty_batch() -> None:
+    board = Board(GameConfig.default().layout)
+    empty = np.zeros((0, 7), dtype=int)
+
+    scores = score_placements(
+        board, empty, empty, empty.astype(bool), letter_points=LETTER_POINTS
+    )
+
+    assert scores.shape == (0,)
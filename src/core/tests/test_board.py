@@ -0,0 +1,446 @@
+import random
+from collections.abc import Iterable
+
+import pytest
+
+from core.exceptions.game import InvalidMoveError
+from core.game.enums import FieldType
+from core.game.evaluation import evaluate_placement
+from core.game.objects.board import Board
+from core.game.objects.field import Field
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig
+from core.game.types import Position
+from core.tests._helper import get_3x3_grid, get_even_grid
+
+
+def _get_board() -> Board:
+    return Board(GameConfig.default().layout)
+
+
+def test_fields_are_views_over_the_board() -> None:
+    board = _get_board()
+    tile = Tile(1, 1, 0)
+
+    field = board.get_field(Position(3, 4))
+    assert (field.row, field.column) == (3, 4)
+    assert field.index == 3 * board.columns + 4
+    assert field.position == Position(3, 4)
+    assert field.board is board
+
+    # writes through one view are seen by every other view and by the board
+    field.tile = tile
+    assert board.get_field(3, 4).tile is tile
+    assert board.get_tiles()[field.index] is tile
+    assert board.get_letters()[field.index] == tile.code
+
+    field.is_tile_recently_placed = True
+    assert board.get_field(Position(3, 4)).is_tile_recently_placed
+
+    field.tile = None
+    assert board.get_field(3, 4).tile is None
+    assert board.is_empty
+
+
+def test_field_views_compare_by_board_and_cell() -> None:
+    board = _get_board()
+    other = _get_board()
+
+    assert board.get_field(1, 2) == Field(board, 1 * board.columns + 2)
+    assert hash(board.get_field(1, 2)) == hash(board.get_field(Position(1, 2)))
+    assert board.get_field(1, 2) != board.get_field(2, 1)
+    assert board.get_field(1, 2) != other.get_field(1, 2)
+
+
+def test_fields_read_types_from_the_layout() -> None:
+    config = GameConfig.default()
+    board = Board(config.layout)
+
+    fields = list(board.get_fields())
+    assert len(fields) == board.rows * board.columns
+    assert [field.type for field in fields] == [
+        field_type for row in config.board_layout for field_type in row
+    ]
+    assert [field.position for field in fields] == list(board.geometry.positions)
+
+    assert board.center_field.position == Position(7, 7)
+    assert board.center_field.type == FieldType.DOUBLE_WORD
+
+
+def test_center_field_of_other_sizes() -> None:
+    assert Board(get_3x3_grid()).center_field.position == Position(1, 1)
+
+    with pytest.raises(IndexError):
+        _ = Board(get_even_grid()).center_field
+
+
+def test_get_field_rejects_positions_outside_of_the_board() -> None:
+    board = _get_board()
+
+    with pytest.raises(IndexError):
+        board.get_field(15, 0)
+
+    with pytest.raises(IndexError):
+        board.get_field(Position(0, -1))
+
+    with pytest.raises(TypeError):
+        board.get_field(1)  # type: ignore[call-overload]
+
+
+def test_word_fields_start_at_the_given_position() -> None:
+    board = _get_board()
+    board.place_tiles(
+        [(Tile(i + 1, 1, i), Position(7, column)) for i, column in enumerate((5, 6, 7))]
+    )
+
+    horizontal = board.get_horizontal_fields(Position(7, 6))
+    assert [field.column for field in horizontal] == [6, 7, 5]
+
+    vertical = board.get_vertical_fields(Position(7, 6))
+    assert [field.position for field in vertical] == [Position(7, 6)]
+
+    assert list(board.get_horizontal_fields(Position(0, 0))) == []
+
+
+def _place(board: Board, *positions: tuple[int, int]) -> None:
+    board.place_tiles(
+        [
+            (Tile(1, 1, board.index_of(Position(*position))), Position(*position))
+            for position in positions
+        ]
+    )
+
+
+def test_occupancy_masks_follow_tiles() -> None:
+    board = _get_board()
+    assert board.is_empty
+
+    _place(board, (7, 6), (7, 7), (3, 0))
+    assert not board.is_empty
+    assert board.get_row_mask(7) == 0b11 << 6
+    assert board.get_row_mask(3) == 1
+    assert board.get_column_mask(7) == 1 << 7
+    assert board.get_column_mask(0) == 1 << 3
+    assert board.get_row_mask(0) == board.get_column_mask(14) == 0
+
+    board.get_field(7, 6).tile = None
+    assert board.get_row_mask(7) == 1 << 7
+    assert board.get_column_mask(6) == 0
+
+
+def test_adjacent_tiles_are_found_in_all_directions() -> None:
+    board = _get_board()
+    _place(board, (7, 7), (0, 0))
+
+    for position in ((7, 6), (7, 8), (6, 7), (8, 7), (0, 1), (1, 0)):
+        assert board.has_adjacent_tiles([Position(*position)])
+
+    # diagonal neighbours do not count, positions off the board are ignored
+    assert not board.has_adjacent_tiles([Position(6, 6), Position(8, 8)])
+    assert not board.has_adjacent_tiles([Position(-1, 0), Position(0, 15)])
+    assert board.has_adjacent_tiles([Position(-1, 0), Position(0, 1)])
+
+
+def _verify_naively(board: Board, positions: list[Position]) -> InvalidMoveError | None:
+    # placement rules checked field by field, as the game did before the bitmasks
+    for position in positions:
+        try:
+            field = board.get_field(position)
+        except IndexError:
+            return InvalidMoveError(
+                message='Field does not exist on board.',
+                details={'position': position, 'board_size': board.size},
+            )
+
+        if field.tile is not None:
+            return InvalidMoveError(
+                message='Field is already occupied by another tile.',
+                details={'position': position, 'tile_id': field.tile.id},
+            )
+
+    if len({row for row, _ in positions}) == 1 or len({c for _, c in positions}) == 1:
+        start, end = min(positions), max(positions)
+    else:
+        return InvalidMoveError(
+            message='Tiles must be placed in one line, either horizontally or vertically.',
+            details={'positions': positions},
+        )
+
+    for position in Position.get_positions_between(start, end):
+        if position not in positions and board.get_field(position).tile is None:
+            return InvalidMoveError(
+                message='Tiles must be placed in a continuous line.',
+                details={'empty_position': position},
+            )
+
+    center = board.center_field.position
+    if all(field.tile is None for field in board.get_fields()):
+        if center not in positions:
+            return InvalidMoveError(
+                message='First placement must go through the center field.',
+                details={'center_field': center, 'positions': positions},
+            )
+        return None
+
+    for position in positions:
+        for row, column in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+            neighbour = Position(position.row + row, position.column + column)
+            index = board.index_of(neighbour)
+            if index is not None and board.get_tiles()[index] is not None:
+                return None
+
+    return InvalidMoveError(
+        message='Tiles must be placed next to already placed tiles.',
+        details={'positions': positions},
+    )
+
+
+def _get_candidate(rng: random.Random, board: Board) -> list[Position]:
+    size = rng.randint(1, 7)
+
+    if rng.random() < 0.2:
+        # scattered, sometimes off the board
+        return [
+            Position(rng.randrange(-1, 16), rng.randrange(-1, 16)) for _ in range(size)
+        ]
+
+    row, column = rng.randrange(15), rng.randrange(15)
+    horizontal = rng.random() < 0.5
+    positions = [
+        Position(row, column + i) if horizontal else Position(row + i, column)
+        for i in range(0, size * 2, rng.choice((1, 1, 2)))
+    ][:size]
+
+    # mostly empty fields, like a player would choose
+    return [
+        position
+        for position in positions
+        if rng.random() < 0.1
+        or (index := board.index_of(position)) is None
+        or board.get_tiles()[index] is None
+    ] or positions
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_placement_checks_match_field_by_field_checks(seed: int) -> None:
+    rng = random.Random(seed)
+    board = _get_board()
+
+    for _ in range(20):
+        for _ in range(50):
+            positions = _get_candidate(rng, board)
+            tile_positions = [
+                (Tile(1, 1, 1000 + i), position) for i, position in enumerate(positions)
+            ]
+
+            error = evaluate_placement(
+                board, tile_positions, tiles_per_round=7, min_word_length=2
+            ).error
+            expected = _verify_naively(board, positions)
+
+            if expected is None:
+                assert error is None, error.message
+            else:
+                assert error is not None, expected.message
+                assert (error.message, error.details) == (
+                    expected.message,
+                    expected.details,
+                )
+
+        # grow the board next to the placed tiles, these placements are not checked
+        for _ in range(3):
+            _place(board, board.geometry.positions[rng.choice(board.get_anchors())])
+
+
+def test_placements_are_journaled() -> None:
+    board = _get_board()
+    assert board.last_placement() is None
+
+    board.place_tiles([(Tile(1, 1, 0), Position(7, 7))], move=0, player_id='a')
+    board.place_tiles(
+        [(Tile(2, 1, 1), Position(7, 8)), (Tile(3, 1, 2), Position(7, 9))],
+        move=2,
+        player_id='b',
+    )
+    _place(board, (6, 7))
+
+    last = board.last_placement()
+    assert last is not None
+    assert (last.move, last.player_id, last.positions) == (3, None, ((6, 7),))
+
+    assert [x.move for x in board.placements_since(0)] == [0, 2, 3]
+    assert [x.move for x in board.placements_since(1)] == [2, 3]
+    assert [x.player_id for x in board.placements_since(2)] == ['b', None]
+    assert board.placements_since(4) == []
+
+
+def test_revert_last_placement_restores_the_board() -> None:
+    board = _get_board()
+    _place(board, (7, 7), (7, 8))
+    board.clear_recently_placed()
+
+    tiles, letters = board.get_tiles(), board.get_letters()
+    masks = [board.get_row_mask(row) for row in range(board.rows)]
+    version = board.version
+
+    _place(board, (6, 8), (8, 8))
+    placement = board.revert_last_placement()
+
+    assert placement.positions == ((6, 8), (8, 8))
+    assert board.get_tiles() == tiles
+    assert board.get_letters() == letters
+    assert [board.get_row_mask(row) for row in range(board.rows)] == masks
+    index = board.index_of(Position(7, 8))
+    assert list(board.get_word_indexes(index, horizontal=False)) == [index]
+    assert not board.get_field(6, 8).is_tile_recently_placed
+    # reverting is a change of tiles too
+    assert board.version > version
+
+    board.revert_last_placement()
+    assert board.is_empty
+
+    with pytest.raises(IndexError):
+        board.revert_last_placement()
+
+
+def test_clear_recently_placed_resets_only_flagged_fields() -> None:
+    board = _get_board()
+    _place(board, (7, 7), (7, 8))
+
+    assert sorted(board.clear_recently_placed()) == [
+        board.index_of(Position(7, 7)),
+        board.index_of(Position(7, 8)),
+    ]
+    assert not any(field.is_tile_recently_placed for field in board.get_fields())
+    assert board.clear_recently_placed() == []
+
+    _place(board, (8, 8))
+    board.get_field(8, 8).is_tile_recently_placed = False
+    board.mark_recently_placed([board.index_of(Position(7, 7))])
+
+    assert board.clear_recently_placed() == [board.index_of(Position(7, 7))]
+    assert not any(field.is_tile_recently_placed for field in board.get_fields())
+
+
+def _get_run(tiles: tuple[Tile | None, ...], line: range, offset: int) -> list[int]:
+    # occupied run through the cell found by scanning the line
+    start = end = offset
+
+    while start > 0 and tiles[line[start - 1]] is not None:
+        start -= 1
+    while end + 1 < len(line) and tiles[line[end + 1]] is not None:
+        end += 1
+
+    return list(line[start : end + 1])
+
+
+def _check_word_extents(board: Board, indexes: Iterable[int]) -> None:
+    geometry = board.geometry
+    tiles = board.get_tiles()
+
+    for index in indexes:
+        horizontal = board.get_word_indexes(index, horizontal=True)
+        vertical = board.get_word_indexes(index, horizontal=False)
+
+        if tiles[index] is None:
+            assert not horizontal
+            assert not vertical
+            continue
+
+        row, column = geometry.positions[index]
+        assert list(horizontal) == _get_run(tiles, geometry.row_lines[row], column)
+        assert list(vertical) == _get_run(tiles, geometry.column_lines[column], row)
+
+
+def test_word_extents_match_a_scan_of_the_board() -> None:
+    rng = random.Random(0)
+    board = _get_board()
+    geometry = board.geometry
+
+    for step in range(20_000):
+        index = rng.randrange(len(geometry.positions))
+        field = Field(board, index)
+        field.tile = Tile(1, 1, index) if field.tile is None else None
+
+        # runs can only change in the row and the column of the changed cell,
+        # the whole board is checked once in a while
+        if step % 1000 == 0:
+            _check_word_extents(board, range(len(geometry.positions)))
+        else:
+            row, column = geometry.positions[index]
+            _check_word_extents(
+                board, (*geometry.row_lines[row], *geometry.column_lines[column])
+            )
+
+
+def _get_state(board: Board) -> tuple:
+    cells = range(board.rows * board.columns)
+
+    return (
+        board.get_tiles(),
+        board.get_letters(),
+        [field.is_tile_recently_placed for field in board.get_fields()],
+        [board.get_row_mask(row) for row in range(board.rows)],
+        [board.get_column_mask(column) for column in range(board.columns)],
+        [board.get_anchor_mask(row) for row in range(board.rows)],
+        [list(board.get_word_indexes(i, horizontal=True)) for i in cells],
+        [list(board.get_word_indexes(i, horizontal=False)) for i in cells],
+        board.placements_since(0),
+        board.is_empty,
+        board.version,
+    )
+
+
+def _change(board: Board) -> None:
+    # every kind of write, leaving the board different from where it started
+    _place(board, (6, 7), (6, 8))
+    _place(board, (5, 8))
+    board.revert_last_placement()
+    board.clear_recently_placed()
+    board.get_field(7, 7).tile = None
+    board.mark_recently_placed([board.index_of(Position(7, 8))])
+
+
+@pytest.mark.parametrize('write_snapshot', [False, True])
+def test_snapshot_is_isolated_from_the_board(write_snapshot: bool) -> None:
+    board = _get_board()
+    _place(board, (7, 6), (7, 7), (7, 8))
+    board.clear_recently_placed()
+    _place(board, (8, 6))
+
+    snapshot = board.snapshot()
+    state = _get_state(board)
+    assert _get_state(snapshot) == state
+
+    changed, unchanged = (snapshot, board) if write_snapshot else (board, snapshot)
+    _change(changed)
+
+    assert _get_state(unchanged) == state
+    assert _get_state(changed) != state
+
+    # the unchanged one still owns working buffers, and writes to it stay there
+    changed_state = _get_state(changed)
+    assert unchanged.clear_recently_placed() == [board.index_of(Position(8, 6))]
+    assert not any(field.is_tile_recently_placed for field in unchanged.get_fields())
+    unchanged.revert_last_placement()
+    _place(unchanged, (8, 7))
+
+    assert _get_state(changed) == changed_state
+
+
+def test_snapshots_of_snapshots_are_isolated() -> None:
+    board = _get_board()
+    _place(board, (7, 7))
+
+    first = board.snapshot()
+    second = first.snapshot()
+    _place(second, (7, 8))
+    _place(first, (8, 7))
+
+    assert board.get_row_mask(7) == 1 << 7
+    assert board.get_row_mask(8) == 0
+    assert first.get_row_mask(7) == 1 << 7
+    assert first.get_row_mask(8) == 1 << 7
+    assert second.get_row_mask(7) == 0b11 << 7
+    assert second.get_row_mask(8) == 0
+    assert [len(x.placements_since(0)) for x in (board, first, second)] == [1, 2, 2]
@@ -0,0 +1,58 @@
+import pytest
+
+from core.game.alphabet import BLANK, Alphabet
+from core.game.computer_player import ComputerPlayer, get_leave_value
+from core.game.enums import ComputerStrength, Language, PlayerMoveType
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.game.tile_sets import get_tile_distribution
+from core.lexicon.graph import Dawg
+
+
+@pytest.mark.parametrize('strength', list(ComputerStrength))
+def test_computer_players_play_legal_moves(
+    dawg: Dawg, strength: ComputerStrength
+) -> None:
+    config = GameConfig.default()
+    config.seed = 3
+    players = [
+        ComputerPlayer('a', 'a', strength=strength, seed=0),
+        ComputerPlayer('b', 'b', strength=strength, seed=1),
+    ]
+    game = ScrabbleGame(config, players=players, lexicon=dawg)
+    game.start()
+
+    placed = 0
+    for _ in range(12):
+        player = game.current_player
+        assert isinstance(player, ComputerPlayer)
+
+        turn = player.play_turn(game)
+        if turn.type == PlayerMoveType.PLACE_WORD:
+            assert turn.move is not None
+            assert player.scores[-1] == turn.move.score
+            placed += 1
+
+    assert placed > 0
+    assert game.move_count == 12
+
+    # the budget bounds the search, a player out of time gives up its tiles
+    player = game.current_player
+    assert isinstance(player, ComputerPlayer)
+    player.time_budget = 0
+    assert player.play_turn(game).type == PlayerMoveType.EXCHANGE
+
+
+def test_leave_value_prefers_blanks_and_balanced_racks() -> None:
+    alphabet = Alphabet.for_language(Language.POLISH)
+    vowels = alphabet.encode(get_tile_distribution(Language.POLISH).vowels)
+
+    def value(letters: str, blanks: int = 0) -> float:
+        leave = bytearray(len(alphabet))
+        leave[BLANK] = blanks
+        for code in alphabet.encode(letters):
+            leave[code] += 1
+        return get_leave_value(leave, alphabet, vowels)
+
+    assert value('', blanks=1) > value('A') > value('Ź')
+    assert value('AEN') > value('AEI')
+    assert value('ANR') > value('NNN')
@@ -0,0 +1,65 @@
+import random
+
+from core.game.alphabet import Alphabet
+from core.game.cross_checks import CrossCheckTable
+from core.game.enums import Language
+from core.game.objects.board import Board
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig
+from core.lexicon.graph import Dawg
+
+
+def test_cross_checks_follow_placements_and_reverts(dawg: Dawg) -> None:
+    config = GameConfig.default()
+    alphabet = Alphabet.for_language(Language.POLISH)
+    rng = random.Random(0)
+
+    board = Board(config.layout)
+    board.attach_cross_checks(CrossCheckTable(dawg, board.geometry))
+    original = None
+    tile_id = 0
+
+    for step in range(300):
+        if board.last_placement() is not None and rng.random() < 0.2:
+            board.revert_last_placement()
+        else:
+            # a run of random letters, not necessarily words, from a random cell
+            lines = board.geometry.row_lines + board.geometry.column_lines
+            line = rng.choice(lines)
+            tiles = board.get_tiles()
+            empty = [i for i in line[rng.randrange(len(line)) :] if tiles[i] is None]
+
+            tile_positions = []
+            for index in empty[: rng.randint(1, 7)]:
+                code = rng.randrange(1, len(alphabet))
+                tile = Tile(code, alphabet.points[code], tile_id)
+                tile_positions.append((tile, board.geometry.positions[index]))
+                tile_id += 1
+
+            if tile_positions:
+                board.place_tiles(tile_positions)
+
+        if step == 100:
+            # the snapshot keeps its own table while both boards change
+            original = board
+            board = board.snapshot()
+
+        expected = CrossCheckTable(dawg, board.geometry)
+        expected.rebuild(board)
+        for horizontal in (True, False):
+            assert board.cross_checks.get(horizontal=horizontal) == expected.get(
+                horizontal=horizontal
+            )
+
+        tiles = board.get_tiles()
+        anchors = [
+            index
+            for index, tile in enumerate(tiles)
+            if tile is None
+            and any(tiles[i] is not None for i in board.geometry.neighbours[index])
+        ]
+        assert board.get_anchors() == (anchors or [board.geometry.center])
+
+    expected = CrossCheckTable(dawg, original.geometry)
+    expected.rebuild(original)
+    assert original.cross_checks.get(horizontal=True) == expected.get(horizontal=True)
@@ -0,0 +1,64 @@
+import asyncio
+import random
+from pathlib import Path
+
+import pytest
+
+from core.engine import EngineService
+from core.exceptions.engine import EngineCancelledError, EngineOverloadedError
+from core.game.alphabet import Alphabet
+from core.game.computer_player import choose_moves
+from core.game.enums import ComputerStrength, Language
+from core.game.move_generator import MoveGenerator
+from core.game.position import encode_position
+from core.game.scrabble_game import GameConfig
+from core.lexicon.graph import Dawg
+from core.tests._helper import play_greedy
+
+
+def test_engine_searches_in_worker_processes(dawg: Dawg, dawg_path: Path) -> None:
+    alphabet = Alphabet.for_language(Language.POLISH)
+    generator = MoveGenerator(dawg, alphabet.points)
+    board, rack = play_greedy(dawg, seed=5, turns=6)[-1]
+    position = encode_position(board, rack)
+
+    async def run() -> None:
+        engine = EngineService(
+            dawg_path, GameConfig.default(), workers=2, max_pending=3
+        )
+        try:
+            await engine.start()
+
+            expected = choose_moves(
+                generator.generate(board, rack),
+                3,
+                strength=ComputerStrength.EQUITY,
+                rack=rack,
+                alphabet=alphabet,
+                rng=random.Random(0),
+            )
+            moves = await engine.search(
+                1, position, 3, strength=ComputerStrength.EQUITY
+            )
+            assert moves == expected
+
+            # the queue is limited, searches of a closed room are dropped
+            searches = [
+                asyncio.create_task(engine.search(room, position, 1))
+                for room in (1, 1, 2)
+            ]
+            await asyncio.sleep(0)
+            with pytest.raises(EngineOverloadedError):
+                await engine.search(3, position, 1)
+
+            assert engine.cancel(1) == 2
+            results = await asyncio.gather(*searches, return_exceptions=True)
+            assert [type(result) for result in results[:2]] == [
+                EngineCancelledError
+            ] * 2
+            assert len(results[2]) == 1
+            assert engine.pending_count == 0
+        finally:
+            engine.close()
+
+    asyncio.run(run())
@@ -0,0 +1,136 @@
+from core.exceptions.game import InvalidMoveError
+from core.game.evaluation import BINGO_BONUS, MoveEvaluation, evaluate_placement
+from core.game.objects.board import Board
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig
+from core.game.types import Position
+
+# standard layout, row 7: triple word at 0, double letter at 3, double word at 7,
+# row 8: double letters at 2, 6, 8 and 12
+
+
+def _evaluate(
+    board: Board,
+    tiles: list[tuple[int, int, Position]],
+    blank_codes: dict[int, int] | None = None,
+) -> MoveEvaluation:
+    # tiles as (letter code, points, position), IDs follow their order
+    return evaluate_placement(
+        board,
+        [
+            (Tile(code, points, 100 + i), pos)
+            for i, (code, points, pos) in enumerate(tiles)
+        ],
+        tiles_per_round=7,
+        min_word_length=2,
+        blank_codes=blank_codes,
+    )
+
+
+def _get_board() -> Board:
+    # word of 1, 2 and 3 points across the center, placed in an earlier move
+    board = Board(GameConfig.default().layout)
+    board.place_tiles(
+        [
+            (Tile(1, 1, 0), Position(7, 5)),
+            (Tile(2, 2, 1), Position(7, 6)),
+            (Tile(3, 3, 2), Position(7, 7)),
+        ]
+    )
+    board.clear_recently_placed()
+
+    return board
+
+
+def test_first_move_doubles_on_the_center() -> None:
+    board = Board(GameConfig.default().layout)
+
+    evaluation = _evaluate(
+        board,
+        [
+            (4, 2, Position(7, 3)),
+            (1, 1, Position(7, 4)),
+            (1, 1, Position(7, 5)),
+            (2, 2, Position(7, 6)),
+            (3, 3, Position(7, 7)),
+        ],
+    )
+
+    # (2 * 2 + 1 + 1 + 2 + 3) * 2, single letters down are not words
+    assert evaluation.is_valid
+    assert evaluation.score == 22
+    assert not evaluation.bingo
+    assert len(evaluation.words) == 1
+    assert evaluation.words[0].letters == bytes([4, 1, 1, 2, 3])
+    assert evaluation.words[0].positions == tuple(Position(7, c) for c in range(3, 8))
+    assert board.is_empty
+
+
+def test_bonuses_of_old_tiles_are_not_counted() -> None:
+    evaluation = _evaluate(
+        _get_board(), [(4, 2, Position(7, 3)), (5, 1, Position(7, 4))]
+    )
+
+    # 2 * 2 + 1 + 1 + 2 + 3, the double word under the old 3 is used up
+    assert evaluation.score == 11
+    assert evaluation.words[0].letters == bytes([4, 5, 1, 2, 3])
+
+
+def test_parallel_play_scores_every_cross_word() -> None:
+    evaluation = _evaluate(
+        _get_board(), [(4, 4, Position(8, 6)), (5, 5, Position(8, 7))]
+    )
+
+    assert [(word.letters, word.score) for word in evaluation.words] == [
+        # 4 * 2 + 5
+        (bytes([4, 5]), 13),
+        # old 2 above the new double letter 4
+        (bytes([2, 4]), 10),
+        (bytes([3, 5]), 8),
+    ]
+    assert evaluation.score == 31
+
+
+def test_blanks_score_nothing_with_their_chosen_letter() -> None:
+    board = Board(GameConfig.default().layout)
+
+    evaluation = _evaluate(
+        board,
+        [(0, 0, Position(7, 7)), (3, 3, Position(7, 8))],
+        blank_codes={100: 6},
+    )
+
+    # (0 + 3) * 2
+    assert evaluation.score == 6
+    assert evaluation.words[0].letters == bytes([6, 3])
+
+
+def test_using_all_tiles_adds_the_bingo_bonus() -> None:
+    board = Board(GameConfig.default().layout)
+
+    evaluation = _evaluate(
+        board, [(1, 1, Position(7, column)) for column in range(4, 11)]
+    )
+
+    assert evaluation.bingo
+    assert evaluation.score == 7 * 2 + BINGO_BONUS
+
+
+def test_triple_word_multiplies_with_other_bonuses() -> None:
+    board = _get_board()
+    tiles = [(1, 1, Position(7, c)) for c in range(5)]
+    tiles[3] = (4, 2, Position(7, 3))
+
+    evaluation = _evaluate(board, tiles)
+
+    # (1 + 1 + 1 + 2 * 2 + 1 + 1 + 2 + 3) * 3
+    assert evaluation.score == 42
+
+
+def test_invalid_placement_scores_nothing() -> None:
+    evaluation = _evaluate(_get_board(), [(1, 1, Position(0, 0))])
+
+    assert isinstance(evaluation.error, InvalidMoveError)
+    assert not evaluation.is_valid
+    assert evaluation.score == 0
+    assert evaluation.words == ()
@@ -1 +1,36 @@
-from core.game.scrabble_game import GameConfig
+import random
+
+from core.game.objects.player import Player
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.game.types import Position
+
+
+def _play(config: GameConfig) -> tuple[ScrabbleGame, list]:
+    game = ScrabbleGame(config, players=[Player('a', 'a'), Player('b', 'b')])
+    game.start()
+
+    # moves are chosen by tile ID and rack position, like a recorded game would
+    moves = random.Random(1)
+    player = game.current_player
+    game.place_tiles(
+        player, [(player.tiles[0], Position(7, 7)), (player.tiles[1], Position(7, 8))]
+    )
+
+    for _ in range(20):
+        player = game.current_player
+        game.exchange_tiles(player, moves.sample(list(player.tiles), 3))
+
+    state = [(p.id, [t.id for t in p.tiles], p.scores) for p in game.players]
+    return game, state
+
+
+def test_game_is_replayed_from_its_seed() -> None:
+    game, state = _play(GameConfig.default())
+
+    # the seed drawn for the game is recorded in its config
+    assert game.config.seed is not None
+    assert _play(game.config)[1] == state
+
+    other = GameConfig.default()
+    other.seed = game.config.seed + 1
+    assert _play(other)[1] != state
@@ -0,0 +1,61 @@
+import heapq
+
+import pytest
+
+from core.exceptions.game import GameNotInProgressError, PlayerNotFoundError
+from core.game.objects.player import Player
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.lexicon.graph import Dawg
+
+
+def _get_game(dawg: Dawg) -> ScrabbleGame:
+    config = GameConfig.default()
+    config.seed = 2
+
+    return ScrabbleGame(
+        config, players=[Player('a', 'a'), Player('b', 'b')], lexicon=dawg
+    )
+
+
+def test_hints_are_only_given_to_players_of_a_started_game(dawg: Dawg) -> None:
+    game = _get_game(dawg)
+
+    with pytest.raises(GameNotInProgressError):
+        game.get_hint_key(game.players[0])
+
+    game.start()
+
+    with pytest.raises(PlayerNotFoundError):
+        game.get_hint_key(Player('c', 'c'))
+
+
+def test_hints_are_cached_per_board_and_rack(dawg: Dawg) -> None:
+    game = _get_game(dawg)
+    game.start()
+    player = game.current_player
+    other = next(p for p in game.players if p is not player)
+
+    key = game.get_hint_key(player)
+    assert game.get_cached_hints(key) is None
+
+    generated = game.move_generator.generate(game.board, player.letter_counts)
+    moves = heapq.nlargest(5, generated, key=lambda x: x.score)
+    assert moves
+
+    game.cache_hints(key, moves)
+    assert game.get_cached_hints(key) == moves
+    assert game.get_hint_key(player) == key
+    assert game.get_cached_hints(game.get_hint_key(other)) is None
+
+    # the suggested tiles come from the rack and score as generated
+    best = game.get_suggested_move(moves[0], player.tiles)
+    game.place_tiles(
+        player, list(best.tile_positions), blank_symbols=list(best.blank_symbols)
+    )
+    assert player.scores[-1] == best.score
+
+    # moves found for the old board are neither returned nor stored
+    assert game.get_cached_hints(key) is None
+    game.cache_hints(key, moves)
+    assert game.get_cached_hints(key) is None
+    assert game.get_cached_hints(game.get_hint_key(other)) is None
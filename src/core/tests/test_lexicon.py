@@ -0,0 +1,188 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from core.exceptions.game import InvalidMoveError
+from core.exceptions.lexicon import (
+    LexiconAlphabetError,
+    LexiconBuildError,
+    LexiconFormatError,
+)
+from core.game.alphabet import Alphabet
+from core.game.enums import Language
+from core.game.objects.player import Player
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.game.types import Position
+from core.lexicon.artifacts import build_artifact, verify_alphabet
+from core.lexicon.builder import build_dawg, build_gaddag
+from core.lexicon.format import LexiconKind
+from core.lexicon.graph import Dawg, Gaddag
+
+ALPHABET = 'AĄBCĆDEĘFGHIJKLŁMNŃOÓPRSŚTUWYZŹŻ'
+
+
+@pytest.fixture
+def words() -> list[str]:
+    rng = random.Random(0)
+    stems = {
+        ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 8)))
+        for _ in range(2000)
+    }
+    return [stem + ending for stem in stems for ending in ('', 'A', 'EM', 'ÓW')]
+
+
+def test_dawg_contains_exactly_the_words(tmp_path: Path, words: list[str]) -> None:
+    build_dawg(words, tmp_path / 'words.dawg', alphabet=ALPHABET)
+
+    with Dawg.load(tmp_path / 'words.dawg') as dawg:
+        rng = random.Random(1)
+        others = [
+            ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 9)))
+            for _ in range(2000)
+        ]
+
+        for word in words + others:
+            assert (word in dawg) == (word in words)
+
+        assert '' not in dawg
+        assert 'X' not in dawg
+        assert dawg.word_count == len(set(words))
+
+
+def test_gaddag_has_path_from_every_letter(tmp_path: Path, words: list[str]) -> None:
+    build_gaddag(words[:500], tmp_path / 'words.gaddag', alphabet=ALPHABET)
+
+    with Gaddag.load(tmp_path / 'words.gaddag') as gaddag:
+        for word in words[:500]:
+            assert word in gaddag
+
+            for split in range(1, len(word) + 1):
+                node: int | None = gaddag.root
+                path = [*reversed(word[:split]), None, *word[split:]]
+
+                for letter in path:
+                    assert node is not None
+                    code = (
+                        gaddag.separator if letter is None else gaddag.get_code(letter)
+                    )
+                    assert code in dict(gaddag.arcs(node))
+                    node = gaddag.child(node, code)  # type: ignore[arg-type]
+
+                assert node is not None and gaddag.is_terminal(node)
+
+        assert words[500] not in gaddag or words[500] in words[:500]
+
+
+def test_load_rejects_other_kind(tmp_path: Path) -> None:
+    build_dawg(['KOT'], tmp_path / 'words.dawg')
+
+    with pytest.raises(LexiconFormatError):
+        Gaddag.load(tmp_path / 'words.dawg')
+
+
+def test_dawg_is_minimized(tmp_path: Path) -> None:
+    # all words share the suffix after their first letter, so it is stored once
+    words = [letter + 'OWANIE' for letter in 'ABCDEFGH']
+    header = build_dawg(words, tmp_path / 'words.dawg')
+
+    assert header.edge_count == len(words) + len('OWANIE') + 1
+
+
+def test_dawg_normalizes_words(tmp_path: Path) -> None:
+    build_dawg([' kot\n', 'KOT', 'pies', ''], tmp_path / 'words.dawg')
+
+    with Dawg.load(tmp_path / 'words.dawg') as dawg:
+        assert 'KOT' in dawg
+        assert 'PIES' in dawg
+        assert dawg.word_count == 2
+
+
+def test_build_rejects_letters_outside_alphabet(tmp_path: Path) -> None:
+    with pytest.raises(LexiconBuildError):
+        build_dawg(['KOT', 'QUIZ'], tmp_path / 'words.dawg', alphabet=ALPHABET)
+
+
+def test_load_rejects_invalid_file(tmp_path: Path) -> None:
+    build_dawg(['KOT'], tmp_path / 'words.dawg')
+    data = (tmp_path / 'words.dawg').read_bytes()
+
+    (tmp_path / 'truncated.dawg').write_bytes(data[:-1])
+    (tmp_path / 'other.dawg').write_bytes(b'not a lexicon at all, just some bytes')
+
+    for name in ('truncated.dawg', 'other.dawg'):
+        with pytest.raises(LexiconFormatError):
+            Dawg.load(tmp_path / name)
+
+
+def test_game_rejects_words_outside_lexicon(tmp_path: Path) -> None:
+    alphabet = Alphabet.for_language(Language.POLISH)
+    build_dawg(['KOT'], tmp_path / 'words.dawg', alphabet=alphabet.letters)
+
+    with Dawg.load(tmp_path / 'words.dawg') as dawg:
+        player = Player('a', 'a')
+        game = ScrabbleGame(GameConfig.default(), players=[player], lexicon=dawg)
+        game.start()
+
+        def place(word: str) -> list[tuple[Tile, Position]]:
+            codes = alphabet.encode(word)
+            tiles = [Tile(code, 1, 100 + i) for i, code in enumerate(codes)]
+            player.tiles = [*tiles, *player.tiles[len(tiles) :]]
+            return [(tile, Position(7, 7 + i)) for i, tile in enumerate(tiles)]
+
+        evaluation = game.preview_move(player, place('KOS'))
+        assert not evaluation.is_valid
+        assert evaluation.error is not None
+        assert evaluation.error.details == {'words': ['KOS']}
+
+        with pytest.raises(InvalidMoveError):
+            game.place_tiles(player, place('KOS'))
+
+        game.place_tiles(player, place('KOT'))
+        assert player.scores == [6]
+
+
+def test_build_artifact_is_cached_by_content(tmp_path: Path) -> None:
+    source = tmp_path / 'words.txt'
+    source.write_text('kot\nżółw\n', encoding='utf-8')
+
+    path, header = build_artifact(
+        source, tmp_path / 'cache', kind=LexiconKind.DAWG, language=Language.POLISH
+    )
+    assert header is not None
+
+    cached_path, cached_header = build_artifact(
+        source, tmp_path / 'cache', kind=LexiconKind.DAWG, language=Language.POLISH
+    )
+    assert (cached_path, cached_header) == (path, None)
+
+    source.write_text('kot\nżółw\npies\n', encoding='utf-8')
+    changed_path, _ = build_artifact(
+        source, tmp_path / 'cache', kind=LexiconKind.DAWG, language=Language.POLISH
+    )
+    assert changed_path != path
+
+    with Dawg.load(changed_path) as dawg:
+        verify_alphabet(dawg, Language.POLISH)
+        assert 'ŻÓŁW' in dawg
+
+
+def test_build_artifact_rejects_letters_outside_tile_set(tmp_path: Path) -> None:
+    source = tmp_path / 'words.txt'
+    source.write_text('quiz\n', encoding='utf-8')
+
+    with pytest.raises(LexiconAlphabetError):
+        build_artifact(
+            source, tmp_path / 'cache', kind=LexiconKind.DAWG, language=Language.POLISH
+        )
+
+
+def test_verify_alphabet_rejects_other_tile_set(tmp_path: Path) -> None:
+    build_dawg(['KOT'], tmp_path / 'words.dawg')
+
+    with (
+        Dawg.load(tmp_path / 'words.dawg') as dawg,
+        pytest.raises(LexiconAlphabetError),
+    ):
+        verify_alphabet(dawg, Language.POLISH)
@@ -0,0 +1,122 @@
+import itertools
+
+from core.game.alphabet import BLANK, Alphabet
+from core.game.enums import Language
+from core.game.evaluation import evaluate_placement
+from core.game.move_generator import GeneratedMove, MoveGenerator
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig
+from core.lexicon.graph import Dawg
+from core.tests._helper import play_greedy
+
+
+def _get_tiles(move: GeneratedMove) -> tuple[list, dict[int, int]]:
+    alphabet = Alphabet.for_language(Language.POLISH)
+    tile_positions = []
+    blank_codes = {}
+
+    for i, (position, code, blank) in enumerate(
+        zip(move.positions, move.letters, move.blanks, strict=True)
+    ):
+        if blank:
+            tile_positions.append((Tile(BLANK, 0, i), position))
+            blank_codes[i] = code
+        else:
+            tile_positions.append((Tile(code, alphabet.points[code], i), position))
+
+    return tile_positions, blank_codes
+
+
+def test_generated_moves_are_valid_and_scored_like_the_game(dawg: Dawg) -> None:
+    config = GameConfig.default()
+    generator = MoveGenerator(dawg, Alphabet.for_language(Language.POLISH).points)
+
+    for board, rack in play_greedy(dawg, seed=0, turns=16):
+        moves = generator.generate(board, rack)
+        assert len({(m.positions, m.letters, m.blanks) for m in moves}) == len(moves)
+
+        for move in moves:
+            tile_positions, blank_codes = _get_tiles(move)
+            evaluation = evaluate_placement(
+                board,
+                tile_positions,
+                tiles_per_round=config.tiles_per_round,
+                min_word_length=config.min_word_length,
+                blank_codes=blank_codes,
+                lexicon=dawg,
+            )
+            assert evaluation.is_valid
+            assert evaluation.score == move.score
+
+
+def test_generator_finds_every_placement(dawg: Dawg) -> None:
+    config = GameConfig.default()
+    alphabet = Alphabet.for_language(Language.POLISH)
+    generator = MoveGenerator(dawg, alphabet.points)
+    board, _ = play_greedy(dawg, seed=1, turns=6)[-1]
+
+    # every placement of the rack with a blank, checked one by one
+    rack = [*alphabet.encode('AK'), BLANK]
+    counts = bytearray(len(alphabet))
+    for code in rack:
+        counts[code] += 1
+
+    expected = set()
+    tiles = board.get_tiles()
+    neighbours = board.geometry.neighbours
+    letters = range(1, len(alphabet))
+
+    for horizontal, lines in (
+        (True, board.geometry.row_lines),
+        (False, board.geometry.column_lines),
+    ):
+        for line, start in itertools.product(lines, range(board.columns)):
+            empty = [i for i in line[start:] if tiles[i] is None]
+
+            for size in range(1, len(rack) + 1):
+                indexes = empty[:size]
+                if len(indexes) < size or indexes[0] != line[start]:
+                    continue
+
+                # placements away from the tiles are rejected whatever the letters
+                if not any(
+                    tiles[j] is not None for i in indexes for j in neighbours[i]
+                ):
+                    continue
+
+                for chosen in itertools.permutations(rack, size):
+                    for codes in itertools.product(
+                        *[letters if code == BLANK else [code] for code in chosen]
+                    ):
+                        move = GeneratedMove(
+                            positions=tuple(
+                                board.geometry.positions[i] for i in indexes
+                            ),
+                            letters=bytes(codes),
+                            blanks=tuple(code == BLANK for code in chosen),
+                            horizontal=horizontal,
+                            score=0,
+                        )
+                        tile_positions, blank_codes = _get_tiles(move)
+                        evaluation = evaluate_placement(
+                            board,
+                            tile_positions,
+                            tiles_per_round=config.tiles_per_round,
+                            min_word_length=config.min_word_length,
+                            blank_codes=blank_codes,
+                            lexicon=dawg,
+                        )
+                        if evaluation.is_valid:
+                            expected.add(
+                                (
+                                    move.positions,
+                                    move.letters,
+                                    move.blanks,
+                                    evaluation.score,
+                                )
+                            )
+
+    assert any(len(positions) == len(rack) for positions, *_ in expected)
+
+    moves = generator.generate(board, counts)
+    assert {(m.positions, m.letters, m.blanks, m.score) for m in moves} == expected
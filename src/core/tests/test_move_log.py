@@ -0,0 +1,186 @@
+import pytest
+
+from core.exceptions.game import InvalidMoveError, InvalidOperationError
+from core.game.move_log import MoveLog
+from core.game.objects.player import Player
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.game.types import Position
+
+
+def test_failed_transaction_is_rolled_back_and_not_logged() -> None:
+    log = MoveLog()
+    values: list[int] = []
+
+    with pytest.raises(ValueError), log.transaction():
+        log.apply(apply=lambda: values.append(1), revert=values.pop)
+        log.apply(apply=lambda: values.append(2), revert=values.pop)
+        raise ValueError
+
+    assert values == []
+    assert not log.can_undo
+    assert not log.in_transaction
+
+
+def test_undo_and_redo_replay_transactions() -> None:
+    log = MoveLog()
+    values: list[int] = []
+
+    for value in (1, 2):
+        with log.transaction():
+            log.apply(apply=lambda v=value: values.append(v), revert=values.pop)
+
+    log.undo()
+    assert values == [1]
+    log.undo()
+    assert values == []
+    assert not log.can_undo
+
+    log.redo()
+    assert values == [1]
+    assert log.can_redo
+
+    # a new move makes the undone ones unreachable
+    with log.transaction():
+        log.apply(apply=lambda: values.append(3), revert=values.pop)
+
+    assert values == [1, 3]
+    assert not log.can_redo
+
+
+def test_transactions_do_not_nest() -> None:
+    log = MoveLog()
+
+    with log.transaction():
+        with pytest.raises(RuntimeError), log.transaction():
+            pass
+
+        with pytest.raises(RuntimeError):
+            log.undo()
+
+
+def _get_game() -> ScrabbleGame:
+    config = GameConfig.default()
+    config.seed = 0
+    game = ScrabbleGame(config, players=[Player('a', 'a'), Player('b', 'b')])
+    game.start()
+
+    return game
+
+
+def _get_state(game: ScrabbleGame) -> tuple:
+    board = game.board
+    bag = game._tile_bag
+
+    return (
+        game.move_count,
+        game.current_player.id,
+        board.get_tiles(),
+        board.get_letters(),
+        [field.is_tile_recently_placed for field in board.get_fields()],
+        board.placements_since(0),
+        [(tile.id, tile.code) for tile in board.get_tiles() if tile is not None],
+        [(p.id, p.tiles, p.letter_counts, list(p.scores)) for p in game.players],
+        bag.letter_counts,
+        bag.remaining_tiles_count,
+        [sorted(tile.id for tile in stack) for stack in bag._stacks],
+    )
+
+
+def _play_moves(game: ScrabbleGame) -> list[tuple]:
+    # place, exchange and skip, returns the state before every move and at the end
+    states = [_get_state(game)]
+
+    player = game.current_player
+    tiles = player.tiles
+    game.place_tiles(player, [(tiles[0], Position(7, 7)), (tiles[1], Position(7, 8))])
+    states.append(_get_state(game))
+
+    player = game.current_player
+    game.exchange_tiles(player, list(player.tiles[2:5]))
+    states.append(_get_state(game))
+
+    game.skip_turn(game.current_player)
+    states.append(_get_state(game))
+
+    player = game.current_player
+    tiles = player.tiles
+    game.place_tiles(player, [(tiles[0], Position(6, 8)), (tiles[1], Position(8, 8))])
+    states.append(_get_state(game))
+
+    return states
+
+
+def test_undo_and_redo_restore_the_game_exactly() -> None:
+    game = _get_game()
+    states = _play_moves(game)
+
+    for state in reversed(states[:-1]):
+        game.undo()
+        assert _get_state(game) == state
+
+    assert not game.can_undo
+    with pytest.raises(InvalidOperationError):
+        game.undo()
+
+    for state in states[1:]:
+        game.redo()
+        assert _get_state(game) == state
+
+    assert not game.can_redo
+    with pytest.raises(InvalidOperationError):
+        game.redo()
+
+
+def test_new_move_clears_redo() -> None:
+    game = _get_game()
+    _play_moves(game)
+
+    game.undo()
+    game.undo()
+    assert game.can_redo
+
+    game.skip_turn(game.current_player)
+    assert not game.can_redo
+    assert game.can_undo
+
+
+def test_invalid_move_leaves_the_game_unchanged() -> None:
+    game = _get_game()
+    state = _get_state(game)
+    player = game.current_player
+
+    with pytest.raises(InvalidMoveError):
+        game.place_tiles(player, [(player.tiles[0], Position(0, 0))])
+
+    assert _get_state(game) == state
+    assert not game.can_undo
+
+
+@pytest.mark.parametrize('move', ['place', 'exchange'])
+def test_move_failing_partway_is_rolled_back(
+    move: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    game = _get_game()
+    _play_moves(game)
+    game.undo()
+    state = _get_state(game)
+
+    # fails after the board, the score and the bag have already been changed
+    def replace_tiles(*args, **kwargs) -> None:
+        raise RuntimeError
+
+    monkeypatch.setattr(game, '_replace_tiles', replace_tiles)
+    player = game.current_player
+    tiles = player.tiles
+
+    with pytest.raises(RuntimeError):
+        if move == 'place':
+            game.place_tiles(
+                player, [(tiles[0], Position(6, 8)), (tiles[1], Position(8, 8))]
+            )
+        else:
+            game.exchange_tiles(player, list(tiles[:3]))
+
+    assert _get_state(game) == state
+    # the undone move can still be redone, a failed move is not a new one
+    assert game.can_redo
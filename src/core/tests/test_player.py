@@ -0,0 +1,51 @@
+from core.game.alphabet import BLANK
+from core.game.objects.player import Player
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+
+
+def _count_letters(player: Player) -> bytes:
+    counts = bytearray(len(player.letter_counts))
+    for tile in player.tiles:
+        counts[BLANK if tile.is_blank else tile.code] += 1
+
+    return bytes(counts)
+
+
+def test_letter_counts_follow_rack_changes() -> None:
+    config = GameConfig.default()
+    config.seed = 0
+    players = [Player('a', 'a'), Player('b', 'b')]
+    game = ScrabbleGame(config, players=players)
+    game.start()
+
+    for _ in range(10):
+        player = game.current_player
+        game.exchange_tiles(player, list(player.tiles[:3]))
+        assert player.letter_counts == _count_letters(player)
+
+    while game.can_undo:
+        game.undo()
+        for player in players:
+            assert player.letter_counts == _count_letters(player)
+
+
+def test_can_form_uses_blanks_for_missing_letters() -> None:
+    game = ScrabbleGame(
+        GameConfig.default(), players=[Player('a', 'a'), Player('b', 'b')]
+    )
+    player = game.players[0]
+    codes = game.alphabet.encode
+
+    tiles = game._tile_bag.scrabble(100)
+    rack = [next(t for t in tiles if t.code == c) for c in codes('KOT')]
+    blank = next(t for t in tiles if t.is_blank)
+
+    player.tiles = rack
+    assert player.can_form(codes('TOK'))
+    assert not player.can_form(codes('KOTY'))
+    assert not player.can_form(codes('KOK'))
+
+    player.add_tile(blank)
+    assert player.count_letter(BLANK) == 1
+    assert player.can_form(codes('KOTY'))
+    assert not player.can_form(codes('KOTYK'))
@@ -0,0 +1,63 @@
+import pytest
+
+from core.game.alphabet import Alphabet
+from core.game.enums import Language
+from core.game.move_generator import MoveGenerator
+from core.game.position import decode_position, encode_position
+from core.game.scrabble_game import GameConfig
+from core.lexicon.graph import Dawg
+from core.tests._helper import play_greedy
+
+
+def test_positions_survive_encoding(dawg: Dawg) -> None:
+    config = GameConfig.default()
+    alphabet = Alphabet.for_language(Language.POLISH)
+    generator = MoveGenerator(dawg, alphabet.points)
+
+    for board, rack in play_greedy(dawg, seed=4, turns=8):
+        table = board.cross_checks
+        assert table is not None
+
+        data = encode_position(board, rack)
+        decoded, decoded_rack, cross_checks = decode_position(
+            data, config.layout, alphabet
+        )
+        assert decoded_rack == rack
+        assert decoded.get_letters() == board.get_letters()
+        assert [t and t.points for t in decoded.get_tiles()] == [
+            t and t.points for t in board.get_tiles()
+        ]
+
+        # the cross-checks of the attached table are sent along
+        assert cross_checks == (
+            table.get(horizontal=True),
+            table.get(horizontal=False),
+        )
+        assert decoded.cross_checks is None
+        assert generator.generate(
+            decoded, rack, cross_checks=cross_checks
+        ) == generator.generate(board, rack)
+
+        # without a table only the tiles are sent, searches compute cross-checks
+        board.attach_cross_checks(None)
+        data = encode_position(board, rack)
+        assert len(data) == len(board.geometry) + 1 + sum(rack)
+
+        decoded, decoded_rack, cross_checks = decode_position(
+            data, config.layout, alphabet
+        )
+        assert decoded_rack == rack
+        assert cross_checks is None
+        assert generator.generate(decoded, rack) == generator.generate(board, rack)
+
+
+def test_truncated_positions_are_rejected(dawg: Dawg) -> None:
+    config = GameConfig.default()
+    alphabet = Alphabet.for_language(Language.POLISH)
+    board, rack = play_greedy(dawg, seed=4, turns=1)[0]
+    data = encode_position(board, rack)
+    cells = len(board.geometry)
+
+    for size in (cells, cells + 100):
+        with pytest.raises(ValueError):
+            decode_position(data[:size], config.layout, alphabet)
@@ -0,0 +1,60 @@
+from core.exceptions.game import (
+    GameNotInProgressError,
+    InvalidMoveError,
+    InvalidOperationError,
+)
+from core.game.objects.player import Player
+from core.game.objects.tile import Tile
+from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.game.types import Position
+
+
+def _get_game() -> ScrabbleGame:
+    config = GameConfig.default()
+    config.seed = 0
+
+    return ScrabbleGame(config, players=[Player('a', 'a'), Player('b', 'b')])
+
+
+def test_preview_is_memoized_until_the_board_changes() -> None:
+    game = _get_game()
+    game.start()
+    player = game.current_player
+    other = next(p for p in game.players if p is not player)
+    move = [(other.tiles[0], Position(7, 7)), (other.tiles[1], Position(7, 8))]
+
+    # previews do not check turn order
+    evaluation = game.preview_move(other, move)
+    assert evaluation.is_valid
+    assert game.preview_move(other, list(move)) is evaluation
+    assert game.preview_move(player, move) is not evaluation
+
+    game.place_tiles(
+        player, [(player.tiles[0], Position(7, 7)), (player.tiles[1], Position(6, 7))]
+    )
+
+    moved = game.preview_move(other, move)
+    assert isinstance(moved.error, InvalidMoveError)
+    assert game.preview_move(other, move) is moved
+
+    # undoing changes the board back, the result is computed again
+    game.undo()
+    again = game.preview_move(other, move)
+    assert again is not evaluation
+    assert again == evaluation
+
+
+def test_preview_is_recomputed_after_the_game_starts() -> None:
+    game = _get_game()
+    player = game.players[0]
+    # a tile of no player, the move is checked further once the game is started
+    move = [(Tile(1, 1, 999), Position(7, 7))]
+
+    evaluation = game.preview_move(player, move)
+    assert isinstance(evaluation.error, GameNotInProgressError)
+    assert game.preview_move(player, move) is evaluation
+
+    game.start()
+
+    # board version and move number are the same as before the start
+    assert isinstance(game.preview_move(player, move).error, InvalidOperationError)
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from core.game.enums import Language
+from core.game.objects.tile_bag import TileBag, TileSet, draw_letters
+from core.game.tile_sets import get_tile_distribution
+
+
+@pytest.mark.parametrize('language', list(Language))
+def test_every_language_has_a_tile_set(language: Language) -> None:
+    distribution = get_tile_distribution(language)
+    tile_set = TileSet.for_language(language)
+
+    assert TileSet.for_language(language) is tile_set
+    assert len(tile_set.codes) == distribution.tile_count >= 100
+    assert sum(1 for points in tile_set.points if points == 0) == 2
+
+    bag = TileBag(language)
+    tiles = bag.scrabble(bag.remaining_tiles_count)
+    assert len({tile.id for tile in tiles}) == distribution.tile_count
+    assert all(tile.code == 0 for tile in tiles if tile.is_blank)
+    assert bag.all_letters(with_blank=False) == set(tile_set.alphabet.letters)
+
+
+def test_tile_bag_counts_follow_draws() -> None:
+    bag = TileBag(Language.POLISH, rng=random.Random(0))
+    total = bag.remaining_tiles_count
+
+    drawn = bag.scrabble(7)
+    exchanged = bag.exchange(drawn[:3])
+    bag.take(drawn[:1])
+    bag.put_back(drawn[:1])
+
+    rest = bag.scrabble(total)
+    assert bag.is_empty and not any(bag.letter_counts)
+    assert len({tile.id for tile in [*drawn[3:], *exchanged, *rest]}) == total
+
+    bag.put_back(rest)
+    assert bag.remaining_tiles_count == len(rest)
+
+
+def test_draw_letters_is_weighted_by_counts() -> None:
+    rng = random.Random(0)
+    counts = bytearray([0, 30, 10, 0])
+
+    drawn = draw_letters(counts, 20, rng)
+    assert len(drawn) == 20 and sum(counts) == 20
+    assert counts[1] + drawn.count(1) == 30 and 3 not in drawn
+
+    assert len(draw_letters(counts, 100, rng)) == 20
+    assert not any(counts)
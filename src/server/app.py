@@ -2,12 +2,18 @@ import asyncio
 import json
 import logging
 import logging.config
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
 from websockets import ConnectionClosedError
 from websockets.asyncio.server import ServerConnection, serve
 
+from core.engine import EngineService
+from core.exceptions.lexicon import LexiconError
+from core.game.scrabble_game import GameConfig
+from core.lexicon.artifacts import verify_alphabet
+from core.lexicon.graph import Dawg
 from core.protocol import client_data
 from core.protocol.error_codes import ErrorCode
 from core.protocol.message_types import (
@@ -35,6 +41,10 @@ class ServerConfig:
     log_format: str = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
     log_file: str | None = None
     enable_websocket_logging: bool = False
+    # compiled DAWG lexicon, placed words are not checked without it
+    lexicon_path: str | None = None
+    # processes searching hints and computer moves, one per CPU if None
+    engine_workers: int | None = None
 
 
 def setup_logging(config: ServerConfig) -> None:
@@ -104,17 +114,63 @@ class GameServer:
         self.config = config or ServerConfig()
 
         self.logger = logging.getLogger('server.GameServer')
+        self.lexicon = self._load_lexicon()
+        self.engine = self._create_engine()
         self.room_manager = RoomManager()
-        self.game_handler = GameHandler(self.room_manager)
+        self.game_handler = GameHandler(
+            self.room_manager, lexicon=self.lexicon, engine=self.engine
+        )
         self.room_handler = RoomHandler(self.room_manager, self.game_handler)
 
         self.logger.info(
             f'Game server initialized - Host: {self.config.host}, Port: {self.config.port}'
         )
 
+    def _load_lexicon(self) -> Dawg | None:
+        """Loads the precompiled lexicon, see `python -m core.lexicon build`.
+
+        The server refuses to start with a lexicon which is not a DAWG of the current
+        format, or was compiled for another tile set, it is never rebuilt here.
+        """
+        if self.config.lexicon_path is None:
+            self.logger.warning('No lexicon configured, placed words are not checked')
+            return None
+
+        try:
+            lexicon = Dawg.load(self.config.lexicon_path)
+            verify_alphabet(lexicon, GameConfig.default().language)
+        except LexiconError as e:
+            self.logger.error(
+                f'Cannot use lexicon {self.config.lexicon_path!r}: {e.message}',
+                extra={'details': e.details},
+            )
+            raise
+
+        self.logger.info(f'Lexicon loaded: {lexicon}')
+
+        return lexicon
+
+    def _create_engine(self) -> EngineService | None:
+        """Creates the pool of processes searching moves, which needs the lexicon."""
+        if self.lexicon is None or self.config.lexicon_path is None:
+            self.logger.warning(
+                'No lexicon configured, hints and computer players are off'
+            )
+            return None
+
+        return EngineService(
+            self.config.lexicon_path,
+            GameConfig.default(),
+            workers=self.config.engine_workers,
+        )
+
     async def run(self) -> None:
         self.logger.info(f'Starting server on {self.config.host}:{self.config.port}')
 
+        if self.engine is not None:
+            await self.engine.start()
+            self.logger.info(f'Engine started: {self.engine}')
+
         try:
             async with serve(
                 handler=self.handler, host=self.config.host, port=self.config.port
@@ -124,6 +180,9 @@ class GameServer:
         except Exception as e:
             self.logger.error(f'Failed to start server: {e}', exc_info=True)
             raise
+        finally:
+            if self.engine is not None:
+                self.engine.close()
 
     async def handler(self, websocket: ServerConnection) -> None:
         client_info = f'{websocket.remote_address[0]}:{websocket.remote_address[1]}'
@@ -142,6 +201,7 @@ class GameServer:
         finally:
             self.logger.info(f'Connection closed: {client_info}')
             await websocket.close()
+            self.room_handler.handle_disconnect(websocket)
 
     async def message_router(
         self, websocket: ServerConnection, message: MessageData
@@ -165,6 +225,11 @@ class GameServer:
                 data = client_data.StartGameData.from_dict(message.data)
                 await self.game_handler.handle_start_game(websocket, data)
 
+            case ClientMessageType.ADD_COMPUTER_PLAYER:
+                assert message.data
+                data = client_data.AddComputerPlayerData.from_dict(message.data)
+                await self.room_handler.handle_add_computer_player(websocket, data)
+
             case ClientMessageType.PLACE_TILES:
                 assert message.data
                 data = client_data.PlaceTilesData.from_dict(message.data)
@@ -180,6 +245,16 @@ class GameServer:
                 data = client_data.SkipTurnData.from_dict(message.data)
                 await self.game_handler.handle_skip_turn(websocket, data)
 
+            case ClientMessageType.PREVIEW_MOVE:
+                assert message.data
+                data = client_data.PreviewMoveData.from_dict(message.data)
+                await self.game_handler.handle_preview_move(websocket, data)
+
+            case ClientMessageType.REQUEST_HINT:
+                assert message.data
+                data = client_data.RequestHintData.from_dict(message.data)
+                await self.game_handler.handle_request_hint(websocket, data)
+
             case ClientMessageType.REJOIN:
                 assert message.data
                 data = client_data.RejoinData.from_dict(message.data)
@@ -194,10 +269,13 @@ class GameServer:
 
 
 async def main():
+    workers = os.environ.get('SCRABBLE_ENGINE_WORKERS')
     config = ServerConfig(
         log_level='DEBUG',
         log_file='logs/server.log',
         enable_websocket_logging=False,
+        lexicon_path=os.environ.get('SCRABBLE_LEXICON'),
+        engine_workers=int(workers) if workers else None,
     )
 
     # Ensure log directory exists
@@ -6,6 +6,11 @@ from typing import overload
 from websockets import ServerConnection
 
 from core import tools
+from core.exceptions.engine import (
+    EngineCancelledError,
+    EngineError,
+    EngineOverloadedError,
+)
 from core.exceptions.game import (
     GameAlreadyStartedError,
     GameError,
@@ -62,6 +67,16 @@ def handle_exception[**P](
                 },
             )
             await _exception_handler(websocket, e)
+        except EngineError as e:
+            logger.warning(
+                msg=f'{EngineError.__name__!r} in {func.__name__!r}: {e.message!r}',
+                extra={
+                    'exception_type': type(e).__name__,
+                    'details': e.details,
+                    'handler': func.__name__,
+                },
+            )
+            await _exception_handler(websocket, e)
         except Exception as e:
             logger.error(
                 msg=f'Unexpected error in {func.__name__!r}: {e}',
@@ -77,7 +92,7 @@ def handle_exception[**P](
 
 
 async def _exception_handler(websocket: ServerConnection, exception: Exception) -> None:
-    error_data = _get_error_data(exception)
+    error_data = get_error_data(exception)
 
     await send_error(
         websocket,
@@ -87,7 +102,7 @@ async def _exception_handler(websocket: ServerConnection, exception: Exception)
     )
 
 
-def _get_error_data(exception: Exception) -> ErrorData:
+def get_error_data(exception: Exception) -> ErrorData:
     match exception:
         case GameError():
             return ErrorData(
@@ -103,6 +118,13 @@ def _get_error_data(exception: Exception) -> ErrorData:
                 details=exception.details,
             )
 
+        case EngineError():
+            return ErrorData(
+                code=_get_error_code(exception),
+                message=exception.message,
+                details=exception.details,
+            )
+
         case _:
             return ErrorData(
                 code=ErrorCode.INTERNAL_ERROR,
@@ -119,7 +141,11 @@ def _get_error_code(exception: GameError) -> ErrorCode: ...
 def _get_error_code(exception: ServerError) -> ErrorCode: ...
 
 
-def _get_error_code(exception: GameError | ServerError) -> ErrorCode:
+@overload
+def _get_error_code(exception: EngineError) -> ErrorCode: ...
+
+
+def _get_error_code(exception: GameError | ServerError | EngineError) -> ErrorCode:
     match exception:
         # --- GameError ---
         case GameStartFailureError():
@@ -166,3 +192,11 @@ def _get_error_code(exception: GameError | ServerError) -> ErrorCode:
             raise RuntimeError(
                 f'Unhandled {ServerError.__name__!r} type: {type(exception).__name__!r}'
             )
+
+        # --- EngineError ---
+        case EngineOverloadedError():
+            return ErrorCode.ENGINE_OVERLOADED
+        case EngineCancelledError():
+            return ErrorCode.ENGINE_CANCELLED
+        case EngineError():
+            return ErrorCode.ENGINE_ERROR
@@ -1,24 +1,110 @@
+import asyncio
 import logging
+import time
 
 from websockets import ServerConnection
 
+from core.engine import EngineService
+from core.exceptions.engine import EngineError
+from core.exceptions.game import GameError, InvalidMoveError, InvalidOperationError
+from core.game.computer_player import SEARCH_SHARE, ComputerPlayer
+from core.game.evaluation import MoveEvaluation
+from core.game.objects.player import Player
+from core.game.objects.tile import Tile
+from core.game.position import encode_position
 from core.game.scrabble_game import GameConfig, ScrabbleGame
+from core.game.types import Position
+from core.lexicon.graph import Dawg
 from core.protocol import client_data, server_data
-from core.protocol.data_types import BoardData, PlayerData
+from core.protocol.data_types import (
+    BoardData,
+    PlayerData,
+    SuggestedMoveData,
+    TileData,
+    WordScoreData,
+)
 from core.protocol.message_types import ServerMessageType
 from server.communication import send_to_player
-from server.exception_handler import handle_exception
+from server.exception_handler import get_error_data, handle_exception
 from server.exceptions import (
     NoActiveConnectionError,
     NoActiveGameError,
     PlayerNotInRoomError,
 )
-from server.room_manager import RoomManager
+from server.room_manager import Room, RoomManager
+
+# seconds a hint search may take, the best moves found by then are sent
+HINT_TIME_BUDGET = 1.0
+MAX_HINT_MOVES = 10
+
+# computer turns stop after this many rounds of scoreless turns in a row, e.g. when
+# no player can place a word and the bag is empty, a human player would end them
+MAX_SCORELESS_ROUNDS = 2
+
+# seconds a computer player's search may wait for a worker on top of its budget, which
+# starts only in the worker, before the player gives up and exchanges its tiles
+SEARCH_TIMEOUT_MARGIN = 0.5
+
+
+def _get_move_tiles(
+    player: Player, tiles_data: list[TileData]
+) -> tuple[list[tuple[Tile, Position]], list[tuple[Tile, str]]]:
+    """Looks up tiles of a move in the player's rack, once per tile.
+
+    Returns:
+        tuple: Tiles with their positions and blank tiles with their chosen symbols.
+
+    Raises:
+        InvalidOperationError: If some tiles are not on the rack, e.g. sent before
+            the rack changed.
+        InvalidMoveError: If a tile has no position.
+    """
+    tile_positions: list[tuple[Tile, Position]] = []
+    blank_symbols: list[tuple[Tile, str]] = []
+
+    if missing := [
+        tile_data.id
+        for tile_data in tiles_data
+        if player.try_get_tile_by_id(tile_data.id) is None
+    ]:
+        raise InvalidOperationError(
+            message='Tiles do not belong to player.', details={'tile_ids': missing}
+        )
+
+    for tile_data in tiles_data:
+        tile = player.get_tile_by_id(tile_data.id)
+
+        if tile_data.position is None:
+            raise InvalidMoveError(
+                message='Tile must be given a position.',
+                details={'tile_id': tile_data.id},
+            )
+
+        tile_positions.append((tile, tile_data.position))
+
+        if tile.is_blank:
+            blank_symbols.append((tile, tile_data.symbol))
+
+    return tile_positions, blank_symbols
 
 
 class GameHandler:
-    def __init__(self, room_manager: RoomManager) -> None:
+    def __init__(
+        self,
+        room_manager: RoomManager,
+        *,
+        lexicon: Dawg | None = None,
+        engine: EngineService | None = None,
+    ) -> None:
         self.room_manager = room_manager
+        # shared by all games, the lexicon is memory-mapped and read-only
+        self.lexicon = lexicon
+        # searches for hints and computer players run in its worker processes, so
+        # that a long search in one room does not stall the event loop serving all
+        self.engine = engine
+        # running computer turns by room number, the event loop keeps only weak
+        # references to tasks
+        self._computer_tasks: dict[int, asyncio.Task[None]] = {}
 
     @handle_exception
     async def handle_start_game(
@@ -34,13 +120,17 @@ class GameHandler:
 
         logging.info(f'Starting game in room {room.number}...')
 
-        players = [user.player for user in room.get_users()]
-        room.game = ScrabbleGame(config=GameConfig.default(), players=players)
+        players = room.get_players()
+        room.game = ScrabbleGame(
+            config=GameConfig.default(), players=players, lexicon=self.lexicon
+        )
 
         room.game.start()
 
+        # the seed and the moves are enough to replay the game
         logging.info(
             f'Game started in room {room.number}, with {len(room.game.players)} players'
+            f' and seed {room.game.config.seed}'
         )
 
         for user in room.get_users():
@@ -48,13 +138,15 @@ class GameHandler:
                 user.websocket,
                 ServerMessageType.NEW_GAME,
                 server_data.NewGameData(
-                    player=PlayerData.from_player(user.player, with_tiles=True),
+                    player=PlayerData.from_player(user.player, room.game.alphabet),
                     current_player_id=room.game.current_player.id,
                     players=[PlayerData.from_player(p) for p in room.game.players],
-                    board=BoardData.from_board(room.game.board),
+                    board=BoardData.from_board(room.game.board, room.game.alphabet),
                 ),
             )
 
+        self._schedule_computer_turns(room)
+
     @handle_exception
     async def handle_place_tiles(
         self, websocket: ServerConnection, data: client_data.PlaceTilesData
@@ -76,34 +168,116 @@ class GameHandler:
             f'Player {user.player.name} is placing tiles in room {room.number}'
         )
 
-        tile_positions = [
-            (user.player.get_tile_by_id(tile_data.id), tile_data.position)
-            for tile_data in data.tiles_data
-        ]
-
-        assert all(position for tile, position in tile_positions)
+        tile_positions, blank_symbols = _get_move_tiles(user.player, data.tiles_data)
 
         room.game.place_tiles(
             player=user.player,
-            tile_positions=tile_positions,  # type: ignore[asignment]
-            blank_symbols=[
-                (tile, tile_data.symbol)
-                for tile_data in data.tiles_data
-                if (tile := user.player.get_tile_by_id(tile_data.id)).is_blank
-            ],
+            tile_positions=tile_positions,
+            blank_symbols=blank_symbols,
         )
 
-        for user in room.get_users():
-            await send_to_player(
-                user.websocket,
-                ServerMessageType.NEXT_TURN,
-                server_data.NextTurnData(
-                    player=PlayerData.from_player(user.player, with_tiles=True),
-                    current_player_id=room.game.current_player.id,
-                    players=[PlayerData.from_player(p) for p in room.game.players],
-                    board=BoardData.from_board(room.game.board),
-                ),
+        await self._broadcast_next_turn(room)
+        self._schedule_computer_turns(room)
+
+    @handle_exception
+    async def handle_preview_move(
+        self, websocket: ServerConnection, data: client_data.PreviewMoveData
+    ):
+        room = self.room_manager.find_room(data.session_id)
+
+        if room is None:
+            raise NoActiveConnectionError()
+
+        if room.game is None:
+            raise NoActiveGameError(room_number=room.number)
+
+        user = room.find_user(data.session_id)
+
+        if user is None:
+            raise PlayerNotInRoomError(room_number=room.number)
+
+        # tiles are dropped one by one, a preview sent before the rack changed or of
+        # an unfinished move is answered as invalid, not as a failed request
+        try:
+            tile_positions, blank_symbols = _get_move_tiles(
+                user.player, data.tiles_data
             )
+        except GameError as e:
+            preview = MoveEvaluation(error=e)
+        else:
+            preview = room.game.preview_move(
+                player=user.player,
+                tile_positions=tile_positions,
+                blank_symbols=blank_symbols,
+            )
+
+        # preview does not change the game, so only the requesting player is answered
+        await send_to_player(
+            websocket,
+            ServerMessageType.MOVE_PREVIEW,
+            server_data.MovePreviewData(
+                is_valid=preview.is_valid,
+                words=[
+                    WordScoreData.from_word_score(word, room.game.alphabet)
+                    for word in preview.words
+                ],
+                bingo=preview.bingo,
+                score=preview.score,
+                error=get_error_data(preview.error) if preview.error else None,
+            ),
+        )
+
+    @handle_exception
+    async def handle_request_hint(
+        self, websocket: ServerConnection, data: client_data.RequestHintData
+    ):
+        room = self.room_manager.find_room(data.session_id)
+
+        if room is None:
+            raise NoActiveConnectionError()
+
+        if room.game is None:
+            raise NoActiveGameError(room_number=room.number)
+
+        user = room.find_user(data.session_id)
+
+        if user is None:
+            raise PlayerNotInRoomError(room_number=room.number)
+
+        if self.engine is None:
+            raise InvalidOperationError('Hints are not available without a lexicon.')
+
+        game = room.game
+        count = max(1, min(data.count, MAX_HINT_MOVES))
+
+        # the board and rack are captured here, the search runs in another process
+        key = game.get_hint_key(user.player)
+        rack = user.player.tiles
+
+        if (generated := game.get_cached_hints(key)) is None:
+            position = encode_position(game.board, user.player.letter_counts)
+            start = time.monotonic()
+            generated = await self.engine.search(
+                room.number, position, MAX_HINT_MOVES, time_budget=HINT_TIME_BUDGET
+            )
+
+            # a search cut short by its budget may have missed better moves
+            if time.monotonic() - start < HINT_TIME_BUDGET * SEARCH_SHARE:
+                game.cache_hints(key, generated)
+
+        moves = [game.get_suggested_move(move, rack) for move in generated[:count]]
+
+        # hints do not change the game, so only the requesting player is answered
+        await send_to_player(
+            websocket,
+            ServerMessageType.HINT,
+            server_data.HintData(
+                moves=[
+                    SuggestedMoveData.from_suggested_move(move, game.alphabet)
+                    for move in moves
+                ],
+            ),
+        )
 
     @handle_exception
     async def handle_exchange_tiles(
@@ -134,17 +308,8 @@ class GameHandler:
             ],
         )
 
-        for user in room.get_users():
-            await send_to_player(
-                user.websocket,
-                ServerMessageType.NEXT_TURN,
-                server_data.NextTurnData(
-                    player=PlayerData.from_player(user.player, with_tiles=True),
-                    current_player_id=room.game.current_player.id,
-                    players=[PlayerData.from_player(p) for p in room.game.players],
-                    board=BoardData.from_board(room.game.board),
-                ),
-            )
+        await self._broadcast_next_turn(room)
+        self._schedule_computer_turns(room)
 
     @handle_exception
     async def handle_skip_turn(
@@ -169,18 +334,116 @@ class GameHandler:
 
         room.game.skip_turn(player=user.player)
 
+        await self._broadcast_next_turn(room)
+        self._schedule_computer_turns(room)
+
+    async def _broadcast_next_turn(self, room: Room) -> None:
+        assert room.game
+
         for user in room.get_users():
             await send_to_player(
                 user.websocket,
                 ServerMessageType.NEXT_TURN,
                 server_data.NextTurnData(
-                    player=PlayerData.from_player(user.player, with_tiles=True),
+                    player=PlayerData.from_player(user.player, room.game.alphabet),
                     current_player_id=room.game.current_player.id,
                     players=[PlayerData.from_player(p) for p in room.game.players],
-                    board=BoardData.from_board(room.game.board),
+                    board=BoardData.from_board(room.game.board, room.game.alphabet),
                 ),
             )
 
+    def _schedule_computer_turns(self, room: Room) -> None:
+        """Plays turns of computer players in the background until a human player is
+        on turn, the handler which ended the last turn does not wait for them.
+        """
+        if (
+            room.game is None
+            or self.engine is None
+            or not isinstance(room.game.current_player, ComputerPlayer)
+        ):
+            return
+
+        if (task := self._computer_tasks.get(room.number)) and not task.done():
+            return
+
+        task = asyncio.create_task(self._play_computer_turns(room))
+        self._computer_tasks[room.number] = task
+
+        def forget(task: asyncio.Task[None]) -> None:
+            if self._computer_tasks.get(room.number) is task:
+                del self._computer_tasks[room.number]
+
+        task.add_done_callback(forget)
+
+    async def _play_computer_turns(self, room: Room) -> None:
+        game = room.game
+        assert game
+        assert self.engine
+
+        scoreless_turns = 0
+
+        try:
+            while room.game is game and isinstance(
+                player := game.current_player, ComputerPlayer
+            ):
+                # the search runs in another process, the move is made back here
+                try:
+                    game.before_turn(player)
+                    try:
+                        async with asyncio.timeout(
+                            player.time_budget + SEARCH_TIMEOUT_MARGIN
+                        ):
+                            moves = await self.engine.search(
+                                room.number,
+                                encode_position(game.board, player.letter_counts),
+                                1,
+                                strength=player.strength,
+                                time_budget=player.time_budget,
+                                seed=player.draw_seed(),
+                            )
+                    except TimeoutError:
+                        logging.warning(
+                            f'Search of computer player {player.name} in room'
+                            f' {room.number} timed out, all workers are busy'
+                        )
+                        moves = []
+
+                    turn = player.get_turn(game, moves[0] if moves else None)
+                    player.apply_turn(game, turn)
+                except (GameError, EngineError) as e:
+                    logging.warning(
+                        f'Computer player {player.name} skips in room {room.number}:'
+                        f' {e.message}'
+                    )
+                    game.skip_turn(player)
+                else:
+                    logging.info(
+                        f'Computer player {player.name} made {turn.type.name} '
+                        f'in room {room.number}'
+                    )
+
+                await self._broadcast_next_turn(room)
+
+                scoreless_turns = scoreless_turns + 1 if not player.scores[-1] else 0
+                if scoreless_turns >= MAX_SCORELESS_ROUNDS * len(game.players):
+                    logging.info(
+                        f'Computer turns in room {room.number} stopped, no player'
+                        f' has scored for {MAX_SCORELESS_ROUNDS} rounds'
+                    )
+                    break
+        except Exception:
+            logging.exception(f'Computer turns in room {room.number} stopped')
+
+    def close_room(self, room_number: int) -> None:
+        """Closes the room, stopping its computer turns and dropping its searches."""
+        self.room_manager.close_room(room_number)
+
+        if task := self._computer_tasks.pop(room_number, None):
+            task.cancel()
+
+        if self.engine is not None:
+            self.engine.cancel(room_number)
+
     @handle_exception
     async def handle_game_rejoin(
         self, websocket: ServerConnection, data: client_data.RejoinData
@@ -203,10 +466,10 @@ class GameHandler:
                 user.websocket,
                 ServerMessageType.REJOIN_GAME,
                 server_data.RejoinGameData(
-                    player=PlayerData.from_player(user.player, with_tiles=True),
+                    player=PlayerData.from_player(user.player, room.game.alphabet),
                     current_player_id=room.game.current_player.id,
                     players=[PlayerData.from_player(p) for p in room.game.players],
-                    board=BoardData.from_board(room.game.board),
+                    board=BoardData.from_board(room.game.board, room.game.alphabet),
                     session_id=data.session_id,
                 ),
             )
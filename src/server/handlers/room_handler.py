@@ -1,22 +1,37 @@
+import asyncio
+import itertools
 import logging
 import uuid
 
 from websockets import ServerConnection
+from websockets.protocol import State
 
+from core.exceptions.game import InvalidOperationError
+from core.game.computer_player import ComputerPlayer
 from core.game.objects.player import Player
 from core.protocol import client_data, server_data
 from core.protocol.data_types import PlayerData
 from core.protocol.message_types import ServerMessageType
 from server.communication import broadcast_to_players, send_to_player
 from server.exception_handler import handle_exception
+from server.exceptions import NoActiveConnectionError
 from server.handlers.game_handler import GameHandler
-from server.room_manager import RoomManager, User
+from server.room_manager import Room, RoomManager, User
+
+# seconds a room is kept after its last player disconnected, so they can rejoin
+ROOM_CLOSE_DELAY = 60.0
+
+
+def _is_abandoned(room: Room) -> bool:
+    return all(user.websocket.state is not State.OPEN for user in room.get_users())
 
 
 class RoomHandler:
     def __init__(self, room_manager: RoomManager, game_handler: GameHandler) -> None:
         self.room_manager = room_manager
         self.game_handler = game_handler
+        # rooms without connected players, closed unless someone rejoins in time
+        self._close_tasks: dict[int, asyncio.Task[None]] = {}
 
     def _join_room(
         self, websocket: ServerConnection, data: client_data.JoinRoomData
@@ -97,6 +112,47 @@ class RoomHandler:
             players_to_skip=[user.player],
         )
 
+    @handle_exception
+    async def handle_add_computer_player(
+        self, websocket: ServerConnection, data: client_data.AddComputerPlayerData
+    ) -> None:
+        room = self.room_manager.find_room(data.session_id)
+
+        if room is None:
+            raise NoActiveConnectionError()
+
+        if room.game is not None:
+            raise InvalidOperationError(
+                'Computer players cannot join a game which has already started.'
+            )
+
+        if self.game_handler.engine is None:
+            raise InvalidOperationError(
+                'Computer players cannot play without a lexicon.'
+            )
+
+        # the first number whose name no player in the room has taken
+        names = {player.name for player in room.get_players()}
+        number = next(n for n in itertools.count(1) if f'Computer {n}' not in names)
+
+        player = ComputerPlayer(
+            name=f'Computer {number}',
+            id=str(uuid.uuid4()),
+            strength=data.strength,
+        )
+        room.add_computer_player(player)
+
+        logging.info(
+            f'Computer player {player.name} ({player.strength.name.lower()}) '
+            f'joined room {room.number}'
+        )
+
+        await broadcast_to_players(
+            room,
+            ServerMessageType.NEW_PLAYER,
+            server_data.NewPlayerData(player=PlayerData.from_player(player)),
+        )
+
     @handle_exception
     async def handle_rejoin_room(
         self, websocket: ServerConnection, data: client_data.RejoinData
@@ -129,3 +185,37 @@ class RoomHandler:
                 ),
                 players_to_skip=[user.player],
             )
+
+    def handle_disconnect(self, websocket: ServerConnection) -> None:
+        """Schedules closing of the rooms the connection left without connected
+        players, they are closed after `ROOM_CLOSE_DELAY` unless a player rejoins.
+        """
+        for room in self.room_manager.get_rooms():
+            if not any(
+                user.websocket.id == websocket.id for user in room.get_users()
+            ) or not _is_abandoned(room):
+                continue
+
+            # the delay starts again with every disconnect
+            if task := self._close_tasks.get(room.number):
+                task.cancel()
+
+            task = asyncio.create_task(self._close_abandoned_room(room))
+            self._close_tasks[room.number] = task
+
+            def forget(task: asyncio.Task[None], number: int = room.number) -> None:
+                if self._close_tasks.get(number) is task:
+                    del self._close_tasks[number]
+
+            task.add_done_callback(forget)
+
+    async def _close_abandoned_room(self, room: Room) -> None:
+        await asyncio.sleep(ROOM_CLOSE_DELAY)
+
+        if self.room_manager.rooms_mapping.get(
+            room.number
+        ) is not room or not _is_abandoned(room):
+            return
+
+        logging.info(f'Closing room {room.number}, no player has rejoined')
+        self.game_handler.close_room(room.number)
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 
 from websockets.asyncio.server import ServerConnection
 
+from core.game.computer_player import ComputerPlayer
 from core.game.objects.player import Player
 from core.game.scrabble_game import ScrabbleGame
 from server.exceptions import (
@@ -28,6 +29,8 @@ class Room:
     def __init__(self, number: int) -> None:
         self.number = number
         self._users: list[User] = []
+        # seated without a connection, their turns are played by the server
+        self.computer_players: list[ComputerPlayer] = []
         self.game: ScrabbleGame | None = None
 
     def add(self, new_user: User):
@@ -46,18 +49,25 @@ class Room:
                         'room_number': self.number,
                     },
                 )
-            # different connection, same player name
-            elif user.player.name == new_user.player.name:
-                raise InvalidPlayerData(
-                    message=f'Player with name {new_user.player.name!r} already exists.',
-                    details={
-                        'player_name': new_user.player.name,
-                        'room_number': self.number,
-                    },
-                )
+
+        # names of users and computer players alike
+        self._verify_free_name(new_user.player.name)
 
         self._users.append(new_user)
 
+    def add_computer_player(self, player: ComputerPlayer) -> None:
+        self._verify_free_name(player.name)
+
+        self.computer_players.append(player)
+
+    def _verify_free_name(self, name: str) -> None:
+        for player in self.get_players():
+            if player.name == name:
+                raise InvalidPlayerData(
+                    message=f'Player with name {name!r} already exists.',
+                    details={'player_name': name, 'room_number': self.number},
+                )
+
     def update_user(self, session_id: str, websocket: ServerConnection):
         assert (user := self.find_user(session_id))
 
@@ -74,6 +84,10 @@ class Room:
         for player_client in self._users:
             yield player_client
 
+    def get_players(self) -> list[Player]:
+        """Returns players of all users followed by the computer players."""
+        return [user.player for user in self.get_users()] + self.computer_players
+
 
 class RoomManager:
     def __init__(self) -> None:
@@ -92,6 +106,12 @@ class RoomManager:
 
         return room
 
+    def close_room(self, room_number: int) -> Room:
+        try:
+            return self.rooms_mapping.pop(room_number)
+        except KeyError as e:
+            raise RoomNotFoundError(room_number=room_number) from e
+
     def join_room(
         self, room_number: int, websocket: ServerConnection, player: Player
     ) -> User:
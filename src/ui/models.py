@@ -72,7 +72,7 @@ class FieldModel(DataModel):
 
 
 class TileModel(DataModel):
-    id: str
+    id: int
     symbol: str
     points: int
     position: Position | None = None